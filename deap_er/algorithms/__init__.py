@@ -8,8 +8,19 @@
 #   
 #   SPDX-License-Identifier: MIT
 #
+from .ea_differential_evolution import *
 from .ea_generate_update import *
 from .ea_mu_comma_lambda import *
 from .ea_mu_plus_lambda import *
+from .ea_particle_swarm import *
 from .ea_simple import *
+from .ea_steady_state_async import *
+from .evaluation import *
+from .island_model import *
+from .pipeline import *
+from .profiling import *
+from .surrogate import *
+from .state import *
+from .swarm import *
+from .termination import *
 from .variation import *
@@ -0,0 +1,222 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.records.dtypes import *
+from deap_er.records import Logbook
+from deap_er.base import Toolbox, PopulationMatrix
+from typing import Iterator, Optional, Union
+from .evaluation import *
+from .evaluation import _not_worse
+from .state import GenerationState, _StateTracker, _next_gen, _gen_range, _header
+from .profiling import PhaseProfiler
+from .termination import Termination
+import numpy
+import math
+
+
+__all__ = ['ea_differential_evolution', 'iter_ea_differential_evolution']
+
+
+_STRATEGIES = ('rand/1/bin', 'best/1/bin', 'current-to-pbest/1/bin')
+
+
+# ====================================================================================== #
+def ea_differential_evolution(toolbox: Toolbox, population: Union[list, PopulationMatrix],
+                              generations: int, scale: float = 0.5,
+                              cx_prob: float = 0.9, strategy: str = 'rand/1/bin',
+                              p_best: float = 0.1, bounds: Optional[tuple] = None,
+                              hof: Hof = None, stats: Stats = None,
+                              terminate: Termination = None,
+                              verbose: bool = False,
+                              profiler: PhaseProfiler = None) -> AlgoResult:
+    """
+    A differential evolution algorithm, which computes the mutation, the binomial
+    crossover and the greedy replacement for the whole population at once with
+    NumPy array operations. This function expects the *'evaluate'* or the
+    *'evaluate_batch'* operator to be registered in the toolbox. The trial
+    vectors are evaluated as a :class:`PopulationMatrix`, so the evaluation
+    operators receive its row views or the container itself, which can be
+    converted into a 2-D array of genomes with :func:`numpy.asarray`.
+
+    The genomes must be sequences of numbers of equal length. The population
+    can be either a list of individuals or a :class:`PopulationMatrix`, which
+    avoids the conversion of the individuals at each generation and is updated
+    in place. Its rows are numpy arrays, so a HallOfFame must then be created
+    with :code:`similar=numpy.array_equal`. A list population is updated by
+    replacing the individuals, whose trial vector was not worse, with new
+    instances of their class. The invalid individuals of the population are
+    evaluated at the start of a generation. The random numbers are drawn
+    from the global :mod:`numpy.random` state, which is also persisted
+    by a :class:`Checkpoint`.
+
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param population: A list of individuals or a PopulationMatrix to evolve.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
+    :param scale: The differential weight *F*, optional. The default value is 0.5.
+    :param cx_prob: The crossover probability *CR*, optional. The default value is 0.9.
+    :param strategy: The mutation strategy, one of *'rand/1/bin'*, *'best/1/bin'*
+        or *'current-to-pbest/1/bin'*, optional. The default value is *'rand/1/bin'*.
+    :param p_best: The fraction of the best individuals, which are the
+        targets of the *'current-to-pbest/1/bin'* strategy, optional.
+        The default value is 0.1.
+    :param bounds: A *(low, up)* tuple of numbers or sequences, which the trial
+        vectors are clipped into, optional. By default, they are not clipped.
+    :param hof: A HallOfFame or a ParetoFront object, optional.
+    :param stats: A Statistics or a MultiStatistics object, optional.
+    :param terminate: A termination criterion, optional.
+    :param verbose: Whether to print debug messages, optional.
+    :param profiler: A PhaseProfiler, which records the durations
+        of the phases of each generation into the logbook, optional.
+    :return: The final population and the logbook.
+
+    :type hof: :ref:`Hof <datatypes>`
+    :type stats: :ref:`Stats <datatypes>`
+    :rtype: :ref:`AlgoResult <datatypes>`
+    """
+    logbook = Logbook()
+    for _ in iter_ea_differential_evolution(toolbox, population, generations,
+                                            scale, cx_prob, strategy, p_best,
+                                            bounds, hof, stats, terminate,
+                                            logbook, verbose, profiler):
+        pass
+    return population, logbook
+
+
+# -------------------------------------------------------------------------------------- #
+def iter_ea_differential_evolution(toolbox: Toolbox, population: Union[list, PopulationMatrix],
+                                   generations: int, scale: float = 0.5,
+                                   cx_prob: float = 0.9, strategy: str = 'rand/1/bin',
+                                   p_best: float = 0.1, bounds: Optional[tuple] = None,
+                                   hof: Hof = None, stats: Stats = None,
+                                   terminate: Termination = None,
+                                   logbook: Logbook = None,
+                                   verbose: bool = False,
+                                   profiler: PhaseProfiler = None) -> Iterator[GenerationState]:
+    """
+    The iterator version of the :func:`ea_differential_evolution` algorithm,
+    which yields a :class:`GenerationState` after each computed generation.
+    The iteration can be stopped at any time and resumed later by passing
+    the restored objects into a new iterator. The generation numbering
+    then continues from the last entry of the **logbook**.
+
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param population: A list of individuals or a PopulationMatrix to evolve.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
+    :param scale: The differential weight *F*, optional. The default value is 0.5.
+    :param cx_prob: The crossover probability *CR*, optional. The default value is 0.9.
+    :param strategy: The mutation strategy, one of *'rand/1/bin'*, *'best/1/bin'*
+        or *'current-to-pbest/1/bin'*, optional. The default value is *'rand/1/bin'*.
+    :param p_best: The fraction of the best individuals, which are the
+        targets of the *'current-to-pbest/1/bin'* strategy, optional.
+        The default value is 0.1.
+    :param bounds: A *(low, up)* tuple of numbers or sequences, which the trial
+        vectors are clipped into, optional. By default, they are not clipped.
+    :param hof: A HallOfFame or a ParetoFront object, optional.
+    :param stats: A Statistics or a MultiStatistics object, optional.
+    :param terminate: A termination criterion, optional.
+    :param logbook: A Logbook to continue recording into, optional.
+    :param verbose: Whether to print debug messages, optional.
+    :param profiler: A PhaseProfiler, which records the durations
+        of the phases of each generation into the logbook, optional.
+    :return: An iterator of the generation states.
+
+    :type hof: :ref:`Hof <datatypes>`
+    :type stats: :ref:`Stats <datatypes>`
+    """
+    if strategy not in _STRATEGIES:
+        options = ', '.join(f"'{opt}'" for opt in _STRATEGIES)
+        raise ValueError(f"The strategy must be one of {options}, not '{strategy}'.")
+    if len(population) < 4:
+        raise ValueError("Differential evolution requires at least 4 individuals.")
+    if logbook is None:
+        logbook = Logbook()
+    if not logbook.header:
+        logbook.header = _header(stats, profiler, terminate)
+
+    tracker = _StateTracker(logbook, terminate, profiler)
+    first_gen = _next_gen(logbook, 1)
+
+    for gen in _gen_range(first_gen, generations, terminate):
+        with tracker.phase('evaluate'):
+            nevals = evaluate_invalids(toolbox, population)
+
+        if isinstance(population, PopulationMatrix):
+            matrix = population
+        else:
+            matrix = PopulationMatrix.from_individuals(population)
+
+        with tracker.phase('vary'):
+            genomes = matrix.genomes.astype(float, copy=False)
+            size, dims = genomes.shape
+            if strategy == 'rand/1/bin':
+                r1, r2, r3 = _distinct_indices(size, 3).T
+                donors = genomes[r1] + scale * (genomes[r2] - genomes[r3])
+            elif strategy == 'best/1/bin':
+                r1, r2 = _distinct_indices(size, 2).T
+                best = genomes[matrix.rank()[0]]
+                donors = best + scale * (genomes[r1] - genomes[r2])
+            else:
+                r1, r2 = _distinct_indices(size, 2).T
+                top = matrix.rank()[:max(math.ceil(size * p_best), 1)]
+                pbest = genomes[top[numpy.random.randint(0, len(top), size)]]
+                donors = genomes + scale * (pbest - genomes) + scale * (genomes[r1] - genomes[r2])
+
+            cross = numpy.random.random((size, dims)) < cx_prob
+            cross[numpy.arange(size), numpy.random.randint(0, dims, size)] = True
+            trials = numpy.where(cross, donors, genomes)
+            if bounds is not None:
+                trials = numpy.clip(trials, *bounds)
+            trials = PopulationMatrix(trials.astype(matrix.genomes.dtype), matrix.weights)
+
+        with tracker.phase('evaluate'):
+            nevals += evaluate_invalids(toolbox, trials)
+
+        with tracker.phase('select'):
+            replace = numpy.flatnonzero(_not_worse(trials.wvalues, matrix.wvalues))
+            if matrix is population:
+                population.genomes[replace] = trials.genomes[replace]
+                population.wvalues[replace] = trials.wvalues[replace]
+            else:
+                for index in replace:
+                    ind = population[index].__class__(trials.genomes[index].tolist())
+                    ind.fitness.wvalues = tuple(trials.wvalues[index].tolist())
+                    population[index] = ind
+
+        with tracker.phase('hof'):
+            if hof is not None:
+                hof.update(population)
+        with tracker.phase('stats'):
+            record = stats.compile(population) if stats else {}
+        state = tracker.record(gen, population, nevals, record)
+        if verbose:
+            print(logbook.stream)
+
+        yield state
+        if state.stop:
+            return
+
+
+# -------------------------------------------------------------------------------------- #
+def _distinct_indices(size: int, count: int) -> numpy.ndarray:
+    rows = numpy.arange(size)
+    indices = numpy.empty((size, count), dtype=numpy.intp)
+    for k in range(count):
+        column = numpy.random.randint(0, size, size)
+        while True:
+            clash = column == rows
+            for j in range(k):
+                clash |= column == indices[:, j]
+            if not clash.any():
+                break
+            column[clash] = numpy.random.randint(0, size, clash.sum())
+        indices[:, k] = column
+    return indices
@@ -11,24 +11,37 @@
 from deap_er.records.dtypes import *
 from deap_er.records import Logbook
 from deap_er.base import Toolbox
+from typing import Iterator
+from .evaluation import *
+from .state import GenerationState, _StateTracker, _next_gen, _gen_range, _header
+from .profiling import PhaseProfiler
+from .termination import Termination
 
 
-__all__ = ['ea_generate_update']
+__all__ = ['ea_generate_update', 'iter_ea_generate_update']
 
 
 # ====================================================================================== #
 def ea_generate_update(toolbox: Toolbox, generations: int,
                        hof: Hof = None, stats: Stats = None,
-                       verbose: bool = False) -> AlgoResult:
+                       verbose: bool = False, *,
+                       terminate: Termination = None,
+                       profiler: PhaseProfiler = None) -> AlgoResult:
     """
     An evolutionary algorithm. This function expects the *'generate'*,
     *'update'*, and *'evaluate'* operators to be registered in the toolbox.
+    If the *'evaluate_batch'* operator is registered in the toolbox,
+    it is used instead of the *'evaluate'* operator.
 
     :param toolbox: A Toolbox which contains the evolution operators.
-    :param generations: The number of generations to compute.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
     :param hof: A HallOfFame or a ParetoFront object, optional.
     :param stats: A Statistics or a MultiStatistics object, optional.
     :param verbose: Whether to print debug messages, optional.
+    :param terminate: A termination criterion, optional.
+    :param profiler: A PhaseProfiler, which records the durations
+        of the phases of each generation into the logbook, optional.
     :return: The final population and the logbook.
 
     :type hof: :ref:`Hof <datatypes>`
@@ -36,23 +49,70 @@ def ea_generate_update(toolbox: Toolbox, generations: int,
     :rtype: :ref:`AlgoResult <datatypes>`
     """
     logbook = Logbook()
-    logbook.header = ['gen', 'nevals'] + (stats.fields if stats else [])
-
     population = None
-    for gen in range(generations):
-        population = toolbox.generate()
+    for state in iter_ea_generate_update(toolbox, generations, hof, stats, verbose,
+                                         terminate=terminate, logbook=logbook,
+                                         profiler=profiler):
+        population = state.population
+    return population, logbook
 
-        fitness = toolbox.map(toolbox.evaluate, population)
-        for ind, fit in zip(population, fitness):
-            ind.fitness.values = fit
 
-        toolbox.update(population)
+# -------------------------------------------------------------------------------------- #
+def iter_ea_generate_update(toolbox: Toolbox, generations: int,
+                            hof: Hof = None, stats: Stats = None,
+                            verbose: bool = False, *,
+                            terminate: Termination = None,
+                            logbook: Logbook = None,
+                            profiler: PhaseProfiler = None) -> Iterator[GenerationState]:
+    """
+    The iterator version of the :func:`ea_generate_update` algorithm, which yields
+    a :class:`GenerationState` after each computed generation. The iteration can
+    be stopped at any time and resumed later by passing the restored objects
+    into a new iterator. The generation numbering then continues from the
+    last entry of the **logbook**.
 
-        if hof is not None:
-            hof.update(population)
-        record = stats.compile(population) if stats else {}
-        logbook.record(gen=gen, nevals=len(population), **record)
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
+    :param hof: A HallOfFame or a ParetoFront object, optional.
+    :param stats: A Statistics or a MultiStatistics object, optional.
+    :param verbose: Whether to print debug messages, optional.
+    :param terminate: A termination criterion, optional.
+    :param logbook: A Logbook to continue recording into, optional.
+    :param profiler: A PhaseProfiler, which records the durations
+        of the phases of each generation into the logbook, optional.
+    :return: An iterator of the generation states.
+
+    :type hof: :ref:`Hof <datatypes>`
+    :type stats: :ref:`Stats <datatypes>`
+    """
+    if logbook is None:
+        logbook = Logbook()
+    if not logbook.header:
+        logbook.header = _header(stats, profiler, terminate)
+
+    tracker = _StateTracker(logbook, terminate, profiler)
+    first_gen = _next_gen(logbook, 0)
+
+    for gen in _gen_range(first_gen, generations, terminate):
+        with tracker.phase('generate'):
+            population = toolbox.generate()
+
+        with tracker.phase('evaluate'):
+            nevals = evaluate_invalids(toolbox, population)
+
+        with tracker.phase('update'):
+            toolbox.update(population)
+
+        with tracker.phase('hof'):
+            if hof is not None:
+                hof.update(population)
+        with tracker.phase('stats'):
+            record = stats.compile(population) if stats else {}
+        state = tracker.record(gen, population, nevals, record)
         if verbose:
             print(logbook.stream)
 
-    return population, logbook
+        yield state
+        if state.stop:
+            return
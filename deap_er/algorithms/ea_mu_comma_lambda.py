@@ -11,10 +11,17 @@
 from deap_er.records.dtypes import *
 from deap_er.records import Logbook
 from deap_er.base import Toolbox
+from typing import Iterator, Optional
+from .evaluation import *
+from .evaluation import _check_dedup, _var_or_distinct
 from .variation import *
+from .state import GenerationState, _StateTracker, _next_gen, _gen_range, _header
+from .profiling import PhaseProfiler
+from .pipeline import Pipeline
+from .termination import Termination
 
 
-__all__ = ['ea_mu_comma_lambda']
+__all__ = ['ea_mu_comma_lambda', 'iter_ea_mu_comma_lambda']
 
 
 # ====================================================================================== #
@@ -22,15 +29,27 @@ def ea_mu_comma_lambda(toolbox: Toolbox, population: list,
                        generations: int, offsprings: int,
                        survivors: int, cx_prob: float,
                        mut_prob: float, hof: Hof = None,
-                       stats: Stats = None, verbose: bool = False) -> AlgoResult:
+                       stats: Stats = None, verbose: bool = False, *,
+                       terminate: Termination = None,
+                       profiler: PhaseProfiler = None,
+                       dedup: Optional[str] = None,
+                       pipeline: Pipeline = None) -> AlgoResult:
     """
     An evolutionary algorithm. This function expects the *'mate'*, *'mutate'*,
     *'select'* and *'evaluate'* operators to be registered in the toolbox.
+    If the *'evaluate_batch'* operator is registered in the toolbox,
+    it is used instead of the *'evaluate'* operator.
+    If the *'screen'* operator is registered in the toolbox, e.g. a
+    :class:`Surrogate`, it is called with the offspring and the *'minimum'*
+    keyword argument, which is set to the number of survivors, before their
+    evaluation and only the offspring it returns are evaluated. The operator
+    should return at least *'minimum'* offspring, if enough are available.
     The survivors are selected only from the offspring population.
 
     :param toolbox: A Toolbox which contains the evolution operators.
     :param population: A list of individuals to evolve.
-    :param generations: The number of generations to compute.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
     :param offsprings: The number of individuals to produce at each generation.
     :param survivors: The number of individuals to select from the offspring.
     :param cx_prob: The probability of mating two individuals.
@@ -38,33 +57,129 @@ def ea_mu_comma_lambda(toolbox: Toolbox, population: list,
     :param hof: A HallOfFame or a ParetoFront object, optional.
     :param stats: A Statistics or a MultiStatistics object, optional.
     :param verbose: Whether to print debug messages, optional.
+    :param terminate: A termination criterion, optional.
+    :param profiler: A PhaseProfiler, which records the durations
+        of the phases of each generation into the logbook, optional.
+    :param dedup: If *'evaluate'*, each distinct genome of the offspring is
+        evaluated only once. If *'remove'*, the offspring with duplicate genomes
+        are also removed before the evaluation and more offspring are produced,
+        until at least **survivors** distinct offspring are available, optional.
+        By default, the offspring are evaluated without de-duplication.
+    :param pipeline: A Pipeline, which overlaps the evaluation of the offspring
+        with the production of the next generation, optional. By default, all
+        the offspring are evaluated before the selection. The pipeline
+        can't be combined with the *'evaluate'* de-duplication.
     :return: The final population and the logbook.
 
     :type hof: :ref:`Hof <datatypes>`
     :type stats: :ref:`Stats <datatypes>`
     :rtype: :ref:`AlgoResult <datatypes>`
     """
+    logbook = Logbook()
+    for _ in iter_ea_mu_comma_lambda(toolbox, population, generations,
+                                     offsprings, survivors, cx_prob, mut_prob,
+                                     hof, stats, verbose, terminate=terminate,
+                                     logbook=logbook, profiler=profiler,
+                                     dedup=dedup, pipeline=pipeline):
+        pass
+    return population, logbook
+
+
+# -------------------------------------------------------------------------------------- #
+def iter_ea_mu_comma_lambda(toolbox: Toolbox, population: list,
+                            generations: int, offsprings: int,
+                            survivors: int, cx_prob: float,
+                            mut_prob: float, hof: Hof = None,
+                            stats: Stats = None, verbose: bool = False, *,
+                            terminate: Termination = None,
+                            logbook: Logbook = None,
+                            profiler: PhaseProfiler = None,
+                            dedup: Optional[str] = None,
+                            pipeline: Pipeline = None) -> Iterator[GenerationState]:
+    """
+    The iterator version of the :func:`ea_mu_comma_lambda` algorithm, which yields
+    a :class:`GenerationState` after each computed generation. The iteration can
+    be stopped at any time and resumed later by passing the restored objects
+    into a new iterator. The generation numbering then continues from the
+    last entry of the **logbook**.
+
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param population: A list of individuals to evolve.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
+    :param offsprings: The number of individuals to produce at each generation.
+    :param survivors: The number of individuals to select from the offspring.
+    :param cx_prob: The probability of mating two individuals.
+    :param mut_prob: The probability of mutating an individual.
+    :param hof: A HallOfFame or a ParetoFront object, optional.
+    :param stats: A Statistics or a MultiStatistics object, optional.
+    :param verbose: Whether to print debug messages, optional.
+    :param terminate: A termination criterion, optional.
+    :param logbook: A Logbook to continue recording into, optional.
+    :param profiler: A PhaseProfiler, which records the durations
+        of the phases of each generation into the logbook, optional.
+    :param dedup: If *'evaluate'*, each distinct genome of the offspring is
+        evaluated only once. If *'remove'*, the offspring with duplicate genomes
+        are also removed before the evaluation and more offspring are produced,
+        until at least **survivors** distinct offspring are available, optional.
+        By default, the offspring are evaluated without de-duplication.
+    :param pipeline: A Pipeline, which overlaps the evaluation of the offspring
+        with the production of the next generation, optional. By default, all
+        the offspring are evaluated before the selection. The pipeline
+        can't be combined with the *'evaluate'* de-duplication.
+    :return: An iterator of the generation states.
+
+    :type hof: :ref:`Hof <datatypes>`
+    :type stats: :ref:`Stats <datatypes>`
+    """
     if survivors > offsprings:  # pragma: no cover
         offsprings, survivors = survivors, offsprings
 
-    logbook = Logbook()
-    logbook.header = ['gen', 'nevals'] + (stats.fields if stats else [])
+    _check_dedup(dedup, ('evaluate', 'remove'))
+    if pipeline is not None and dedup == 'evaluate':
+        raise ValueError("The pipeline can't be combined with the 'evaluate' de-duplication.")
+    if logbook is None:
+        logbook = Logbook()
+    if not logbook.header:
+        logbook.header = _header(stats, profiler, terminate)
 
-    for gen in range(1, generations + 1):
-        offspring = var_or(toolbox, population, offsprings, cx_prob, mut_prob)
+    tracker = _StateTracker(logbook, terminate, profiler)
+    first_gen = _next_gen(logbook, 1)
 
-        invalids = [ind for ind in offspring if not ind.fitness.is_valid()]
-        fitness = toolbox.map(toolbox.evaluate, invalids)
-        for ind, fit in zip(invalids, fitness):
-            ind.fitness.values = fit
+    try:
+        for gen in _gen_range(first_gen, generations, terminate):
+            with tracker.phase('vary'):
+                if dedup == 'remove':
+                    offspring = _var_or_distinct(toolbox, population, offsprings,
+                                                 cx_prob, mut_prob, survivors)
+                else:
+                    offspring = var_or(toolbox, population, offsprings, cx_prob, mut_prob)
 
-        population[:] = toolbox.select(offspring, survivors)
+            if hasattr(toolbox, 'screen'):
+                with tracker.phase('screen'):
+                    offspring = toolbox.screen(offspring, minimum=survivors)
 
-        if hof is not None:
-            hof.update(offspring)
-        record = stats.compile(population) if stats else {}
-        logbook.record(gen=gen, nevals=len(invalids), **record)
-        if verbose:
-            print(logbook.stream)
+            with tracker.phase('evaluate'):
+                if pipeline is None:
+                    nevals = evaluate_invalids(toolbox, offspring, dedup is not None)
+                else:
+                    offspring, nevals = pipeline.evaluate(toolbox, offspring, survivors)
 
-    return population, logbook
+            with tracker.phase('select'):
+                population[:] = toolbox.select(offspring, survivors)
+
+            with tracker.phase('hof'):
+                if hof is not None:
+                    hof.update(offspring)
+            with tracker.phase('stats'):
+                record = stats.compile(population) if stats else {}
+            state = tracker.record(gen, population, nevals, record)
+            if verbose:
+                print(logbook.stream)
+
+            yield state
+            if state.stop:
+                break
+    finally:
+        if pipeline is not None:
+            pipeline.cancel()
@@ -0,0 +1,123 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.records.dtypes import *
+from deap_er.records import Logbook
+from deap_er.base import Toolbox
+from typing import Iterator, Union
+from .state import GenerationState, _StateTracker, _next_gen, _gen_range, _header
+from .swarm import ParticleSwarm, MultiSwarm
+from .profiling import PhaseProfiler
+from .termination import Termination
+
+
+__all__ = ['ea_particle_swarm', 'iter_ea_particle_swarm']
+
+
+# ====================================================================================== #
+def ea_particle_swarm(toolbox: Toolbox, swarm: Union[ParticleSwarm, MultiSwarm],
+                      generations: int, hof: Hof = None,
+                      stats: Stats = None, terminate: Termination = None,
+                      verbose: bool = False,
+                      profiler: PhaseProfiler = None) -> tuple:
+    """
+    A particle swarm optimization algorithm. This function expects the
+    *'evaluate'* or the *'evaluate_batch'* operator to be registered in
+    the toolbox. The particles are stored in a :class:`PopulationMatrix`,
+    so the evaluation operators receive its row views or the container
+    itself, which can be converted into a 2-D array of positions with
+    :func:`numpy.asarray`. At each generation, the particles are moved,
+    the invalid particles are evaluated and the personal best positions
+    are updated. The hall of fame and the statistics are updated with
+    the current particles. The rows of the container are numpy arrays,
+    so a HallOfFame must be created with :code:`similar=numpy.array_equal`.
+
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param swarm: A ParticleSwarm or a MultiSwarm to evolve.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
+    :param hof: A HallOfFame or a ParetoFront object, optional.
+    :param stats: A Statistics or a MultiStatistics object, optional.
+    :param terminate: A termination criterion, optional.
+    :param verbose: Whether to print debug messages, optional.
+    :param profiler: A PhaseProfiler, which records the durations
+        of the phases of each generation into the logbook, optional.
+    :return: The final swarm and the logbook.
+
+    :type hof: :ref:`Hof <datatypes>`
+    :type stats: :ref:`Stats <datatypes>`
+    """
+    logbook = Logbook()
+    for _ in iter_ea_particle_swarm(toolbox, swarm, generations, hof, stats,
+                                    terminate, logbook, verbose, profiler):
+        pass
+    return swarm, logbook
+
+
+# -------------------------------------------------------------------------------------- #
+def iter_ea_particle_swarm(toolbox: Toolbox, swarm: Union[ParticleSwarm, MultiSwarm],
+                           generations: int, hof: Hof = None,
+                           stats: Stats = None, terminate: Termination = None,
+                           logbook: Logbook = None,
+                           verbose: bool = False,
+                           profiler: PhaseProfiler = None) -> Iterator[GenerationState]:
+    """
+    The iterator version of the :func:`ea_particle_swarm` algorithm, which yields
+    a :class:`GenerationState` after each computed generation. The population of
+    the states contains the current particles. The iteration can be stopped at
+    any time and resumed later by passing the restored objects into a new
+    iterator. The generation numbering then continues from the last
+    entry of the **logbook**.
+
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param swarm: A ParticleSwarm or a MultiSwarm to evolve.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
+    :param hof: A HallOfFame or a ParetoFront object, optional.
+    :param stats: A Statistics or a MultiStatistics object, optional.
+    :param terminate: A termination criterion, optional.
+    :param logbook: A Logbook to continue recording into, optional.
+    :param verbose: Whether to print debug messages, optional.
+    :param profiler: A PhaseProfiler, which records the durations
+        of the phases of each generation into the logbook, optional.
+    :return: An iterator of the generation states.
+
+    :type hof: :ref:`Hof <datatypes>`
+    :type stats: :ref:`Stats <datatypes>`
+    """
+    if logbook is None:
+        logbook = Logbook()
+    if not logbook.header:
+        logbook.header = _header(stats, profiler, terminate)
+
+    tracker = _StateTracker(logbook, terminate, profiler)
+    first_gen = _next_gen(logbook, 1)
+
+    for gen in _gen_range(first_gen, generations, terminate):
+        with tracker.phase('vary'):
+            swarm.move()
+        with tracker.phase('evaluate'):
+            nevals = swarm.evaluate(toolbox)
+        with tracker.phase('update'):
+            swarm.update()
+
+        population = swarm.population
+        with tracker.phase('hof'):
+            if hof is not None:
+                hof.update(population)
+        with tracker.phase('stats'):
+            record = stats.compile(population) if stats else {}
+        state = tracker.record(gen, population, nevals, record)
+        if verbose:
+            print(logbook.stream)
+
+        yield state
+        if state.stop:
+            return
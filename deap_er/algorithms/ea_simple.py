@@ -11,28 +11,48 @@
 from deap_er.records.dtypes import *
 from deap_er.records import Logbook
 from deap_er.base import Toolbox
+from typing import Iterator, Optional
+from .evaluation import *
+from .evaluation import _check_dedup
 from .variation import *
+from .state import GenerationState, _StateTracker, _next_gen, _gen_range, _header
+from .profiling import PhaseProfiler
+from .termination import Termination
 
 
-__all__ = ['ea_simple']
+__all__ = ['ea_simple', 'iter_ea_simple']
 
 
 # ====================================================================================== #
 def ea_simple(toolbox: Toolbox, population: list, generations: int,
               cx_prob: float, mut_prob: float, hof: Hof = None,
-              stats: Stats = None, verbose: bool = False) -> AlgoResult:
+              stats: Stats = None, verbose: bool = False, *,
+              terminate: Termination = None, lazy_clone: bool = False,
+              profiler: PhaseProfiler = None,
+              dedup: Optional[str] = None) -> AlgoResult:
     """
     An evolutionary algorithm. This function expects the *'mate'*, *'mutate'*,
     *'select'* and *'evaluate'* operators to be registered in the toolbox.
+    If the *'evaluate_batch'* operator is registered in the toolbox,
+    it is used instead of the *'evaluate'* operator.
 
     :param toolbox: A Toolbox which contains the evolution operators.
     :param population: A list of individuals to evolve.
-    :param generations: The number of generations to compute.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
     :param cx_prob: The probability of mating two individuals.
     :param mut_prob: The probability of mutating an individual.
     :param hof: A HallOfFame or a ParetoFront object, optional.
     :param stats: A Statistics or a MultiStatistics object, optional.
     :param verbose: Whether to print debug messages, optional.
+    :param terminate: A termination criterion, optional.
+    :param lazy_clone: Whether the variation step clones only the individuals
+        which are mated or mutated, optional. The default value is False.
+    :param profiler: A PhaseProfiler, which records the durations
+        of the phases of each generation into the logbook, optional.
+    :param dedup: If *'evaluate'*, each distinct genome of the offspring
+        is evaluated only once, optional. By default, the offspring
+        are evaluated without de-duplication.
     :return: The final population and the logbook.
 
     :type hof: :ref:`Hof <datatypes>`
@@ -40,24 +60,82 @@ def ea_simple(toolbox: Toolbox, population: list, generations: int,
     :rtype: :ref:`AlgoResult <datatypes>`
     """
     logbook = Logbook()
-    logbook.header = ['gen', 'nevals'] + (stats.fields if stats else [])
+    for _ in iter_ea_simple(toolbox, population, generations, cx_prob,
+                            mut_prob, hof, stats, verbose, terminate=terminate,
+                            logbook=logbook, lazy_clone=lazy_clone,
+                            profiler=profiler, dedup=dedup):
+        pass
+    return population, logbook
+
+
+# -------------------------------------------------------------------------------------- #
+def iter_ea_simple(toolbox: Toolbox, population: list, generations: int,
+                   cx_prob: float, mut_prob: float, hof: Hof = None,
+                   stats: Stats = None, verbose: bool = False, *,
+                   terminate: Termination = None,
+                   logbook: Logbook = None, lazy_clone: bool = False,
+                   profiler: PhaseProfiler = None,
+                   dedup: Optional[str] = None) -> Iterator[GenerationState]:
+    """
+    The iterator version of the :func:`ea_simple` algorithm, which yields a
+    :class:`GenerationState` after each computed generation. The iteration
+    can be stopped at any time and resumed later, e.g. after restoring the
+    population, the hall of fame and the logbook from a Checkpoint, by
+    passing the restored objects into a new iterator. The generation
+    numbering then continues from the last entry of the **logbook**.
+
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param population: A list of individuals to evolve.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
+    :param cx_prob: The probability of mating two individuals.
+    :param mut_prob: The probability of mutating an individual.
+    :param hof: A HallOfFame or a ParetoFront object, optional.
+    :param stats: A Statistics or a MultiStatistics object, optional.
+    :param verbose: Whether to print debug messages, optional.
+    :param terminate: A termination criterion, optional.
+    :param logbook: A Logbook to continue recording into, optional.
+    :param lazy_clone: Whether the variation step clones only the individuals
+        which are mated or mutated, optional. The default value is False.
+    :param profiler: A PhaseProfiler, which records the durations
+        of the phases of each generation into the logbook, optional.
+    :param dedup: If *'evaluate'*, each distinct genome of the offspring
+        is evaluated only once, optional. By default, the offspring
+        are evaluated without de-duplication.
+    :return: An iterator of the generation states.
 
-    for gen in range(1, generations + 1):
-        offspring = toolbox.select(population, len(population))
-        offspring = var_and(toolbox, offspring, cx_prob, mut_prob)
+    :type hof: :ref:`Hof <datatypes>`
+    :type stats: :ref:`Stats <datatypes>`
+    """
+    _check_dedup(dedup, ('evaluate',))
+    if logbook is None:
+        logbook = Logbook()
+    if not logbook.header:
+        logbook.header = _header(stats, profiler, terminate)
+
+    tracker = _StateTracker(logbook, terminate, profiler)
+    first_gen = _next_gen(logbook, 1)
 
-        invalids = [ind for ind in offspring if not ind.fitness.is_valid()]
-        fitness = toolbox.map(toolbox.evaluate, invalids)
-        for ind, fit in zip(invalids, fitness):
-            ind.fitness.values = fit
+    for gen in _gen_range(first_gen, generations, terminate):
+        with tracker.phase('select'):
+            offspring = toolbox.select(population, len(population))
+        with tracker.phase('vary'):
+            offspring = var_and(toolbox, offspring, cx_prob, mut_prob, lazy_clone)
+
+        with tracker.phase('evaluate'):
+            nevals = evaluate_invalids(toolbox, offspring, dedup is not None)
 
         population[:] = offspring
 
-        if hof is not None:
-            hof.update(offspring)
-        record = stats.compile(population) if stats else {}
-        logbook.record(gen=gen, nevals=len(invalids), **record)
+        with tracker.phase('hof'):
+            if hof is not None:
+                hof.update(offspring)
+        with tracker.phase('stats'):
+            record = stats.compile(population) if stats else {}
+        state = tracker.record(gen, population, nevals, record)
         if verbose:
             print(logbook.stream)
 
-    return population, logbook
+        yield state
+        if state.stop:
+            return
@@ -0,0 +1,147 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.records.dtypes import *
+from deap_er.records import Logbook
+from deap_er.base import Toolbox
+from concurrent.futures import Executor
+from .variation import *
+from .state import _StateTracker
+from .termination import Termination
+import inspect
+import asyncio
+
+
+__all__ = ['ea_steady_state_async']
+
+
+# ====================================================================================== #
+async def ea_steady_state_async(toolbox: Toolbox, population: list,
+                                evaluations: int, in_flight: int,
+                                cx_prob: float, mut_prob: float,
+                                executor: Executor = None,
+                                record_freq: int = None,
+                                hof: Hof = None, stats: Stats = None,
+                                terminate: Termination = None,
+                                verbose: bool = False) -> AlgoResult:
+    """
+    An asynchronous steady-state evolutionary algorithm. This coroutine expects
+    the *'mate'*, *'mutate'*, *'select'* and *'evaluate'* operators to be
+    registered in the toolbox. Up to **in_flight** evaluations are kept running
+    at all times. Each time an evaluation completes, the evaluated offspring is
+    merged into the population with the *'select'* operator and a new offspring
+    is produced with the :func:`var_or` subcomponent to keep the pipeline full.
+    If the *'evaluate'* operator is a coroutine function, it is awaited directly,
+    otherwise it is run in the **executor**. The coroutine can be executed with
+    :code:`asyncio.run(ea_steady_state_async(...))`.
+
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param population: A list of individuals to evolve.
+    :param evaluations: The number of offspring to evaluate.
+    :param in_flight: The maximum number of concurrently running evaluations.
+    :param cx_prob: The probability of mating two individuals.
+    :param mut_prob: The probability of mutating an individual.
+    :param executor: An executor which runs a synchronous *'evaluate'* operator,
+        optional. By default, the default executor of the event loop is used.
+    :param record_freq: The number of completed evaluations after which a
+        new entry is recorded into the logbook, optional. By default,
+        an entry is recorded after every *len(population)* evaluations.
+    :param hof: A HallOfFame or a ParetoFront object, optional.
+    :param stats: A Statistics or a MultiStatistics object, optional.
+    :param terminate: A termination criterion, which is checked each time
+        an entry is recorded into the logbook, optional.
+    :param verbose: Whether to print debug messages, optional.
+    :return: The final population and the logbook.
+
+    :type hof: :ref:`Hof <datatypes>`
+    :type stats: :ref:`Stats <datatypes>`
+    :rtype: :ref:`AlgoResult <datatypes>`
+    """
+    if not cx_prob + mut_prob > 0:
+        raise ValueError(
+            "The sum of the crossover and the mutation "
+            "probabilities must be larger than zero."
+        )
+    if in_flight < 1:
+        raise ValueError("The in_flight argument must be a positive integer.")
+    if record_freq is None:
+        record_freq = len(population)
+
+    loop = asyncio.get_running_loop()
+    is_coroutine = inspect.iscoroutinefunction(toolbox.evaluate)
+
+    async def _evaluate(ind):
+        if is_coroutine:
+            fit = await toolbox.evaluate(ind)
+        else:
+            fit = await loop.run_in_executor(executor, toolbox.evaluate, ind)
+        ind.fitness.values = fit
+        return ind
+
+    def _record(evals, nevals):
+        record = stats.compile(population) if stats else {}
+        state = tracker.snapshot(len(logbook), population, nevals, record)
+        stop = terminate(state) if terminate else None
+        entry = dict(evals=evals, nevals=nevals)
+        if stop:
+            entry['stop'] = stop
+        logbook.record(**entry, **record)
+        if verbose:
+            print(logbook.stream)
+        return stop
+
+    def _produce():
+        ind, = var_or(toolbox, population, 1, cx_prob, mut_prob)
+        while ind.fitness.is_valid():
+            ind, = var_or(toolbox, population, 1, cx_prob, mut_prob)
+        return asyncio.ensure_future(_evaluate(ind))
+
+    logbook = Logbook()
+    logbook.header = ['evals', 'nevals'] + (stats.fields if stats else [])
+    if terminate is not None:
+        logbook.header.append('stop')
+    tracker = _StateTracker(logbook)
+
+    invalids = [ind for ind in population if not ind.fitness.is_valid()]
+    await asyncio.gather(*map(_evaluate, invalids))
+
+    if hof is not None:
+        hof.update(population)
+    stop = _record(0, len(invalids))
+
+    submitted, completed, unrecorded = 0, 0, 0
+    pending = set()
+    try:
+        while (submitted < evaluations or pending) and not stop:
+            while submitted < evaluations and len(pending) < in_flight:
+                pending.add(_produce())
+                submitted += 1
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                ind = task.result()
+                population[:] = toolbox.select(population + [ind], len(population))
+                if hof is not None:
+                    hof.update([ind])
+                completed += 1
+                unrecorded += 1
+
+                if unrecorded >= record_freq or completed == evaluations:
+                    stop = _record(completed, unrecorded)
+                    unrecorded = 0
+                    if stop:
+                        break
+    finally:
+        for task in pending:
+            task.cancel()
+
+    return population, logbook
@@ -0,0 +1,147 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.utilities.fitness_cache import genome_key
+from deap_er.base import Toolbox, PopulationMatrix
+from typing import Iterable, Optional
+from .variation import var_or
+import numpy
+
+
+__all__ = ['evaluate_invalids', 'remove_duplicates']
+
+
+# ====================================================================================== #
+def evaluate_invalids(toolbox: Toolbox, population: list,
+                      unique: Optional[bool] = False) -> int:
+    """
+    A subcomponent for evolutionary algorithms, which evaluates the
+    individuals of the given population that have an invalid fitness.
+    If the *'evaluate_batch'* operator is registered in the toolbox,
+    it is called once with the list of all invalid individuals and
+    it must return a sequence of fitness values in the same order,
+    e.g. a 2-D ndarray of shape *(n_individuals, n_objectives)*.
+    Otherwise, the *'evaluate'* operator is mapped over the
+    invalid individuals using the *'map'* operator.
+
+    If **unique** is True, the genomes are hashed with the :func:`genome_key`
+    function and each distinct genome is evaluated only once. The invalid
+    individuals which have the same genome as another individual of the
+    population, including the valid ones, receive a copy of its fitness.
+
+    If the population is a :class:`PopulationMatrix`, **unique** is False and
+    the *'evaluate_batch'* operator is registered, the operator is called with
+    a PopulationMatrix of the invalid rows, which can be converted into a 2-D
+    array of genomes with :func:`numpy.asarray`, and the fitness values are
+    written into the population in a single vectorized assignment.
+
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param population: A list of individuals to evaluate.
+    :param unique: Whether to evaluate each distinct genome
+        only once, optional. The default value is False.
+    :return: The number of evaluated individuals.
+    """
+    matrix = isinstance(population, PopulationMatrix)
+    if matrix and not unique and hasattr(toolbox, 'evaluate_batch'):
+        indices = numpy.flatnonzero(~population.valid)
+        if len(indices):
+            fitness = toolbox.evaluate_batch(population.take(indices))
+            values = numpy.asarray(fitness, dtype=float).reshape(len(indices), -1)
+            population.wvalues[indices] = values * population.weights
+        return len(indices)
+
+    invalids = [ind for ind in population if not ind.fitness.is_valid()]
+    if not invalids:
+        return 0
+
+    duplicates = []
+    if unique:
+        known = {genome_key(ind): ind for ind in population if ind.fitness.is_valid()}
+        distinct = []
+        for ind in invalids:
+            key = genome_key(ind)
+            if key in known:
+                duplicates.append((ind, known[key]))
+            else:
+                known[key] = ind
+                distinct.append(ind)
+        invalids = distinct
+
+    if hasattr(toolbox, 'evaluate_batch'):
+        fitness = toolbox.evaluate_batch(invalids)
+    else:
+        fitness = toolbox.map(toolbox.evaluate, invalids)
+
+    for ind, fit in zip(invalids, fitness):
+        ind.fitness.values = fit
+    for ind, source in duplicates:
+        ind.fitness.values = source.fitness.values
+    return len(invalids)
+
+
+# -------------------------------------------------------------------------------------- #
+def remove_duplicates(individuals: Iterable, reference: Iterable = None) -> list:
+    """
+    A subcomponent for evolutionary algorithms, which removes the individuals
+    whose genome has already occurred in the **individuals** or in the
+    **reference** individuals. The genomes are hashed with the
+    :func:`genome_key` function and the order is preserved.
+
+    :param individuals: The individuals to de-duplicate.
+    :param reference: The individuals whose genomes are
+        also treated as duplicates, optional.
+    :return: A list of individuals with distinct genomes.
+    """
+    seen = set(genome_key(ind) for ind in reference or [])
+    distinct = []
+    for ind in individuals:
+        key = genome_key(ind)
+        if key not in seen:
+            seen.add(key)
+            distinct.append(ind)
+    return distinct
+
+
+# -------------------------------------------------------------------------------------- #
+def _var_or_distinct(toolbox: Toolbox, population: list, offsprings: int,
+                     cx_prob: float, mut_prob: float, minimum: int,
+                     reference: list = None, attempts: int = 10) -> list:
+    # produces more offspring until at least 'minimum' distinct genomes are
+    # available, then pads with duplicates to preserve the population size
+    reference = list(reference or [])
+    offspring = var_or(toolbox, population, offsprings, cx_prob, mut_prob)
+    offspring = remove_duplicates(offspring, reference)
+    for _ in range(attempts):
+        if len(offspring) >= minimum:
+            return offspring
+        extra = var_or(toolbox, population, minimum - len(offspring), cx_prob, mut_prob)
+        offspring += remove_duplicates(extra, reference + offspring)
+    if len(offspring) < minimum:
+        offspring += var_or(toolbox, population, minimum - len(offspring), cx_prob, mut_prob)
+    return offspring
+
+
+# -------------------------------------------------------------------------------------- #
+def _check_dedup(dedup: Optional[str], allowed: tuple) -> None:
+    if dedup is not None and dedup not in allowed:
+        options = ' or '.join(f"'{opt}'" for opt in allowed)
+        raise ValueError(
+            f"The dedup argument must be None or {options}, not '{dedup}'."
+        )
+
+
+# -------------------------------------------------------------------------------------- #
+def _not_worse(trials: numpy.ndarray, targets: numpy.ndarray) -> numpy.ndarray:
+    # lexicographic comparison of the weighted values, like the Fitness objects
+    diff = trials - targets
+    differs = diff != 0
+    first = numpy.argmax(differs, axis=1)
+    better = diff[numpy.arange(len(diff)), first] > 0
+    return ~differs.any(axis=1) | better
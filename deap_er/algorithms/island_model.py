@@ -0,0 +1,193 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.records.dtypes import *
+from deap_er.records import Logbook
+from deap_er.base import Toolbox, RandomStream
+from typing import Callable, Optional
+import multiprocessing
+import traceback
+import queue
+import random
+
+
+__all__ = ['IslandModel']
+
+
+# ====================================================================================== #
+class IslandModel:
+    """
+    Runs an island model, where each population *(deme)* is evolved in its own
+    worker process by the **algorithm** for **mig_freq** generations at a time,
+    after which the demes exchange **mig_count** individuals with the same
+    semantics as the :func:`mig_ring` operator. The migrants are sent directly
+    from one worker to another through queues, so only the migrants are
+    serialized and there is no central process in the migration path.
+
+    The **algorithm** can be any algorithm which accepts the toolbox, the
+    population and the number of generations as its first three positional
+    arguments and returns the population and the logbook, for example
+    :func:`ea_simple` or :func:`ea_mu_plus_lambda`. The toolbox, the operators
+    and the **kwargs** must be pickleable, if the *'spawn'* start method is used.
+
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param algorithm: The algorithm which evolves each deme.
+    :param mig_freq: The number of generations between migrations.
+    :param mig_count: The number of individuals to migrate.
+    :param selection: The function to select emigrants from each deme.
+    :param replacement: The function to select which individuals will
+        be replaced by the immigrants, optional. By default, the
+        emigrants are replaced by the immigrants.
+    :param mig_indices: A list of indices indicating where the individuals from a
+        particular position in the list goes, optional. Default is a ring migration.
+    :param kwargs: Keyword arguments which are passed into the algorithm, optional.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, toolbox: Toolbox, algorithm: Callable,
+                 mig_freq: int, mig_count: int, selection: Callable,
+                 replacement: Optional[Callable] = None,
+                 mig_indices: Optional[list] = None, **kwargs: Optional):
+        self.toolbox = toolbox
+        self.algorithm = algorithm
+        self.mig_freq = mig_freq
+        self.mig_count = mig_count
+        self.selection = selection
+        self.replacement = replacement
+        self.mig_indices = mig_indices
+        self.kwargs = kwargs
+
+    # -------------------------------------------------------- #
+    def run(self, populations: list, generations: int, hof: Hof = None,
+            rng: Optional[RandomStream] = None) -> tuple[list, list]:
+        """
+        Evolves the **populations** for the given number of **generations**,
+        each in its own worker process. The **populations** list is updated
+        in-place with the final populations of the demes. If a **hof** is
+        provided, each deme keeps its own hall of fame, which is merged
+        into the **hof** after the evolution has finished. Each deme
+        is evolved inside its own child stream of the **rng**, so
+        the run is reproducible for a seeded **rng**.
+
+        :param populations: A list of populations to evolve.
+        :param generations: The number of generations to compute.
+        :param hof: A HallOfFame or a ParetoFront object, optional.
+        :param rng: A RandomStream, from which the streams of the demes are
+            spawned, optional. By default, it is seeded from the :mod:`random` module.
+        :return: The final populations and a list of logbooks of each deme.
+        :raises RuntimeError: If a deme raised an error or its worker process died.
+
+        :type hof: :ref:`Hof <datatypes>`
+        """
+        nbr_demes = len(populations)
+        mig_indices = self.mig_indices
+        if mig_indices is None:
+            mig_indices = list(range(1, nbr_demes)) + [0]
+
+        inboxes = [multiprocessing.Queue() for _ in range(nbr_demes)]
+        results = multiprocessing.Queue()
+        if rng is None:
+            rng = RandomStream(random.randrange(2 ** 32))
+        streams = rng.spawn(nbr_demes)
+
+        workers = []
+        for index, population in enumerate(populations):
+            to_deme = [i for i, target in enumerate(mig_indices) if target == index]
+            args = (
+                self, index, population, generations, hof, streams[index],
+                inboxes, mig_indices[index], len(to_deme), results
+            )
+            worker = multiprocessing.Process(target=_island_worker, args=args)
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+
+        logbooks = [None] * nbr_demes
+        received = set()
+        try:
+            while len(received) < nbr_demes:
+                try:
+                    index, outcome = results.get(timeout=1.0)
+                except queue.Empty:
+                    _check_workers(workers, received, results)
+                    continue
+                received.add(index)
+                if isinstance(outcome, str):
+                    raise RuntimeError(
+                        f"Deme {index} of the island model failed:\n{outcome}"
+                    )
+                populations[index][:], logbooks[index], deme_hof = outcome
+                if hof is not None:
+                    hof.update(list(deme_hof))
+            for worker in workers:
+                worker.join()
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+
+        return populations, logbooks
+
+
+# -------------------------------------------------------------------------------------- #
+def _island_worker(model: IslandModel, index: int, population: list,
+                   generations: int, hof: Hof, stream: RandomStream,
+                   inboxes: list, target: int, senders: int, results) -> None:
+    try:
+        with stream:
+            kwargs = dict(model.kwargs)
+            if hof is not None:
+                kwargs['hof'] = hof
+
+            logbook = Logbook()
+            done = 0
+            while done < generations:
+                gens = min(model.mig_freq, generations - done)
+                population, log = model.algorithm(model.toolbox, population, gens, **kwargs)
+                _merge_logbook(logbook, log, done)
+                done += gens
+                if done >= generations:
+                    break
+
+                emigrants = model.selection(population, model.mig_count)
+                replaced = emigrants
+                if model.replacement is not None:
+                    replaced = model.replacement(population, model.mig_count)
+                inboxes[target].put([model.toolbox.clone(ind) for ind in emigrants])
+
+                positions = {id(ind): i for i, ind in enumerate(population)}
+                for _ in range(senders):
+                    immigrants = inboxes[index].get()
+                    for old, new in zip(replaced, immigrants):
+                        population[positions[id(old)]] = new
+
+            results.put((index, (population, logbook, hof)))
+    except Exception:
+        results.put((index, traceback.format_exc()))
+
+
+# -------------------------------------------------------------------------------------- #
+def _check_workers(workers: list, received: set, results) -> None:
+    for index, worker in enumerate(workers):
+        if index not in received and not worker.is_alive() and results.empty():
+            raise RuntimeError(
+                f"Deme {index} of the island model died "
+                f"unexpectedly with the exit code {worker.exitcode}."
+            )
+
+
+# -------------------------------------------------------------------------------------- #
+def _merge_logbook(logbook: Logbook, log: Logbook, offset: int) -> None:
+    logbook.header = log.header
+    for entry in log:
+        if 'gen' in entry:
+            entry['gen'] += offset
+        logbook.append(entry)
+    for name, chapter in log.chapters.items():
+        _merge_logbook(logbook.chapters[name], chapter, offset)
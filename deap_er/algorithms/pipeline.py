@@ -0,0 +1,120 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.base import Toolbox
+from concurrent.futures import Executor
+from typing import Iterable, Optional
+import queue
+import math
+
+
+__all__ = ['Pipeline']
+
+
+# ====================================================================================== #
+class Pipeline:
+    """
+    A pipelined evaluation mode for the :func:`ea_mu_comma_lambda` and the
+    :func:`ea_mu_plus_lambda` algorithms, which overlaps the evaluation of a
+    generation with the selection and the variation of the next one. The invalid
+    offspring are submitted one by one into the **executor** with the *'evaluate'*
+    operator and the algorithm proceeds to the selection as soon as the **quorum**
+    fraction of them has been evaluated, in the order of completion. The
+    remaining offspring keep evaluating in the background while the next
+    generation is produced, so the workers are kept busy.
+
+    The selection semantics change within a documented tolerance: the selection
+    of each generation considers at least the **quorum** fraction of its evaluated
+    offspring, while the late offspring are added into the selection pool of
+    the generation in which they complete. The algorithms always wait for
+    enough offspring to select the survivors from. The late offspring which
+    are still evaluating when the algorithm finishes are cancelled.
+
+    The object can also be added into a MultiStatistics object to record
+    the number of evaluations in flight and the number of late offspring.
+
+    :param executor: An executor which runs the *'evaluate'* operator,
+        e.g. a :class:`concurrent.futures.ProcessPoolExecutor`.
+    :param quorum: The fraction of the offspring of a generation which must be
+        evaluated before the selection, optional. The default value is 0.8.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, executor: Executor, quorum: Optional[float] = 0.8):
+        if not (0 < quorum <= 1):
+            raise ValueError("The quorum must be in the range of (0, 1].")
+        self.executor = executor
+        self.quorum = quorum
+        self.pending = dict()
+        self.late = 0
+        self.fields = ['in_flight', 'late']
+        self._completed = queue.SimpleQueue()
+
+    # -------------------------------------------------------- #
+    def evaluate(self, toolbox: Toolbox, offspring: list,
+                 minimum: Optional[int] = 0) -> tuple[list, int]:
+        """
+        Submits the invalid **offspring** for the evaluation and waits until
+        the quorum of them has been evaluated. The offspring of the previous
+        generations, which complete in the meantime, are also returned.
+
+        :param toolbox: A Toolbox which contains the evolution operators.
+        :param offspring: The offspring of the current generation.
+        :param minimum: The minimum number of individuals to return, if
+            enough offspring are available, optional. The default value is 0.
+        :return: A list of the evaluated individuals, which starts with the
+            valid offspring, and the number of completed evaluations.
+        """
+        ready = [ind for ind in offspring if ind.fitness.is_valid()]
+        current = set()
+        for ind in offspring:
+            if not ind.fitness.is_valid():
+                future = self.executor.submit(toolbox.evaluate, ind)
+                self.pending[future] = ind
+                current.add(future)
+                future.add_done_callback(self._completed.put)
+
+        required = max(math.ceil(self.quorum * len(current)), minimum - len(ready))
+        required = min(required, len(current))
+        completed, nevals = 0, 0
+        while completed < required or not self._completed.empty():
+            future = self._completed.get()
+            ind = self.pending.pop(future, None)
+            if ind is None:  # cancelled
+                continue
+            ind.fitness.values = future.result()
+            ready.append(ind)
+            nevals += 1
+            if future in current:
+                completed += 1
+            else:
+                self.late += 1
+        return ready, nevals
+
+    # -------------------------------------------------------- #
+    def cancel(self) -> None:
+        """
+        Cancels the evaluations which are still in flight.
+
+        :return: Nothing.
+        """
+        pending, self.pending = self.pending, dict()
+        for future in pending:
+            future.cancel()
+
+    # -------------------------------------------------------- #
+    def compile(self, _: Iterable = None) -> dict:
+        """
+        Returns the number of evaluations in flight and the number of late
+        offspring. This method enables the pipeline object to be used as
+        a member of a MultiStatistics object.
+
+        :return: A dictionary of the 'in_flight' and 'late' counters.
+        """
+        return dict(in_flight=len(self.pending), late=self.late)
@@ -0,0 +1,77 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from typing import Callable, Iterator, Optional
+from collections import defaultdict
+from contextlib import contextmanager
+import time
+
+
+__all__ = ['PhaseProfiler']
+
+
+# ====================================================================================== #
+class PhaseProfiler:
+    """
+    Measures the durations of the phases of each generation of an algorithm,
+    such as the selection, the variation, the evaluation, the hall of fame
+    update and the statistics compilation, with :func:`time.perf_counter_ns`.
+    When the profiler is passed into an algorithm with the **profiler**
+    argument, the durations of each generation are recorded in seconds
+    into the logbook as a chapter, together with the *'total'* duration
+    of the measured phases and the number of evaluations per second.
+
+    :param callback: A function which is called after each generation with
+        the generation number and the dictionary of the durations, optional.
+    :param chapter: The name of the logbook chapter, optional.
+        The default value is *'timing'*.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, callback: Optional[Callable] = None,
+                 chapter: Optional[str] = 'timing'):
+        self.callback = callback
+        self.chapter = chapter
+        self.phases = defaultdict(int)
+
+    # -------------------------------------------------------- #
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        A context manager, which adds the duration of
+        its body to the duration of the **name** phase.
+
+        :param name: The name of the measured phase.
+        :return: A context manager.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter_ns() - start
+
+    # -------------------------------------------------------- #
+    def flush(self, gen: int, nevals: int) -> dict:
+        """
+        Returns the durations of the phases of the generation in seconds,
+        calls the callback with them and resets the measurements. This
+        method is called by the algorithms after each generation.
+
+        :param gen: The number of the generation.
+        :param nevals: The number of evaluations in the generation.
+        :return: A dictionary of the durations and the evaluations per second.
+        """
+        timings = {name: ns / 1e9 for name, ns in self.phases.items()}
+        timings['total'] = sum(self.phases.values()) / 1e9
+        eval_time = timings.get('evaluate', 0.0)
+        timings['evals_per_sec'] = nevals / eval_time if eval_time else 0.0
+        self.phases.clear()
+        if self.callback is not None:
+            self.callback(gen, timings)
+        return timings
@@ -0,0 +1,147 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.records import Logbook
+from .profiling import PhaseProfiler
+from typing import Callable, ContextManager, Iterable, Optional
+import contextlib
+import itertools
+import time
+
+
+__all__ = ['GenerationState']
+
+
+# ====================================================================================== #
+class GenerationState:
+    """
+    A lightweight snapshot of an evolutionary algorithm, which is yielded by
+    the iterator versions of the algorithms after each computed generation.
+    The population and the logbook are references to the live objects,
+    which the algorithm continues to modify when the iteration is resumed.
+
+    :param gen: The number of the computed generation.
+    :param population: A reference to the population of the algorithm.
+    :param logbook: A reference to the logbook of the algorithm.
+    :param record: The statistics record of the computed generation.
+    :param nevals: The number of evaluations in the computed generation.
+    :param evals: The total number of evaluations recorded into the logbook.
+    :param gen_time: The time in seconds since the previous snapshot was taken.
+    :param elapsed: The time in seconds since the iteration was started.
+    :param stop: The reason of the termination, if a termination
+        criterion was met in the computed generation, optional.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, gen: int, population: list, logbook: Logbook,
+                 record: dict, nevals: int, evals: int,
+                 gen_time: float, elapsed: float,
+                 stop: Optional[str] = None):
+        self.gen = gen
+        self.population = population
+        self.logbook = logbook
+        self.record = record
+        self.nevals = nevals
+        self.evals = evals
+        self.gen_time = gen_time
+        self.elapsed = elapsed
+        self.stop = stop
+
+    # -------------------------------------------------------- #
+    def __repr__(self):
+        return '{0}(gen={1}, nevals={2}, evals={3}, elapsed={4:.3f})'.format(
+            self.__class__.__name__,
+            self.gen, self.nevals,
+            self.evals, self.elapsed
+        )
+
+
+# ====================================================================================== #
+class _StateTracker:
+    """
+    Private helper which produces the snapshots of an algorithm,
+    checks the termination criteria and records the logbook entries.
+    The total number of evaluations is initialized from the
+    logbook, so that resumed iterations keep counting.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, logbook: Logbook, terminate: Optional[Callable] = None,
+                 profiler: Optional[PhaseProfiler] = None):
+        self.logbook = logbook
+        self.terminate = terminate
+        self.profiler = profiler
+        self.evals = sum(n for n in logbook.select('nevals') if n)
+        self.start = self.last = time.perf_counter()
+
+    # -------------------------------------------------------- #
+    def phase(self, name: str) -> ContextManager:
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.phase(name)
+
+    # -------------------------------------------------------- #
+    def snapshot(self, gen: int, population: list,
+                 nevals: int, record: dict) -> GenerationState:
+        now = time.perf_counter()
+        gen_time, self.last = now - self.last, now
+        self.evals += nevals
+        return GenerationState(
+            gen, population, self.logbook, record,
+            nevals, self.evals, gen_time, now - self.start
+        )
+
+    # -------------------------------------------------------- #
+    def record(self, gen: int, population: list,
+               nevals: int, record: dict) -> GenerationState:
+        if self.profiler is not None:
+            timings = self.profiler.flush(gen, nevals)
+            chapter = self.logbook.chapters[self.profiler.chapter]
+            if not chapter.header:
+                chapter.header = list(timings.keys())
+            record = dict(record)
+            record[self.profiler.chapter] = timings
+        state = self.snapshot(gen, population, nevals, record)
+        if self.terminate is not None:
+            state.stop = self.terminate(state)
+        entry = dict(gen=gen, nevals=nevals)
+        if state.stop:
+            entry['stop'] = state.stop
+        self.logbook.record(**entry, **record)
+        return state
+
+
+# -------------------------------------------------------------------------------------- #
+def _next_gen(logbook: Logbook, first: int) -> int:
+    if len(logbook) and logbook[-1].get('gen') is not None:
+        return logbook[-1]['gen'] + 1
+    return first
+
+
+# -------------------------------------------------------------------------------------- #
+def _gen_range(first: int, generations: Optional[int],
+               terminate: Optional[Callable]) -> Iterable[int]:
+    if generations is not None:
+        return range(first, first + generations)
+    if terminate is None:
+        raise ValueError(
+            "The number of generations can be None "
+            "only if a termination criterion is provided."
+        )
+    return itertools.count(first)
+
+
+# -------------------------------------------------------------------------------------- #
+def _header(stats: Optional[object], profiler: Optional[PhaseProfiler],
+            terminate: Optional[Callable] = None) -> list:
+    header = ['gen', 'nevals'] + (stats.fields if stats else [])
+    if profiler is not None:
+        header.append(profiler.chapter)
+    if terminate is not None:
+        header.append('stop')
+    return header
@@ -0,0 +1,176 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from scipy.interpolate import RBFInterpolator
+from scipy.spatial import cKDTree
+from typing import Iterable, Optional
+import numpy
+import math
+
+
+__all__ = ['Surrogate']
+
+
+# ====================================================================================== #
+class Surrogate:
+    """
+    A surrogate model for pre-screening the offspring before their evaluation,
+    which can be registered into the toolbox as the *'screen'* operator. The
+    :func:`ea_mu_plus_lambda` and the :func:`ea_mu_comma_lambda` algorithms call
+    the operator with the offspring after the variation and with the **minimum**
+    number of offspring, which are required to select the survivors from. The
+    model predicts the fitness of the invalid offspring from an archive of
+    evaluated genomes and only the best **fraction** of them by the predicted
+    fitness are returned for the true evaluation, while the rest are discarded.
+    The offspring with a valid fitness are always returned. Multiple objectives
+    are ranked by the sum of their predicted weighted values.
+
+    The archive is refreshed incrementally: the offspring which were returned
+    by the previous call are added to the archive when they have been evaluated
+    and the model is refitted only when the archive has changed. Until the
+    archive contains **min_archive** genomes, all offspring are returned.
+    The genomes must be sequences of numbers of equal length.
+
+    :param model: The type of the model, either *'knn'* for an inverse distance
+        weighted k-nearest neighbors regression or *'rbf'* for a local radial
+        basis function interpolation, optional. The default value is *'knn'*.
+    :param fraction: The fraction of the invalid offspring to
+        return for evaluation, optional. The default value is 0.5.
+    :param neighbors: The number of nearest neighbors used by the model,
+        optional. The default value is 5.
+    :param min_archive: The minimum size of the archive for the
+        screening to take effect, optional. The default value is 20.
+    :param max_archive: The maximum size of the archive, optional. If the
+        archive is full, the oldest genomes are removed first.
+        By default, the size of the archive is not limited.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, model: Optional[str] = 'knn',
+                 fraction: Optional[float] = 0.5,
+                 neighbors: Optional[int] = 5,
+                 min_archive: Optional[int] = 20,
+                 max_archive: Optional[int] = None):
+        if model not in ('knn', 'rbf'):
+            raise ValueError(
+                f"The surrogate model must be either 'knn' or 'rbf', not '{model}'."
+            )
+        if not (0 < fraction <= 1):
+            raise ValueError("The fraction must be in the range of (0, 1].")
+        self.model = model
+        self.fraction = fraction
+        self.neighbors = neighbors
+        self.min_archive = min_archive
+        self.max_archive = max_archive
+        self.genomes = []
+        self.wvalues = []
+        self.pending = []
+        self.screened = 0
+        self.fields = ['screened', 'archive']
+        self._predictor = None
+
+    # -------------------------------------------------------- #
+    def __call__(self, offspring: list, minimum: Optional[int] = 0) -> list:
+        """
+        Returns the offspring which should be truly evaluated.
+
+        :param offspring: A list of individuals produced by the variation.
+        :param minimum: The minimum number of individuals to return, if enough
+            offspring are available, optional. The default value is 0.
+        :return: A list of the selected individuals.
+        """
+        self.update(self.pending)
+        invalids = [ind for ind in offspring if not ind.fitness.is_valid()]
+        keep = len(invalids)
+        if len(self.genomes) >= self.min_archive and invalids:
+            keep = max(math.ceil(len(invalids) * self.fraction), 1)
+            keep = min(max(keep, minimum - (len(offspring) - len(invalids))), len(invalids))
+
+        if keep < len(invalids):
+            scores = self.predict(invalids).sum(axis=1)
+            best = numpy.argsort(-scores, kind='stable')[:keep]
+            selected = {id(invalids[i]) for i in best}
+            self.screened += len(invalids) - keep
+            offspring = [
+                ind for ind in offspring
+                if ind.fitness.is_valid() or id(ind) in selected
+            ]
+        self.pending = [ind for ind in offspring if not ind.fitness.is_valid()]
+        return offspring
+
+    # -------------------------------------------------------- #
+    def update(self, individuals: Iterable) -> None:
+        """
+        Adds the evaluated **individuals** into the archive, e.g. the
+        initial population. Individuals with an invalid fitness are ignored.
+
+        :param individuals: The individuals to add into the archive.
+        :return: Nothing.
+        """
+        added = False
+        for ind in individuals:
+            if ind.fitness.is_valid():
+                self.genomes.append(numpy.asarray(ind, dtype=float))
+                self.wvalues.append(ind.fitness.wvalues)
+                added = True
+        if self.max_archive is not None and len(self.genomes) > self.max_archive:
+            del self.genomes[:-self.max_archive]
+            del self.wvalues[:-self.max_archive]
+        if added:
+            self._predictor = None
+
+    # -------------------------------------------------------- #
+    def predict(self, individuals: list) -> numpy.ndarray:
+        """
+        Predicts the weighted fitness values of the **individuals**.
+
+        :param individuals: The individuals to predict the fitness of.
+        :return: A 2-D array of shape *(n_individuals, n_objectives)*.
+        """
+        if not self.genomes:
+            raise RuntimeError("The archive of the surrogate model is empty.")
+        if self._predictor is None:
+            self._predictor = self._fit()
+        points = numpy.asarray([numpy.asarray(ind, dtype=float) for ind in individuals])
+        return self._predictor(points)
+
+    # -------------------------------------------------------- #
+    def compile(self, _: Iterable = None) -> dict:
+        """
+        Returns the number of discarded offspring and the size of the archive.
+        This method enables the surrogate object to be used as a member
+        of a MultiStatistics object.
+
+        :return: A dictionary of the 'screened' and 'archive' counters.
+        """
+        return dict(screened=self.screened, archive=len(self.genomes))
+
+    # -------------------------------------------------------- #
+    def _fit(self):
+        points = numpy.asarray(self.genomes)
+        values = numpy.asarray(self.wvalues, dtype=float)
+        neighbors = min(self.neighbors, len(points))
+
+        if self.model == 'rbf':
+            # a constant tail stays well-posed for the collinear
+            # neighborhoods, which are produced by blend crossovers
+            return RBFInterpolator(
+                points, values, neighbors=neighbors,
+                kernel='linear', degree=0, smoothing=1e-8
+            )
+
+        tree = cKDTree(points)
+
+        def knn(query: numpy.ndarray) -> numpy.ndarray:
+            dist, idx = tree.query(query, k=neighbors)
+            dist, idx = dist.reshape(len(query), -1), idx.reshape(len(query), -1)
+            weights = 1.0 / numpy.maximum(dist, 1e-12)
+            weights /= weights.sum(axis=1, keepdims=True)
+            return numpy.einsum('ij,ijk->ik', weights, values[idx])
+        return knn
@@ -0,0 +1,345 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.base import Toolbox, PopulationMatrix
+from typing import Callable, Iterable, Optional
+from .evaluation import evaluate_invalids, _not_worse
+import itertools
+import numpy
+import math
+
+
+__all__ = ['ParticleSwarm', 'MultiSwarm']
+
+
+# ====================================================================================== #
+class ParticleSwarm:
+    """
+    A particle swarm, which keeps the positions, the velocities and the personal
+    best positions of its particles in 2-D arrays of shape *(n_particles, n_dims)*.
+    The positions and the personal bests are stored in the *'particles'* and the
+    *'best'* :class:`PopulationMatrix` containers, so their fitness values are
+    arrays as well. The swarm is evolved by the :func:`ea_particle_swarm`
+    algorithm, which moves, evaluates and updates all the particles with
+    a handful of array operations per generation.
+
+    The velocities are updated either with the constriction factor of Clerc and
+    Kennedy, which is computed from **phi1** and **phi2**, or with an **inertia**
+    weight. The velocities are clamped to **max_speed** and the positions to the
+    **bounds** with :func:`numpy.clip`. The random numbers are drawn from the
+    global :mod:`numpy.random` state.
+
+    :param size: The number of particles.
+    :param dimensions: The number of dimensions of the search space.
+    :param bounds: A *(low, up)* tuple of numbers or sequences,
+        which bound the positions of the particles.
+    :param weights: The fitness weights of the particles.
+    :param topology: Either *'global'*, where each particle is guided by the best
+        position of the swarm, or *'ring'*, where it is guided by the best position
+        of its **neighbors** on each side, optional. The default value is *'global'*.
+    :param neighbors: The number of neighbors on each side of a particle
+        in the *'ring'* topology, optional. The default value is 1.
+    :param phi1: The acceleration coefficient of the personal
+        best positions, optional. The default value is 2.05.
+    :param phi2: The acceleration coefficient of the neighborhood
+        best positions, optional. The default value is 2.05.
+    :param inertia: The inertia weight of the velocities, optional.
+        By default, the constriction factor is used, which
+        requires the sum of **phi1** and **phi2** to exceed 4.
+    :param max_speed: The maximum absolute velocity in each dimension, optional.
+        By default, half of the width of the bounds is used.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, size: int, dimensions: int, bounds: tuple,
+                 weights: tuple, topology: Optional[str] = 'global',
+                 neighbors: Optional[int] = 1,
+                 phi1: Optional[float] = 2.05,
+                 phi2: Optional[float] = 2.05,
+                 inertia: Optional[float] = None,
+                 max_speed: Optional[float] = None):
+        if topology not in ('global', 'ring'):
+            raise ValueError(
+                f"The topology must be either 'global' or 'ring', not '{topology}'."
+            )
+        if inertia is None and phi1 + phi2 <= 4:
+            raise ValueError(
+                "The constriction factor requires the sum of phi1 and phi2 to exceed 4."
+            )
+        low, up = (numpy.broadcast_to(numpy.asarray(b, dtype=float), (dimensions,))
+                   for b in bounds)
+        self.bounds = (low, up)
+        self.topology = topology
+        self.neighbors = neighbors
+        self.phi1 = phi1
+        self.phi2 = phi2
+        self.inertia = inertia
+        self.max_speed = (up - low) / 2 if max_speed is None else max_speed
+
+        positions = numpy.random.uniform(low, up, (size, dimensions))
+        self.velocities = numpy.random.uniform(
+            -self.max_speed, self.max_speed, (size, dimensions)
+        )
+        self.particles = PopulationMatrix(positions, weights)
+        self.best = PopulationMatrix(positions, weights)
+
+    # -------------------------------------------------------- #
+    @property
+    def leader(self) -> Optional[numpy.ndarray]:
+        """
+        The best personal best position of the swarm as a row view with
+        a *'fitness'* attribute or None, if no particle has been evaluated.
+        """
+        index = self.best.rank()[0]
+        if not self.best.valid[index]:
+            return None
+        return self.best[index]
+
+    # -------------------------------------------------------- #
+    def move(self) -> None:
+        """
+        Updates the velocities and the positions of the particles and
+        invalidates their fitness. The particles are not moved until
+        all of them have a personal best position.
+
+        :return: Nothing.
+        """
+        if not self.best.valid.all():
+            return
+        positions = self.particles.genomes
+        shape = positions.shape
+        cognitive = numpy.random.uniform(0, self.phi1, shape) * (self.best.genomes - positions)
+        social = numpy.random.uniform(0, self.phi2, shape) * (self._guides() - positions)
+
+        if self.inertia is None:
+            phi = self.phi1 + self.phi2
+            chi = 2.0 / abs(2.0 - phi - math.sqrt(phi * phi - 4.0 * phi))
+            velocities = chi * (self.velocities + cognitive + social)
+        else:
+            velocities = self.inertia * self.velocities + cognitive + social
+
+        self.velocities = numpy.clip(velocities, -self.max_speed, self.max_speed)
+        self.particles.genomes = numpy.clip(positions + self.velocities, *self.bounds)
+        self.particles.invalidate()
+
+    # -------------------------------------------------------- #
+    def evaluate(self, toolbox: Toolbox) -> int:
+        """
+        Evaluates the particles which have an invalid fitness.
+
+        :param toolbox: A Toolbox which contains the evolution operators.
+        :return: The number of evaluated particles.
+        """
+        return evaluate_invalids(toolbox, self.particles)
+
+    # -------------------------------------------------------- #
+    def update(self) -> None:
+        """
+        Replaces the personal best positions, which are
+        worse than the current positions of the particles.
+
+        :return: Nothing.
+        """
+        improved = self.particles.valid & ~_not_worse(self.best.wvalues, self.particles.wvalues)
+        self.best.genomes[improved] = self.particles.genomes[improved]
+        self.best.wvalues[improved] = self.particles.wvalues[improved]
+
+    # -------------------------------------------------------- #
+    def convert(self, centre: Iterable, radius: float,
+                dist: Optional[str] = 'nuvd') -> None:
+        """
+        Converts the particles into quantum particles, which are placed
+        randomly into a cloud of the **radius** around the **centre**,
+        and forgets their personal best positions.
+
+        :param centre: The centre of the quantum cloud.
+        :param radius: The radius of the quantum cloud.
+        :param dist: The distribution of the particles in the cloud, which is either
+            *'gaussian'*, *'uvd'* or *'nuvd'*, optional. The default value is *'nuvd'*.
+        :return: Nothing.
+        """
+        size, dims = self.particles.genomes.shape
+        directions = numpy.random.normal(0, 1, (size, dims))
+        directions /= numpy.linalg.norm(directions, axis=1, keepdims=True)
+        if dist == 'gaussian':
+            scale = numpy.abs(numpy.random.normal(0, 1 / 3, (size, 1))) ** (1 / dims)
+        elif dist == 'uvd':
+            scale = numpy.random.random((size, 1)) ** (1 / dims)
+        elif dist == 'nuvd':
+            scale = numpy.abs(numpy.random.normal(0, 1 / 3, (size, 1)))
+        else:
+            raise ValueError(
+                f"The distribution must be 'gaussian', 'uvd' or 'nuvd', not '{dist}'."
+            )
+        self.particles.genomes = radius * directions * scale + numpy.asarray(centre)
+        self.particles.invalidate()
+        self.best.invalidate()
+
+    # -------------------------------------------------------- #
+    @property
+    def population(self) -> PopulationMatrix:
+        """
+        The particles of the swarm, which are recorded
+        into the hall of fame and the statistics.
+        """
+        return self.particles
+
+    # -------------------------------------------------------- #
+    def _guides(self) -> numpy.ndarray:
+        order = self.best.rank()
+        if self.topology == 'global':
+            return self.best.genomes[order[0]]
+        size = len(order)
+        position = numpy.empty(size, dtype=numpy.intp)
+        position[order] = numpy.arange(size)
+        offsets = numpy.arange(-self.neighbors, self.neighbors + 1)
+        hood = (numpy.arange(size)[:, None] + offsets) % size
+        winners = hood[numpy.arange(size), numpy.argmin(position[hood], axis=1)]
+        return self.best.genomes[winners]
+
+
+# ====================================================================================== #
+class MultiSwarm:
+    """
+    A multi-swarm for dynamic problems like the :class:`MovingPeaks`, which
+    implements the multi-quantum swarm optimization of Blackwell and Branke.
+    Before the evaluation, the leader of each swarm is re-evaluated and if its
+    fitness has changed, the particles of the swarm are converted into quantum
+    particles around the leader. After the evaluation, the worse one of two
+    swarms, whose leaders are closer than the exclusion radius, is reinitialized.
+    Before moving the particles, a new swarm is added if all the swarms have
+    converged and the worst swarm is removed if more than **excess** swarms
+    have not converged. The object can also be added into a MultiStatistics
+    object to record the number of swarms into the logbook.
+
+    :param factory: A function without arguments, which returns
+        a new :class:`ParticleSwarm`, e.g. a partial function.
+    :param swarms: The initial number of swarms, optional. The default value is 1.
+    :param excess: The maximum number of swarms which have
+        not converged, optional. The default value is 3.
+    :param radius: The radius of the quantum clouds, optional. The default value is 0.5.
+    :param dist: The distribution of the quantum particles,
+        optional. The default value is *'nuvd'*.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, factory: Callable, swarms: Optional[int] = 1,
+                 excess: Optional[int] = 3,
+                 radius: Optional[float] = 0.5,
+                 dist: Optional[str] = 'nuvd'):
+        self.factory = factory
+        self.excess = excess
+        self.radius = radius
+        self.dist = dist
+        self.swarms = [factory() for _ in range(swarms)]
+        self.fields = ['swarms']
+
+    # -------------------------------------------------------- #
+    def move(self) -> None:
+        """
+        Adds or removes a swarm depending on the convergence
+        of the swarms and moves the particles of each swarm.
+
+        :return: Nothing.
+        """
+        limit = 2 * self._exclusion_radius()
+        roaming = []
+        for index, swarm in enumerate(self.swarms):
+            positions = swarm.particles.genomes
+            deltas = positions[:, None, :] - positions[None, :, :]
+            if numpy.sqrt(numpy.square(deltas).sum(axis=2)).max() > limit:
+                roaming.append(index)
+
+        if not roaming:
+            self.swarms.append(self.factory())
+        elif len(roaming) > self.excess:
+            worst = min(roaming, key=lambda i: self._leader_key(self.swarms[i]))
+            self.swarms.pop(worst)
+
+        for swarm in self.swarms:
+            swarm.move()
+
+    # -------------------------------------------------------- #
+    def evaluate(self, toolbox: Toolbox) -> int:
+        """
+        Re-evaluates the leaders of the swarms to detect changes in the
+        fitness landscape and evaluates the particles of the swarms.
+
+        :param toolbox: A Toolbox which contains the evolution operators.
+        :return: The number of evaluations.
+        """
+        nevals = 0
+        for swarm in self.swarms:
+            leader = swarm.leader
+            if leader is None:
+                continue
+            probe = PopulationMatrix([leader], swarm.best.weights)
+            nevals += evaluate_invalids(toolbox, probe)
+            if probe[0].fitness.wvalues != leader.fitness.wvalues:
+                swarm.convert(numpy.array(leader), self.radius, self.dist)
+        for swarm in self.swarms:
+            nevals += swarm.evaluate(toolbox)
+        return nevals
+
+    # -------------------------------------------------------- #
+    def update(self) -> None:
+        """
+        Updates the personal best positions of the particles and reinitializes
+        the worse swarm of each pair, whose leaders are too close.
+
+        :return: Nothing.
+        """
+        for swarm in self.swarms:
+            swarm.update()
+
+        radius = self._exclusion_radius()
+        excluded = set()
+        for i, j in itertools.combinations(range(len(self.swarms)), 2):
+            if i in excluded or j in excluded:
+                continue
+            first, second = self.swarms[i].leader, self.swarms[j].leader
+            if first is None or second is None:
+                continue
+            if numpy.linalg.norm(first - second) < radius:
+                excluded.add(i if first.fitness <= second.fitness else j)
+        for index in excluded:
+            self.swarms[index] = self.factory()
+
+    # -------------------------------------------------------- #
+    @property
+    def population(self) -> PopulationMatrix:
+        """
+        The particles of all the swarms, which are recorded
+        into the hall of fame and the statistics.
+        """
+        population = self.swarms[0].particles
+        for swarm in self.swarms[1:]:
+            population = population + swarm.particles
+        return population
+
+    # -------------------------------------------------------- #
+    def compile(self, _: Iterable = None) -> dict:
+        """
+        Returns the number of swarms. This method enables the multi-swarm
+        object to be used as a member of a MultiStatistics object.
+
+        :return: A dictionary of the 'swarms' counter.
+        """
+        return dict(swarms=len(self.swarms))
+
+    # -------------------------------------------------------- #
+    def _exclusion_radius(self) -> float:
+        low, up = self.swarms[0].bounds
+        dims = len(low)
+        return float(numpy.mean(up - low)) / (2 * len(self.swarms) ** (1 / dims))
+
+    # -------------------------------------------------------- #
+    @staticmethod
+    def _leader_key(swarm: ParticleSwarm) -> tuple:
+        leader = swarm.leader
+        return leader.fitness.wvalues if leader is not None else tuple()
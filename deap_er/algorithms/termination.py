@@ -0,0 +1,212 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+from deap_er.records.dtypes import *
+from .state import GenerationState
+from typing import Callable, Optional
+from operator import mul
+import numpy
+import abc
+
+
+__all__ = [
+    'Termination', 'AnyOf', 'MaxEvaluations', 'MaxTime',
+    'Stagnation', 'TargetFitness', 'DiversityCollapse'
+]
+
+
+# ====================================================================================== #
+class Termination(abc.ABC):
+    """
+    Abstract base class of the termination criteria, which can be passed into
+    the algorithms with the **terminate** argument. A criterion is called with
+    the :class:`GenerationState` after each generation and it returns the reason
+    of the termination or None, if the evolution should continue. The reason
+    is recorded into the last logbook entry under the *'stop'* key. Criteria
+    can be combined with the *'|'* operator into an :class:`AnyOf` criterion.
+    """
+    # -------------------------------------------------------- #
+    reason: str = 'terminated'
+
+    # -------------------------------------------------------- #
+    @abc.abstractmethod
+    def check(self, state: GenerationState) -> bool:
+        """
+        Checks whether the evolution should be terminated.
+
+        :param state: The state of the algorithm after a generation.
+        :return: True if the evolution should be terminated.
+        """
+        raise NotImplementedError
+
+    # -------------------------------------------------------- #
+    def __call__(self, state: GenerationState) -> Optional[str]:
+        return self.reason if self.check(state) else None
+
+    def __or__(self, other: Termination) -> AnyOf:
+        return AnyOf(self, other)
+
+
+# ====================================================================================== #
+class AnyOf(Termination):
+    """
+    Terminates the evolution when any of the **criteria** is met. All the
+    criteria are checked in each generation, so that the stateful criteria
+    stay up to date, and the reason of the first met criterion is returned.
+
+    :param criteria: The termination criteria to combine.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, *criteria: Termination):
+        self.criteria = list()
+        for criterion in criteria:
+            if isinstance(criterion, AnyOf):
+                self.criteria.extend(criterion.criteria)
+            else:
+                self.criteria.append(criterion)
+
+    # -------------------------------------------------------- #
+    def check(self, state: GenerationState) -> bool:
+        return self(state) is not None
+
+    def __call__(self, state: GenerationState) -> Optional[str]:
+        reasons = [criterion(state) for criterion in self.criteria]
+        for reason in reasons:
+            if reason is not None:
+                return reason
+        return None
+
+
+# ====================================================================================== #
+class MaxEvaluations(Termination):
+    """
+    Terminates the evolution when the total number of
+    evaluations has reached the **evaluations** budget.
+
+    :param evaluations: The maximum number of evaluations.
+    """
+    reason = 'max_evaluations'
+
+    # -------------------------------------------------------- #
+    def __init__(self, evaluations: int):
+        self.evaluations = evaluations
+
+    # -------------------------------------------------------- #
+    def check(self, state: GenerationState) -> bool:
+        return state.evals >= self.evaluations
+
+
+# ====================================================================================== #
+class MaxTime(Termination):
+    """
+    Terminates the evolution when the wall-clock time since the
+    start of the algorithm has reached the **seconds** budget.
+
+    :param seconds: The maximum running time in seconds.
+    """
+    reason = 'max_time'
+
+    # -------------------------------------------------------- #
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    # -------------------------------------------------------- #
+    def check(self, state: GenerationState) -> bool:
+        return state.elapsed >= self.seconds
+
+
+# ====================================================================================== #
+class Stagnation(Termination):
+    """
+    Terminates the evolution when the contents of the **hof** have
+    not improved for the given number of **generations**. The **hof**
+    must be the same object that is passed into the algorithm.
+
+    :param hof: A HallOfFame or a ParetoFront object.
+    :param generations: The number of generations without improvement.
+
+    :type hof: :ref:`Hof <datatypes>`
+    """
+    reason = 'stagnation'
+
+    # -------------------------------------------------------- #
+    def __init__(self, hof: Hof, generations: int):
+        self.hof = hof
+        self.generations = generations
+        self.best = None
+        self.stalled = 0
+
+    # -------------------------------------------------------- #
+    def check(self, state: GenerationState) -> bool:
+        best = tuple(ind.fitness.wvalues for ind in self.hof)
+        if best == self.best:
+            self.stalled += 1
+        else:
+            self.best = best
+            self.stalled = 0
+        return self.stalled >= self.generations
+
+
+# ====================================================================================== #
+class TargetFitness(Termination):
+    """
+    Terminates the evolution when the fitness of any individual of the
+    population, or of the **hof** if provided, is equal to or better
+    than the **target** in all objectives according to the weights.
+
+    :param target: The target fitness values.
+    :param hof: A HallOfFame or a ParetoFront object, optional.
+
+    :type hof: :ref:`Hof <datatypes>`
+    """
+    reason = 'target_fitness'
+
+    # -------------------------------------------------------- #
+    def __init__(self, target: tuple, hof: Hof = None):
+        self.target = tuple(target)
+        self.hof = hof
+
+    # -------------------------------------------------------- #
+    def check(self, state: GenerationState) -> bool:
+        individuals = state.population if self.hof is None else self.hof
+        for ind in individuals:
+            if not ind.fitness.is_valid():
+                continue
+            target = map(mul, self.target, ind.fitness.weights)
+            if all(a >= b for a, b in zip(ind.fitness.wvalues, target)):
+                return True
+        return False
+
+
+# ====================================================================================== #
+class DiversityCollapse(Termination):
+    """
+    Terminates the evolution when the diversity of the population drops below
+    the **threshold**. The diversity is the mean of the standard deviations of
+    the values returned by the **key** for each individual. By default, the
+    genes of the individuals are used, which requires numeric genomes.
+
+    :param threshold: The minimum allowed diversity.
+    :param key: A function that returns a sequence of numbers
+        for an individual, optional.
+    """
+    reason = 'diversity_collapse'
+
+    # -------------------------------------------------------- #
+    def __init__(self, threshold: float, key: Callable = None):
+        self.threshold = threshold
+        self.key = key if key else lambda ind: ind
+
+    # -------------------------------------------------------- #
+    def check(self, state: GenerationState) -> bool:
+        values = numpy.asarray([self.key(ind) for ind in state.population], dtype=float)
+        diversity = float(numpy.mean(numpy.std(values, axis=0)))
+        return diversity < self.threshold
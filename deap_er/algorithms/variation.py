@@ -10,14 +10,15 @@
 #
 from deap_er.base import Toolbox
 import random
+import numpy
 
 
-__all__ = ['var_and', 'var_or']
+__all__ = ['var_and', 'var_or', 'var_and_matrix', 'var_or_matrix']
 
 
 # ====================================================================================== #
-def var_and(toolbox: Toolbox, population: list,
-            cx_prob: float, mut_prob: float) -> list:
+def var_and(toolbox: Toolbox, population: list, cx_prob: float,
+            mut_prob: float, lazy_clone: bool = False) -> list:
     """
     A subcomponent for evolutionary algorithms, which mates AND
     mutates each individual in the given population according to the
@@ -25,10 +26,18 @@ def var_and(toolbox: Toolbox, population: list,
     the range of [0, 1]. The returned population is independent of
     the input population and has their fitness invalidated.
 
+    If **lazy_clone** is True, the individuals are cloned only right before
+    they are mated or mutated, so the unmodified offspring are the same
+    objects as their parents. This avoids cloning a large fraction of
+    the population, but the unmodified offspring must then not be
+    modified in-place outside the variation operators.
+
     :param toolbox: A Toolbox which contains the evolution operators.
     :param population: A list of individuals to evolve.
     :param cx_prob: The probability of mating two individuals.
     :param mut_prob: The probability of mutating an individual.
+    :param lazy_clone: Whether to clone only the modified
+        individuals, optional. The default value is False.
     :return: A list of evolved individuals.
     """
     err = "The {0} probability must be in the range of [0, 1]."
@@ -37,15 +46,28 @@ def var_and(toolbox: Toolbox, population: list,
     if not (0 <= mut_prob <= 1):
         raise ValueError(err.format("mutation"))
 
-    offspring = [toolbox.clone(ind) for ind in population]
+    if lazy_clone:
+        offspring = list(population)
+        cloned = [False] * len(offspring)
+    else:
+        offspring = [toolbox.clone(ind) for ind in population]
+        cloned = [True] * len(offspring)
+
+    def _own(index: int) -> None:
+        if not cloned[index]:
+            offspring[index] = toolbox.clone(offspring[index])
+            cloned[index] = True
 
     for i in range(1, len(offspring), 2):
         if random.random() < cx_prob:
+            _own(i - 1)
+            _own(i)
             offspring[i - 1], offspring[i] = toolbox.mate(offspring[i - 1], offspring[i])
             del offspring[i - 1].fitness.values, offspring[i].fitness.values
 
     for i in range(len(offspring)):
         if random.random() < mut_prob:
+            _own(i)
             offspring[i], = toolbox.mutate(offspring[i])  # don't remove the comma!
             del offspring[i].fitness.values
 
@@ -93,3 +115,97 @@ def var_or(toolbox: Toolbox, population: list, offsprings: int,
             offspring.append(random.choice(population))
 
     return offspring
+
+
+# -------------------------------------------------------------------------------------- #
+def var_and_matrix(toolbox: Toolbox, genomes: numpy.ndarray, cx_prob: float,
+                   mut_prob: float) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    The vectorized equivalent of the :func:`var_and` function for populations
+    stored as a 2-D array with one genome per row. The crossover and mutation
+    masks are drawn with single numpy calls and the vectorized *'mate_batch'*
+    and *'mutate_batch'* operators of the **toolbox** are applied once to all
+    the selected rows, for example the :func:`cx_blend_batch` and the
+    :func:`mut_gaussian_batch` operators. The *'mate_batch'* operator
+    receives two matrices of parents and returns two matrices of
+    children, while the *'mutate_batch'* operator receives and
+    returns a single matrix of genomes.
+
+    :param toolbox: A Toolbox which contains the vectorized evolution operators.
+    :param genomes: A 2-D array of genomes to evolve.
+    :param cx_prob: The probability of mating two genomes.
+    :param mut_prob: The probability of mutating a genome.
+    :return: The evolved genome matrix, which is independent of the input matrix,
+        and an array of the row indices of the parents of the unmodified rows,
+        where the rows that must be re-evaluated have the value of -1.
+    """
+    err = "The {0} probability must be in the range of [0, 1]."
+    if not (0 <= cx_prob <= 1):
+        raise ValueError(err.format("crossover"))
+    if not (0 <= mut_prob <= 1):
+        raise ValueError(err.format("mutation"))
+
+    offspring = numpy.array(genomes, copy=True)
+    rows = len(offspring)
+    modified = numpy.zeros(rows, dtype=bool)
+
+    pairs = numpy.flatnonzero(numpy.random.random(rows // 2) < cx_prob) * 2
+    if pairs.size:
+        children = toolbox.mate_batch(offspring[pairs], offspring[pairs + 1])
+        offspring[pairs], offspring[pairs + 1] = children
+        modified[pairs] = modified[pairs + 1] = True
+
+    mutants = numpy.random.random(rows) < mut_prob
+    if mutants.any():
+        offspring[mutants] = toolbox.mutate_batch(offspring[mutants])
+        modified |= mutants
+
+    origin = numpy.where(modified, -1, numpy.arange(rows))
+    return offspring, origin
+
+
+# -------------------------------------------------------------------------------------- #
+def var_or_matrix(toolbox: Toolbox, genomes: numpy.ndarray, offsprings: int,
+                  cx_prob: float, mut_prob: float) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    The vectorized equivalent of the :func:`var_or` function for populations
+    stored as a 2-D array with one genome per row. The operator choices and
+    the parents are drawn as index arrays with single numpy calls and the
+    vectorized *'mate_batch'* and *'mutate_batch'* operators of the **toolbox**
+    are applied once to all the selected rows. Only the first child of
+    each mating is kept, like in the :func:`var_or` function.
+
+    :param toolbox: A Toolbox which contains the vectorized evolution operators.
+    :param genomes: A 2-D array of genomes to evolve.
+    :param offsprings: The number of genomes to produce.
+    :param cx_prob: The probability of mating two genomes.
+    :param mut_prob: The probability of mutating a genome.
+    :return: The evolved genome matrix, which is independent of the input matrix,
+        and an array of the row indices of the parents of the reproduced rows,
+        where the rows that must be re-evaluated have the value of -1.
+    """
+    evolve_prob = cx_prob + mut_prob
+    if evolve_prob > 1.0:
+        raise ValueError(
+            "The sum of the crossover and the mutation "
+            "probabilities must be in the range of [0, 1]."
+        )
+
+    rows = len(genomes)
+    op_choice = numpy.random.random(offsprings)
+    parents = numpy.random.randint(0, rows, size=offsprings)
+    offspring = genomes[parents]
+
+    mates = numpy.flatnonzero(op_choice < cx_prob)
+    if mates.size:
+        # draw the second parents so that they differ from the first parents
+        others = (parents[mates] + numpy.random.randint(1, rows, size=mates.size)) % rows
+        children, _ = toolbox.mate_batch(offspring[mates], genomes[others])
+        offspring[mates] = children
+
+    mutants = (op_choice >= cx_prob) & (op_choice < evolve_prob)
+    if mutants.any():
+        offspring[mutants] = toolbox.mutate_batch(offspring[mutants])
+
+    origin = numpy.where(op_choice < evolve_prob, -1, parents)
+    return offspring, origin
@@ -10,3 +10,9 @@
 #
 from .toolbox import *
 from .fitness import *
+from .shared_map import *
+from .distributed_map import *
+from .fault_tolerant_map import *
+from .rng import *
+from .population_matrix import *
+from .cloning import *
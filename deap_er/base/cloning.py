@@ -0,0 +1,138 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from typing import Any, Callable, Optional
+from functools import lru_cache
+from copy import deepcopy
+import array
+import numpy
+
+
+__all__ = ['clone', 'register_cloner']
+
+
+_ATOMIC_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None)})
+_GENOME_COPIERS = dict()
+
+
+# ====================================================================================== #
+def clone(obj: Any) -> Any:
+    """
+    Clones the **obj**. The classes created with the :func:`creator.create`
+    function provide a specialized *'__copy_individual__'* method, if a genome
+    copier is registered for their base type, which copies the genome with a
+    buffer copy, copies the fitness with its own *'__deepcopy__'* method and
+    deep-copies only the other attributes. All the other objects are cloned
+    with :func:`copy.deepcopy`. This is the default *'clone'* operator
+    of the Toolbox.
+
+    :param obj: The individual or the object to clone.
+    :return: A clone of the **obj**.
+    """
+    copier = getattr(obj, '__copy_individual__', None)
+    if copier is None:
+        return deepcopy(obj)
+    return copier()
+
+
+# -------------------------------------------------------------------------------------- #
+def register_cloner(base: type, copier: Callable) -> None:
+    """
+    Registers a genome **copier** for the **base** type. The copier receives an
+    individual and returns a new instance of the same class, which contains a
+    copy of the genome without the instance attributes, or None, if the genome
+    can't be copied in a specialized way. The copier is used by the classes,
+    which are created with the :func:`creator.create` function afterwards.
+
+    :param base: The base type of the individuals.
+    :param copier: The genome copier of the **base** type.
+    :return: Nothing.
+    """
+    _GENOME_COPIERS[base] = copier
+
+
+# -------------------------------------------------------------------------------------- #
+def _specialize(cls: type) -> Optional[Callable]:
+    copy_genome = None
+    for klass in cls.__mro__:
+        if klass in _GENOME_COPIERS:
+            copy_genome = _GENOME_COPIERS[klass]
+            break
+        if '__deepcopy__' in vars(klass):
+            return None
+    if copy_genome is None:
+        return None
+
+    def __copy_individual__(self):
+        copy = copy_genome(self)
+        if copy is None:
+            return deepcopy(self)
+        memo = {id(self): copy}
+        for key, value in _get_state(self).items():
+            if key == 'fitness' and hasattr(value, '__deepcopy__'):
+                setattr(copy, key, value.__deepcopy__(memo))
+            else:
+                setattr(copy, key, deepcopy(value, memo))
+        return copy
+    return __copy_individual__
+
+
+# -------------------------------------------------------------------------------------- #
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> tuple:
+    names = list()
+    for klass in cls.__mro__:
+        slots = vars(klass).get('__slots__', ())
+        slots = (slots,) if isinstance(slots, str) else slots
+        names.extend(n for n in slots if n not in ('__dict__', '__weakref__'))
+    return tuple(names)
+
+
+# -------------------------------------------------------------------------------------- #
+def _get_state(obj: Any) -> dict:
+    state = dict(getattr(obj, '__dict__', ()))
+    for name in _slot_names(type(obj)):
+        if hasattr(obj, name):
+            state[name] = getattr(obj, name)
+    return state
+
+
+# -------------------------------------------------------------------------------------- #
+def _set_state(obj: Any, state: dict) -> None:
+    for key, value in state.items():
+        setattr(obj, key, value)
+
+
+# -------------------------------------------------------------------------------------- #
+def _copy_list(individual: list) -> Optional[list]:
+    if not _ATOMIC_TYPES.issuperset(map(type, individual)):
+        return None
+    copy = individual.__class__.__new__(individual.__class__)
+    list.extend(copy, individual)
+    return copy
+
+
+# -------------------------------------------------------------------------------------- #
+def _copy_array(individual: array.array) -> array.array:
+    copy = individual.__class__.__new__(individual.__class__, ())
+    array.array.extend(copy, individual)
+    return copy
+
+
+# -------------------------------------------------------------------------------------- #
+def _copy_ndarray(individual: numpy.ndarray) -> Optional[numpy.ndarray]:
+    if individual.dtype.hasobject:
+        return None
+    return numpy.ndarray.copy(individual)
+
+
+register_cloner(list, _copy_list)
+register_cloner(array.array, _copy_array)
+register_cloner(numpy.ndarray, _copy_ndarray)
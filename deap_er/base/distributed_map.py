@@ -0,0 +1,207 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from multiprocessing.connection import Listener, Connection
+from multiprocessing import AuthenticationError
+from typing import Callable, Iterable, Optional, Union
+import traceback
+import threading
+import socket
+import queue
+import math
+import dill
+
+
+__all__ = ['DistributedMap']
+
+
+# ====================================================================================== #
+class _Job:
+    """
+    Private helper which collects the results of the batches of a single map call.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, func: Callable, items: list):
+        self.payload = dill.dumps(func)
+        self.results = [None] * len(items)
+        self.remaining = 0
+        self.error = None
+        self.done = threading.Condition()
+
+    # -------------------------------------------------------- #
+    def complete(self, start: int, results: Optional[list],
+                 error: Optional[str] = None) -> None:
+        with self.done:
+            if error is not None:
+                self.error = self.error or error
+            else:
+                self.results[start:start + len(results)] = results
+            self.remaining -= 1
+            self.done.notify_all()
+
+
+# ====================================================================================== #
+class DistributedMap:
+    """
+    A distributed replacement for the builtin *'map'* function, which can be
+    registered into the toolbox as the *'map'* operator. The object acts as a
+    coordinator, which listens on the **address** for standalone worker
+    processes and serves them the evaluation tasks in batches. The workers
+    are started on any host with the :code:`python -m deap_er.worker`
+    command and they can join or leave at any time during the evolution.
+    The batches of a worker which disconnects or crashes are reassigned
+    to the remaining workers. A call blocks until all the items have been
+    processed, so it waits for the first worker to join, if necessary.
+
+    The functions are serialized with the *dill* library and the items
+    with *pickle*, so the modules which define them must be importable
+    by the workers. All messages are authenticated with the **authkey**.
+
+    :param address: A *(host, port)* tuple of a TCP socket or a path of a Unix
+        socket to listen on. The port 0 selects a free port, which is then
+        available from the **address** attribute.
+    :param authkey: The secret key, which the workers must know to connect.
+    :param batch_size: The number of items to send to a worker in a single task,
+        optional. By default, the items are split into four tasks per worker.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, address: Union[tuple, str], authkey: bytes,
+                 batch_size: Optional[int] = None):
+        self.authkey = authkey
+        self.batch_size = batch_size
+        self.listener = Listener(address, authkey=authkey)
+        self.address = self.listener.address
+        self.tasks = queue.Queue()
+        self.workers = 0
+        self.closed = False
+        self._lock = threading.Lock()
+        self._threads = []
+        self._acceptor = threading.Thread(target=self._accept, daemon=True)
+        self._acceptor.start()
+
+    # -------------------------------------------------------- #
+    def __call__(self, func: Callable, iterable: Iterable) -> list:
+        """
+        Applies the **func** to each item of the **iterable** in the workers.
+
+        :param func: The function to apply to each item.
+        :param iterable: The items to process.
+        :raises RuntimeError: If the function raised an error in a worker.
+        :return: A list of results in the order of the items.
+        """
+        if self.closed:
+            raise RuntimeError("The distributed map has been closed.")
+        items = list(iterable)
+        if not items:
+            return []
+
+        batch_size = self.batch_size
+        if batch_size is None:
+            batch_size = math.ceil(len(items) / (max(self.workers, 1) * 4))
+
+        job = _Job(func, items)
+        starts = range(0, len(items), batch_size)
+        job.remaining = len(starts)
+        for start in starts:
+            self.tasks.put((job, start, items[start:start + batch_size]))
+
+        with job.done:
+            job.done.wait_for(lambda: job.remaining == 0)
+        if job.error is not None:
+            raise RuntimeError(
+                f"The evaluation failed in a distributed worker:\n{job.error}"
+            )
+        return job.results
+
+    # -------------------------------------------------------- #
+    def close(self) -> None:
+        """
+        Stops listening for new workers and tells the connected
+        workers to shut down after they have completed their tasks.
+
+        :return: Nothing.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self._wake_acceptor()
+        self._acceptor.join()
+        self.listener.close()
+        with self._lock:
+            threads = list(self._threads)
+        for _ in threads:
+            self.tasks.put(None)
+        for thread in threads:
+            thread.join()
+
+    # -------------------------------------------------------- #
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    # -------------------------------------------------------- #
+    def _wake_acceptor(self) -> None:
+        # a raw connection fails the handshake without blocking
+        family = socket.AF_UNIX if isinstance(self.address, str) else socket.AF_INET
+        try:
+            with socket.socket(family) as sock:
+                sock.connect(self.address)
+        except OSError:  # pragma: no cover
+            pass
+
+    # -------------------------------------------------------- #
+    def _accept(self) -> None:
+        while not self.closed:
+            try:
+                conn = self.listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                continue
+            if self.closed:
+                conn.send(None)
+                conn.close()
+                break
+            thread = threading.Thread(target=self._serve, args=(conn,), daemon=True)
+            with self._lock:
+                self._threads.append(thread)
+            thread.start()
+
+    # -------------------------------------------------------- #
+    def _serve(self, conn: Connection) -> None:
+        with self._lock:
+            self.workers += 1
+        try:
+            while True:
+                task = self.tasks.get()
+                if task is None:
+                    conn.send(None)
+                    return
+                job, start, items = task
+                try:
+                    conn.send((job.payload, items))
+                    status, value = conn.recv()
+                except (EOFError, OSError):
+                    self.tasks.put(task)  # reassigned to another worker
+                    return
+                except Exception:
+                    job.complete(start, None, traceback.format_exc())
+                    continue
+                if status == 'ok':
+                    job.complete(start, value)
+                else:
+                    job.complete(start, None, value)
+        except (EOFError, OSError):
+            return
+        finally:
+            conn.close()
+            with self._lock:
+                self.workers -= 1
+                self._threads.remove(threading.current_thread())
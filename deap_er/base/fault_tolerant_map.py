@@ -0,0 +1,231 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from multiprocessing.connection import Connection, wait
+from collections import deque
+from typing import Callable, Iterable, Optional
+import multiprocessing
+import traceback
+import time
+import os
+
+
+__all__ = ['FaultTolerantMap']
+
+
+# ====================================================================================== #
+class _Worker:
+    """
+    Private helper which owns a single worker process and its pipe.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_worker_loop, args=(child_conn,), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+        self.index = None
+        self.deadline = None
+
+    # -------------------------------------------------------- #
+    def submit(self, func: Callable, index: int, item: object,
+               timeout: Optional[float]) -> None:
+        self.conn.send((func, item))
+        self.tasks += 1
+        self.index = index
+        if timeout is not None:
+            self.deadline = time.monotonic() + timeout
+
+    # -------------------------------------------------------- #
+    def stop(self, kill: bool = False) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:  # pragma: no cover
+                pass
+        self.process.join()
+        self.conn.close()
+
+
+# ====================================================================================== #
+class FaultTolerantMap:
+    """
+    A parallel replacement for the builtin *'map'* function, which can be
+    registered into the toolbox as the *'map'* operator. Each item is evaluated
+    in its own task by a pool of worker processes. A task which exceeds the
+    **timeout** is aborted by killing its worker, which is then replaced
+    with a new one. Tasks which time out, raise an error or crash their
+    worker are retried up to **retries** times. If all the attempts fail,
+    the **penalty** is returned as the result of the item. The workers are
+    also replaced after **max_tasks** tasks to contain memory leaks.
+
+    The object can also be added into a MultiStatistics object
+    to record the failure counters into the logbook.
+
+    :param processes: The number of worker processes, optional.
+        By default, the number of CPUs in the system is used.
+    :param timeout: The maximum number of seconds an evaluation may take,
+        optional. By default, the evaluations are not timed out.
+    :param retries: The number of times a failed evaluation
+        is retried, optional. The default value is 0.
+    :param max_tasks: The number of tasks after which a worker
+        is replaced, optional. By default, the workers live
+        until the map is closed.
+    :param penalty: The result of an evaluation, which has failed all
+        the attempts, optional. By default, a RuntimeError is raised.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, processes: Optional[int] = None,
+                 timeout: Optional[float] = None,
+                 retries: Optional[int] = 0,
+                 max_tasks: Optional[int] = None,
+                 penalty: Optional[tuple] = None):
+        self.processes = processes or os.cpu_count() or 1
+        self.timeout = timeout
+        self.retries = retries
+        self.max_tasks = max_tasks
+        self.penalty = penalty
+        self.timeouts = 0
+        self.errors = 0
+        self.retried = 0
+        self.penalized = 0
+        self.fields = ['timeouts', 'errors', 'retries', 'penalties']
+        self.workers = [_Worker() for _ in range(self.processes)]
+
+    # -------------------------------------------------------- #
+    def __call__(self, func: Callable, iterable: Iterable) -> list:
+        """
+        Applies the **func** to each item of the **iterable** in the workers.
+
+        :param func: The function to apply to each item.
+        :param iterable: The items to process.
+        :raises RuntimeError: If an evaluation failed all the
+            attempts and no penalty has been provided.
+        :return: A list of results in the order of the items.
+        """
+        items = list(iterable)
+        results = [None] * len(items)
+        attempts = [0] * len(items)
+        pending = deque(range(len(items)))
+
+        def _failed(index: int, reason: str) -> None:
+            attempts[index] += 1
+            if attempts[index] <= self.retries:
+                self.retried += 1
+                pending.append(index)
+                return
+            self.penalized += 1
+            if self.penalty is None:
+                self._reset()
+                raise RuntimeError(
+                    f"The evaluation of the item at index {index} "
+                    f"failed {attempts[index]} time(s):\n{reason}"
+                )
+            results[index] = self.penalty
+
+        while True:
+            for worker in self.workers:
+                if worker.index is None and pending:
+                    index = pending.popleft()
+                    worker.submit(func, index, items[index], self.timeout)
+            busy = [w for w in self.workers if w.index is not None]
+            if not busy:
+                return results
+
+            timeout = None
+            if self.timeout is not None:
+                timeout = max(min(w.deadline for w in busy) - time.monotonic(), 0)
+            ready = wait([w.conn for w in busy], timeout)
+
+            for worker in busy:
+                index = worker.index
+                if worker.conn in ready:
+                    try:
+                        success, value = worker.conn.recv()
+                    except (EOFError, OSError):
+                        self.errors += 1
+                        self._replace(worker, kill=True)
+                        _failed(index, "The worker process has crashed.")
+                        continue
+                    worker.index = None
+                    if self.max_tasks and worker.tasks >= self.max_tasks:
+                        self._replace(worker)
+                    if success:
+                        results[index] = value
+                    else:
+                        self.errors += 1
+                        _failed(index, value)
+                elif self.timeout is not None and time.monotonic() >= worker.deadline:
+                    self.timeouts += 1
+                    self._replace(worker, kill=True)
+                    _failed(index, f"The evaluation timed out after {self.timeout} seconds.")
+
+    # -------------------------------------------------------- #
+    def compile(self, _: Iterable = None) -> dict:
+        """
+        Returns the current failure counters. This method enables the map
+        object to be used as a member of a MultiStatistics object.
+
+        :return: A dictionary of the 'timeouts', 'errors',
+            'retries' and 'penalties' counters.
+        """
+        return dict(
+            timeouts=self.timeouts,
+            errors=self.errors,
+            retries=self.retried,
+            penalties=self.penalized
+        )
+
+    # -------------------------------------------------------- #
+    def close(self) -> None:
+        """
+        Stops the worker processes.
+
+        :return: Nothing.
+        """
+        for worker in self.workers:
+            worker.stop(kill=worker.index is not None)
+        self.workers = []
+
+    # -------------------------------------------------------- #
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    # -------------------------------------------------------- #
+    def _replace(self, worker: _Worker, kill: bool = False) -> None:
+        worker.stop(kill)
+        self.workers[self.workers.index(worker)] = _Worker()
+
+    # -------------------------------------------------------- #
+    def _reset(self) -> None:
+        for worker in list(self.workers):
+            if worker.index is not None:
+                self._replace(worker, kill=True)
+
+
+# -------------------------------------------------------------------------------------- #
+def _worker_loop(conn: Connection) -> None:
+    while True:
+        task = conn.recv()
+        if task is None:
+            return
+        func, item = task
+        try:
+            conn.send((True, func(item)))
+        except Exception:
+            conn.send((False, traceback.format_exc()))
@@ -14,7 +14,7 @@ from operator import mul, truediv
 from .dtypes import NumOrSeq
 
 
-__all__ = ['Fitness']
+__all__ = ['Fitness', 'SlottedFitness']
 
 
 # ====================================================================================== #
@@ -160,3 +160,109 @@ class Fitness:
         copy = self.__class__()
         copy.wvalues = self.wvalues
         return copy
+
+
+# ====================================================================================== #
+class SlottedFitness:
+    """
+    A memory-efficient variant of the :class:`Fitness` class, which has the same
+    interface and can be used as the base class in :func:`creator.create`. The
+    instances store the weighted and the unweighted values in *'__slots__'*
+    instead of an instance dictionary and the unweighted values are computed
+    only once, when the values are assigned, so the *'values'* property
+    returns a cached tuple. The *'crowding_dist'* attribute, which is assigned
+    by the :func:`assign_crowding_dist` function, has its own slot. The class
+    is not a subclass of Fitness.
+
+    :param values: The values of the fitness object, optional.
+    :type values: :ref:`SeqOfNum <datatypes>`
+    """
+    __slots__ = ('_wvalues', '_values', 'crowding_dist')
+
+    # -------------------------------------------------------- #
+    weights: tuple = tuple()
+    """
+    The weights are used to compare the fitness of different individuals.
+    They are shared between all individuals of the same type.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, values: NumOrSeq = None):
+        if not self.weights:
+            raise TypeError(
+                "Can't instantiate 'SlottedFitness', when class "
+                "attribute 'weights' tuple is not set."
+            )
+        self._wvalues = tuple()
+        self._values = tuple()
+        if values:
+            self.values = values
+
+    # -------------------------------------------------------- #
+    @property
+    def values(self) -> Iterable[float]:
+        """
+        Fitness values of the individual. The setter accepts either
+        a number or a sequence of numbers as input. The getter returns
+        the cached tuple and the deleter invalidates the fitness.
+        """
+        return self._values
+
+    @values.setter
+    def values(self, values: NumOrSeq) -> None:
+        if not isinstance(values, Iterable):
+            values = (float(values),)
+        if len(values) != len(self.weights):
+            raise TypeError(
+                "The assigned values must have the same length as "
+                "the 'weights' attribute of the 'Fitness' class."
+            )
+        self.wvalues = map(mul, values, self.weights)
+
+    @values.deleter
+    def values(self) -> None:
+        self._wvalues = tuple()
+        self._values = tuple()
+
+    # -------------------------------------------------------- #
+    @property
+    def wvalues(self) -> tuple:
+        """
+        Contains the weighted values of the fitness. Assigning
+        the weighted values also updates the cached values.
+        """
+        return self._wvalues
+
+    @wvalues.setter
+    def wvalues(self, wvalues: tuple) -> None:
+        self._wvalues = tuple(wvalues)
+        self._values = tuple(map(truediv, self._wvalues, self.weights))
+
+    # -------------------------------------------------------- #
+    def is_valid(self) -> bool:
+        """
+        A SlottedFitness instance is valid when the length of its
+        weighted values is equal to the length of the *'weights'*.
+
+        :return: True if the SlottedFitness instance is valid.
+        """
+        return len(self._wvalues) == len(self.weights) > 0
+
+    # -------------------------------------------------------- #
+    dominates = Fitness.dominates
+    __gt__ = Fitness.__gt__
+    __ge__ = Fitness.__ge__
+    __le__ = Fitness.__le__
+    __lt__ = Fitness.__lt__
+    __eq__ = Fitness.__eq__
+    __ne__ = Fitness.__ne__
+    __len__ = Fitness.__len__
+    __hash__ = Fitness.__hash__
+    __str__ = Fitness.__str__
+    __repr__ = Fitness.__repr__
+
+    # -------------------------------------------------------- #
+    def __deepcopy__(self, memo):
+        copy = self.__class__.__new__(self.__class__)
+        copy._wvalues = self._wvalues
+        copy._values = self._values
+        return copy
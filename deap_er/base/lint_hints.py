@@ -34,8 +34,12 @@ class LintHints:
     swarms: Callable
 
     evaluate: Callable
+    evaluate_batch: Callable
+    screen: Callable
     select: Callable
     mate: Callable
+    mate_batch: Callable
     mutate: Callable
+    mutate_batch: Callable
     generate: Callable
     update: Callable
@@ -0,0 +1,328 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+from typing import Callable, Iterable, Iterator, Optional, Union
+from .fitness import Fitness
+import numpy
+
+
+__all__ = ['PopulationMatrix']
+
+
+# ====================================================================================== #
+class PopulationMatrix:
+    """
+    A struct-of-arrays container of a population, which stores the genomes in
+    a single 2-D ndarray of shape *(n_individuals, n_genes)* and the weighted
+    fitness values in a single 2-D ndarray of shape *(n_individuals, n_objectives)*.
+    The rows of invalid individuals contain NaN values in the *'wvalues'* array.
+
+    Indexing the container with an integer or iterating over it yields
+    lightweight row views, which behave like numpy individuals: their genes are
+    views into the *'genomes'* array and their *'fitness'* attribute reads and
+    writes the row of the *'wvalues'* array, so the existing operators modify the
+    container in place. Cloning or pickling a row view detaches it into a
+    single-row container. Indexing the container with a slice, an array of
+    indices or a boolean mask returns a new container with copied rows.
+
+    The :func:`sel_best`, :func:`sel_worst`, :func:`sel_random` and
+    :func:`sel_tournament` operators, the :func:`evaluate_invalids` function
+    with the *'evaluate_batch'* operator and the :class:`Statistics` objects
+    without a key function have vectorized fast paths for the container.
+    For example, the fitness statistics of the valid individuals are
+    compiled with :code:`stats.compile(matrix.values[matrix.valid])`.
+
+    :param genomes: A 2-D array-like of genomes, which is copied.
+    :param weights: The fitness weights of the individuals.
+    :param values: A 2-D array-like of the fitness values, optional.
+        By default, all the individuals are invalid.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, genomes: Iterable, weights: tuple,
+                 values: Optional[Iterable] = None):
+        genomes = numpy.array(genomes)
+        if genomes.ndim != 2:
+            raise ValueError(
+                "The genomes must be a 2-D array of shape (n_individuals, n_genes)."
+            )
+        if not weights:
+            raise TypeError("The fitness weights tuple must not be empty.")
+        self.genomes = genomes
+        self.weights = tuple(weights)
+        self.wvalues = numpy.full((len(genomes), len(self.weights)), numpy.nan)
+        if values is not None:
+            self.values = values
+
+    # -------------------------------------------------------- #
+    @classmethod
+    def from_individuals(cls, individuals: Iterable) -> PopulationMatrix:
+        """
+        Creates a container from a sequence of individuals, which must have
+        genomes of equal length and fitness objects of the same weights.
+
+        :param individuals: The individuals to copy into the container.
+        :return: A new PopulationMatrix.
+        """
+        individuals = list(individuals)
+        if not individuals:
+            raise ValueError("Can't create a 'PopulationMatrix' from an empty population.")
+        genomes = [numpy.asarray(ind) for ind in individuals]
+        matrix = cls(genomes, individuals[0].fitness.weights)
+        for row, ind in zip(matrix.wvalues, individuals):
+            if ind.fitness.is_valid():
+                row[:] = ind.fitness.wvalues
+        return matrix
+
+    # -------------------------------------------------------- #
+    def to_individuals(self, container: Callable) -> list:
+        """
+        Converts the rows of the container into standalone individuals.
+
+        :param container: The individual class, e.g. one created
+            with the :func:`creator.create` function.
+        :return: A list of individuals.
+        """
+        individuals = []
+        for genome, wvalues in zip(self.genomes, self.wvalues):
+            ind = container(genome.tolist())
+            if not numpy.isnan(wvalues).any():
+                ind.fitness.wvalues = tuple(wvalues.tolist())
+            individuals.append(ind)
+        return individuals
+
+    # -------------------------------------------------------- #
+    @property
+    def values(self) -> numpy.ndarray:
+        """
+        The unweighted fitness values as a 2-D array, which contains NaN
+        values in the rows of the invalid individuals. The setter accepts
+        an array-like of shape *(n_individuals, n_objectives)*.
+        """
+        return self.wvalues / self.weights
+
+    @values.setter
+    def values(self, values: Iterable) -> None:
+        values = numpy.asarray(values, dtype=float).reshape(len(self), -1)
+        if values.shape[1] != len(self.weights):
+            raise TypeError(
+                "The assigned values must have the same number "
+                "of columns as the length of the weights."
+            )
+        self.wvalues = values * self.weights
+
+    # -------------------------------------------------------- #
+    @property
+    def valid(self) -> numpy.ndarray:
+        """
+        A boolean mask of the individuals which have a valid fitness.
+        """
+        return ~numpy.isnan(self.wvalues).any(axis=1)
+
+    # -------------------------------------------------------- #
+    def invalidate(self, indices: Union[slice, Iterable] = slice(None)) -> None:
+        """
+        Invalidates the fitness of the individuals at the **indices**.
+
+        :param indices: A slice, an array of indices or a boolean mask,
+            optional. By default, all the individuals are invalidated.
+        :return: Nothing.
+        """
+        self.wvalues[indices] = numpy.nan
+
+    # -------------------------------------------------------- #
+    def take(self, indices: Union[slice, Iterable]) -> PopulationMatrix:
+        """
+        Returns a new container with copies of the rows at the **indices**.
+
+        :param indices: A slice, an array of indices or a boolean mask.
+        :return: A new PopulationMatrix.
+        """
+        indices = numpy.arange(len(self))[indices]
+        matrix = self.__class__.__new__(self.__class__)
+        matrix.genomes = self.genomes[indices]
+        matrix.weights = self.weights
+        matrix.wvalues = self.wvalues[indices]
+        return matrix
+
+    # -------------------------------------------------------- #
+    def derive(self, genomes: numpy.ndarray, origin: numpy.ndarray) -> PopulationMatrix:
+        """
+        Creates a container of the offspring, which have been produced from
+        the genomes of this container by the :func:`var_and_matrix` or the
+        :func:`var_or_matrix` functions. The offspring inherit the fitness
+        of their parent row if their *origin* is not negative.
+
+        :param genomes: The genomes of the offspring.
+        :param origin: The parent row index of each offspring
+            or -1 for the offspring which must be evaluated.
+        :return: A new PopulationMatrix.
+        """
+        origin = numpy.asarray(origin)
+        matrix = self.__class__(genomes, self.weights)
+        inherit = origin >= 0
+        matrix.wvalues[inherit] = self.wvalues[origin[inherit]]
+        return matrix
+
+    # -------------------------------------------------------- #
+    def rank(self) -> numpy.ndarray:
+        """
+        Returns the indices of the individuals from the best to the worst,
+        which are ordered lexicographically by their weighted fitness values
+        like the Fitness objects. Invalid individuals are ranked last and
+        individuals with equal fitness keep their order.
+
+        :return: An array of indices.
+        """
+        keys = -self.wvalues[:, ::-1].T
+        return numpy.lexsort(keys)
+
+    # -------------------------------------------------------- #
+    def tournament(self, rounds: int, contestants: int) -> numpy.ndarray:
+        """
+        Returns the indices of the winners of **rounds** tournaments among
+        randomly chosen **contestants**. The contestants are drawn with the
+        global :mod:`numpy.random` state.
+
+        :param rounds: The number of tournaments.
+        :param contestants: The number of individuals in each tournament.
+        :return: An array of indices.
+        """
+        position = numpy.empty(len(self), dtype=numpy.intp)
+        position[self.rank()] = numpy.arange(len(self))
+        aspirants = numpy.random.randint(0, len(self), size=(rounds, contestants))
+        winners = numpy.argmin(position[aspirants], axis=1)
+        return aspirants[numpy.arange(rounds), winners]
+
+    # -------------------------------------------------------- #
+    def sort(self) -> None:
+        """
+        Sorts the individuals in place from the best to the worst.
+        The row views which were taken before the sorting keep referring
+        to the same positions, which then contain the sorted individuals.
+
+        :return: Nothing.
+        """
+        order = self.rank()
+        self.genomes[:] = self.genomes[order]
+        self.wvalues[:] = self.wvalues[order]
+
+    # -------------------------------------------------------- #
+    def __len__(self) -> int:
+        return len(self.genomes)
+
+    def __iter__(self) -> Iterator[numpy.ndarray]:
+        for index in range(len(self)):
+            yield self._row(index)
+
+    def __getitem__(self, index: Union[int, slice, Iterable]):
+        if isinstance(index, (int, numpy.integer)):
+            if not -len(self) <= index < len(self):
+                raise IndexError("The PopulationMatrix index is out of range.")
+            return self._row(index % len(self))
+        return self.take(index)
+
+    def __add__(self, other: PopulationMatrix) -> PopulationMatrix:
+        if tuple(other.weights) != self.weights:
+            raise TypeError("Can't concatenate containers with different weights.")
+        matrix = self.__class__.__new__(self.__class__)
+        matrix.genomes = numpy.concatenate([self.genomes, other.genomes])
+        matrix.weights = self.weights
+        matrix.wvalues = numpy.concatenate([self.wvalues, other.wvalues])
+        return matrix
+
+    def __array__(self, dtype=None, copy=None) -> numpy.ndarray:
+        if dtype is None:
+            return self.genomes
+        return self.genomes.astype(dtype)
+
+    def __repr__(self) -> str:
+        return '{0}.{1}(n_individuals={2}, n_genes={3}, weights={4})'.format(
+            self.__module__,
+            self.__class__.__name__,
+            len(self), self.genomes.shape[1],
+            self.weights
+        )
+
+    # -------------------------------------------------------- #
+    def _row(self, index: int) -> _MatrixRow:
+        row = self.genomes[index].view(_MatrixRow)
+        row.fitness = _RowFitness(self, index)
+        return row
+
+
+# ====================================================================================== #
+class _RowFitness(Fitness):
+    """
+    Private fitness proxy of a row view, which stores the
+    weighted values in the row of the container.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, matrix: PopulationMatrix, index: int):
+        self.matrix = matrix
+        self.index = index
+
+    # -------------------------------------------------------- #
+    @property
+    def weights(self) -> tuple:
+        return self.matrix.weights
+
+    @property
+    def wvalues(self) -> tuple:
+        row = self.matrix.wvalues[self.index]
+        if numpy.isnan(row).any():
+            return tuple()
+        return tuple(row.tolist())
+
+    @wvalues.setter
+    def wvalues(self, wvalues: tuple) -> None:
+        self.matrix.wvalues[self.index] = wvalues if len(wvalues) else numpy.nan
+
+    # -------------------------------------------------------- #
+    def __deepcopy__(self, memo):
+        return self.matrix.take([self.index])._row(0).fitness
+
+    def __reduce__(self):
+        return _restore_fitness, (self.weights, self.wvalues)
+
+
+# ====================================================================================== #
+class _MatrixRow(numpy.ndarray):
+    """
+    Private row view of a container, which behaves like a numpy individual.
+    """
+    # -------------------------------------------------------- #
+    def __deepcopy__(self, memo):
+        fitness = getattr(self, 'fitness', None)
+        if not isinstance(fitness, _RowFitness):
+            return numpy.array(self)
+        return fitness.matrix.take([fitness.index])._row(0)
+
+    def __reduce__(self):
+        fitness = getattr(self, 'fitness', None)
+        if not isinstance(fitness, _RowFitness):
+            return numpy.array, (numpy.array(self),)
+        return _restore_row, (numpy.array(self), fitness.weights, fitness.wvalues)
+
+
+# -------------------------------------------------------------------------------------- #
+def _restore_row(genome: numpy.ndarray, weights: tuple, wvalues: tuple) -> _MatrixRow:
+    matrix = PopulationMatrix([genome], weights)
+    if wvalues:
+        matrix.wvalues[0] = wvalues
+    return matrix[0]
+
+
+# -------------------------------------------------------------------------------------- #
+def _restore_fitness(weights: tuple, wvalues: tuple) -> _RowFitness:
+    matrix = PopulationMatrix([[0]], weights)
+    if wvalues:
+        matrix.wvalues[0] = wvalues
+    return matrix[0].fitness
@@ -0,0 +1,126 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+from typing import Callable, Iterable, Optional, Union
+from functools import wraps
+import random
+import numpy
+
+
+__all__ = ['RandomStream']
+
+
+# ====================================================================================== #
+class RandomStream:
+    """
+    An independent stream of random numbers, which is created from a
+    :class:`numpy.random.SeedSequence`. Independent child streams for worker
+    processes or islands are created with the :func:`spawn` method, so the
+    random numbers of parallel runs depend only on the root seed and not on
+    the scheduling of the workers. Each stream owns a :class:`random.Random`
+    state, a :mod:`numpy.random` state and a :class:`numpy.random.Generator`.
+
+    The operators of this library use the global :mod:`random` and
+    :mod:`numpy.random` modules. When a stream is used as a context manager,
+    the global states of these modules are swapped with the states of the
+    stream on entry and swapped back on exit, so all the operators which
+    are called inside the context draw their numbers from the stream.
+    Streams can be pickled, also while they are active, so they can
+    be stored into a Checkpoint together with the population.
+
+    :param seed: The entropy of the root stream or a SeedSequence, optional.
+        By default, fresh entropy is drawn from the operating system.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, seed: Union[int, numpy.random.SeedSequence] = None):
+        if not isinstance(seed, numpy.random.SeedSequence):
+            seed = numpy.random.SeedSequence(seed)
+        self.seed_seq = seed
+        self.generator = numpy.random.Generator(numpy.random.PCG64(seed))
+        words = seed.generate_state(8, numpy.uint32)
+        rand = random.Random(int.from_bytes(words.tobytes(), 'little'))
+        self.random_state = rand.getstate()
+        legacy = numpy.random.RandomState(numpy.random.MT19937(seed))
+        self.numpy_state = legacy.get_state()
+        self._saved = []
+
+    # -------------------------------------------------------- #
+    def spawn(self, count: int) -> list[RandomStream]:
+        """
+        Creates independent child streams. The children depend only on the seed
+        of this stream and on the number of children spawned before them, which
+        is also restored when the stream is loaded from a Checkpoint.
+
+        :param count: The number of child streams to create.
+        :return: A list of child streams.
+        """
+        return [RandomStream(seq) for seq in self.seed_seq.spawn(count)]
+
+    # -------------------------------------------------------- #
+    def map_decorator(self, map_func: Callable) -> Callable:
+        """
+        A decorator for the *'map'* operator, which makes stochastic evaluation
+        functions reproducible in parallel maps. On each call, a child stream is
+        spawned for each item and the function is called with the item inside
+        the context of its stream. The decorated map function receives
+        *(seed sequence, item)* pairs instead of the items, so it must
+        not depend on the type of the items.
+
+        :param map_func: The map function to decorate.
+        :return: The decorated map function.
+        """
+        @wraps(map_func)
+        def wrapper(func, iterable: Iterable):
+            items = list(iterable)
+            pairs = list(zip(self.seed_seq.spawn(len(items)), items))
+            return list(map_func(_StreamCall(func), pairs))
+        return wrapper
+
+    # -------------------------------------------------------- #
+    def __enter__(self) -> RandomStream:
+        self._saved.append((random.getstate(), numpy.random.get_state()))
+        random.setstate(self.random_state)
+        numpy.random.set_state(self.numpy_state)
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.random_state = random.getstate()
+        self.numpy_state = numpy.random.get_state()
+        random_state, numpy_state = self._saved.pop()
+        random.setstate(random_state)
+        numpy.random.set_state(numpy_state)
+
+    # -------------------------------------------------------- #
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        if self._saved:  # the live states are in the global modules
+            state['random_state'] = random.getstate()
+            state['numpy_state'] = numpy.random.get_state()
+        state['_saved'] = []
+        return state
+
+
+# ====================================================================================== #
+class _StreamCall:
+    """
+    Private helper which calls a function inside the context of a stream,
+    which is created from the seed sequence of the item in the worker process.
+    Unlike a closure, it can be pickled into worker processes.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, func: Callable):
+        self.func = func
+
+    # -------------------------------------------------------- #
+    def __call__(self, pair: tuple) -> Optional[object]:
+        seed_seq, item = pair
+        with RandomStream(seed_seq):
+            return self.func(item)
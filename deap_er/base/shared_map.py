@@ -0,0 +1,136 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing import resource_tracker
+from typing import Callable, Iterable, Optional
+import multiprocessing
+import numpy
+import math
+import os
+
+
+__all__ = ['SharedMemoryMap']
+
+
+# ====================================================================================== #
+class SharedMemoryMap:
+    """
+    A parallel replacement for the builtin *'map'* function, which can be registered
+    into the toolbox as the *'map'* operator. On each call, the genomes of all the
+    given individuals are copied into a single :mod:`multiprocessing.shared_memory`
+    block and the worker processes receive only the row indices of the genomes they
+    need to evaluate. The fitness values are written by the workers into a shared
+    result array, so neither the individuals nor their fitness values are pickled.
+
+    All the individuals must have the same length and their genes must be
+    convertible into the **dtype**. The evaluation function receives a
+    read-only *ndarray* view of the genome instead of the individual.
+
+    :param processes: The number of worker processes, optional.
+        By default, the number of CPUs in the system is used.
+    :param dtype: The data type of the shared genome array, optional.
+        The default value is *numpy.float64*.
+    :param chunksize: The number of rows to send to a worker in a single task,
+        optional. By default, the rows are split into four tasks per worker.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, processes: Optional[int] = None,
+                 dtype: Optional[type] = numpy.float64,
+                 chunksize: Optional[int] = None):
+        self.processes = processes or os.cpu_count() or 1
+        self.dtype = numpy.dtype(dtype)
+        self.chunksize = chunksize
+        # the workers must share the resource tracker of the parent
+        # process, otherwise they would unlink the shared memory
+        resource_tracker.ensure_running()
+        self.pool = multiprocessing.Pool(self.processes)
+
+    # -------------------------------------------------------- #
+    def __call__(self, func: Callable, individuals: Iterable) -> list:
+        """
+        Evaluates the **individuals** with the **func** in the worker processes.
+
+        :param func: The evaluation function to apply to each genome.
+        :param individuals: The individuals to evaluate.
+        :return: A list of fitness value tuples in the order of the individuals.
+        """
+        individuals = list(individuals)
+        if not individuals:
+            return []
+
+        rows, cols = len(individuals), len(individuals[0])
+        fitness = getattr(individuals[0], 'fitness', None)
+        n_obj = len(fitness.weights) if fitness is not None else 1
+
+        chunksize = self.chunksize
+        if chunksize is None:
+            chunksize = math.ceil(rows / (self.processes * 4))
+
+        genomes_size = max(rows * cols * self.dtype.itemsize, 1)
+        results_size = rows * n_obj * numpy.dtype(numpy.float64).itemsize
+        genomes_shm = SharedMemory(create=True, size=genomes_size)
+        results_shm = SharedMemory(create=True, size=results_size)
+        try:
+            genomes = numpy.ndarray((rows, cols), self.dtype, genomes_shm.buf)
+            for i, ind in enumerate(individuals):
+                genomes[i] = ind
+            del genomes
+
+            tasks = [
+                (func, genomes_shm.name, results_shm.name, rows,
+                 cols, n_obj, self.dtype.str, start, min(start + chunksize, rows))
+                for start in range(0, rows, chunksize)
+            ]
+            self.pool.starmap(_evaluate_rows, tasks)
+
+            results = numpy.ndarray((rows, n_obj), numpy.float64, results_shm.buf)
+            values = [tuple(row) for row in results.tolist()]
+            del results
+        finally:
+            for shm in (genomes_shm, results_shm):
+                shm.close()
+                shm.unlink()
+        return values
+
+    # -------------------------------------------------------- #
+    def close(self) -> None:
+        """
+        Stops the worker processes after they have completed their tasks.
+
+        :return: Nothing.
+        """
+        self.pool.close()
+        self.pool.join()
+
+    # -------------------------------------------------------- #
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+# -------------------------------------------------------------------------------------- #
+def _evaluate_rows(func: Callable, genomes_name: str, results_name: str,
+                   rows: int, cols: int, n_obj: int, dtype: str,
+                   start: int, stop: int) -> None:
+    genomes_shm = SharedMemory(name=genomes_name)
+    results_shm = SharedMemory(name=results_name)
+    try:
+        genomes = numpy.ndarray((rows, cols), dtype, genomes_shm.buf)
+        results = numpy.ndarray((rows, n_obj), numpy.float64, results_shm.buf)
+        genomes.flags.writeable = False
+        for i in range(start, stop):
+            results[i] = func(genomes[i])
+        del genomes, results
+    finally:
+        genomes_shm.close()
+        results_shm.close()
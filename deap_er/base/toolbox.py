@@ -9,23 +9,44 @@
 #   SPDX-License-Identifier: MIT
 #
 from .lint_hints import LintHints
+from .cloning import clone
 from typing import Callable, Optional
 from functools import partial
-from copy import deepcopy
+import threading
+import time
 
 
 __all__ = ['Toolbox']
 
 
+_PROFILE_LOCK = threading.Lock()
+
+
 # ====================================================================================== #
 class Toolbox(LintHints):
     """
     A container for evolutionary operators. Toolboxes are essential
     components which facilitate the process of computational evolution.
+
+    If **profile** is True, the registered operators count their calls and
+    accumulate the time spent in them, which can be retrieved with the
+    :func:`profile_report` method. The durations are inclusive, e.g. the
+    time of an operator contains the time of the operators it calls, and
+    the calls made in other processes are not counted. The default *'map'*
+    operator is the lazy builtin :func:`map`, which returns before the
+    mapped function is called, so its time is close to zero and the
+    *'evaluate'* operator is timed separately.
+
+    :param profile: Whether to profile the registered operators,
+        optional. The default value is False.
     """
     # -------------------------------------------------------- #
-    def __init__(self):
-        self.register("clone", deepcopy)
+    _profile: Optional[dict] = None
+
+    # -------------------------------------------------------- #
+    def __init__(self, profile: bool = False):
+        self._profile = dict() if profile else None
+        self.register("clone", clone)
         self.register("map", map)
 
     # -------------------------------------------------------- #
@@ -46,12 +67,17 @@ class Toolbox(LintHints):
             passed to the 'func' when it's called, optional.
         :return: Nothing.
         """
-        p_func = partial(func, *args, **kwargs)
+        if self._profile is None:
+            p_func = partial(func, *args, **kwargs)
+        else:
+            p_func = _ProfiledPartial(func, *args, **kwargs)
         p_func.__name__ = alias
         p_func.__doc__ = func.__doc__
 
         if hasattr(func, '__dict__') and not isinstance(func, type):
             p_func.__dict__.update(func.__dict__.copy())
+        if self._profile is not None:
+            p_func._counter = self._profile.setdefault(alias, [0, 0])
         setattr(self, alias, p_func)
 
     # -------------------------------------------------------- #
@@ -63,6 +89,8 @@ class Toolbox(LintHints):
         :return: Nothing.
         """
         delattr(self, alias)
+        if self._profile is not None:
+            self._profile.pop(alias, None)
 
     # -------------------------------------------------------- #
     def decorate(self, alias: str,
@@ -86,3 +114,52 @@ class Toolbox(LintHints):
         for decorator in decorators:
             func = decorator(func)
         self.register(alias, func, *args, **kwargs)
+
+    # -------------------------------------------------------- #
+    def profile_report(self, reset: bool = False) -> dict:
+        """
+        Returns the number of calls, the cumulative time in seconds and the
+        mean time per call of each registered operator, ordered from the most
+        time-consuming operator. The report can be recorded into a Logbook
+        with :code:`logbook.record(gen=gen, **toolbox.profile_report())`,
+        which records the operators as chapters.
+
+        :param reset: Whether to reset the counters after
+            the report is made, optional. The default value is False.
+        :raises RuntimeError: If the toolbox was not created with *profile=True*.
+        :return: A dictionary of the operator reports.
+        """
+        if self._profile is None:
+            raise RuntimeError("The toolbox was not created with 'profile=True'.")
+        report = dict()
+        ranking = sorted(self._profile.items(), key=lambda item: -item[1][1])
+        for alias, (calls, elapsed) in ranking:
+            report[alias] = dict(
+                calls=calls,
+                time=elapsed / 1e9,
+                per_call=elapsed / calls / 1e9 if calls else 0.0
+            )
+            if reset:
+                self._profile[alias][:] = [0, 0]
+        return report
+
+
+# ====================================================================================== #
+class _ProfiledPartial(partial):
+    """
+    Private partial function which counts its calls and
+    accumulates their duration into a shared counter.
+    The counter is updated under a lock, so the operators
+    can also be called from multiple threads.
+    """
+    # -------------------------------------------------------- #
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return super().__call__(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            with _PROFILE_LOCK:
+                counter = self._counter
+                counter[0] += 1
+                counter[1] += elapsed
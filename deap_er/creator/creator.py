@@ -8,6 +8,7 @@
 #   
 #   SPDX-License-Identifier: MIT
 #
+from deap_er.base.cloning import _specialize
 from .overrides import *
 from typing import Optional, Union
 import warnings
@@ -17,7 +18,8 @@ __all__ = ['create']
 
 
 # ====================================================================================== #
-def create(name: str, base: Union[type, object], **kwargs: Optional) -> None:
+def create(name: str, base: Union[type, object],
+           slots: bool = False, **kwargs: Optional) -> None:
     """
     Creates a new class named **name**, which inherits from the **base** class, and
     registers it into the global namespace of the *creator* module. Any optional
@@ -25,11 +27,30 @@ def create(name: str, base: Union[type, object], **kwargs: Optional) -> None:
 
     :param name: The name of the new class to create.
     :param base: A type or an object from which to inherit.
+    :param slots: Whether the new class declares *'__slots__'* for its instance
+        attributes, so its instances don't have an instance dictionary, optional.
+        Slots are supported for the *list*, *array.array* and *numpy.ndarray*
+        bases and for other base classes whose instances have no instance
+        dictionary. Otherwise, a warning is issued and the option is ignored.
+        The default value is False.
     :param kwargs: One or more keyword arguments to add to the new class
         as attributes, optional. If a kwarg is an instance, it will
         be added as a class attribute. If a kwarg is a class, it
         will be instantiated and added as an instance attribute.
     :return: Nothing.
+
+    If the **base** class declares *'__slots__'* and its instances have no
+    instance dictionary, e.g. the :class:`SlottedFitness` class, the new class
+    also declares *'__slots__'* for its instance attributes, so its instances
+    stay slotted. The instances of slotted classes can't be assigned any
+    attributes other than the instance attributes given in the **kwargs**.
+    When **slots** is True, a *'history_index'* slot is also reserved,
+    so the individuals can be tracked by the :class:`History` class.
+
+    If a genome copier is registered for the **base** type with the
+    :func:`register_cloner` function, the new class also receives a
+    specialized *'__copy_individual__'* method, which is used by
+    the :func:`clone` function.
     """
     # warn about class definition overwrite
     if name in globals():
@@ -47,8 +68,8 @@ def create(name: str, base: Union[type, object], **kwargs: Optional) -> None:
 
     # override numpy and array classes
     base = dict(
-        array=_ArrayOverride,
-        numpy=_NumpyOverride
+        array=_SlottedArrayOverride if slots else _ArrayOverride,
+        numpy=_SlottedNumpyOverride if slots else _NumpyOverride
     ).get(base.__module__, base)
 
     # separate kwargs by their type
@@ -58,6 +79,21 @@ def create(name: str, base: Union[type, object], **kwargs: Optional) -> None:
         _dict = inst_attr if condition else cls_attr
         _dict[key] = value
 
+    # declare slots, if requested or if the base class is slotted
+    slotted = base.__dictoffset__ == 0 and base.__itemsize__ == 0
+    if slots and not slotted:
+        msg = f"Can't declare '__slots__' for the class \'{name}\', " \
+              f"because the instances of its base class \'{base.__name__}\' " \
+              f"have an instance dictionary or a variable size."
+        warnings.warn(
+            message=msg,
+            category=RuntimeWarning
+        )
+    elif slots or ('__slots__' in vars(base) and slotted):
+        cls_attr['__slots__'] = tuple(inst_attr)
+        if slots and 'history_index' not in kwargs:
+            cls_attr['__slots__'] += ('history_index',)
+
     # create the new class
     new_class = type(name, tuple([base]), cls_attr)
 
@@ -70,4 +106,7 @@ def create(name: str, base: Union[type, object], **kwargs: Optional) -> None:
 
     # override the init func and set the global name
     new_class.__init__ = new_init_func
+    copy_individual = _specialize(new_class)
+    if copy_individual is not None:
+        new_class.__copy_individual__ = copy_individual
     globals()[name] = new_class
@@ -8,13 +8,20 @@
 #   
 #   SPDX-License-Identifier: MIT
 #
-from typing import Sequence
+from deap_er.base.cloning import register_cloner, _copy_ndarray, _copy_array
+from deap_er.base.cloning import _get_state, _set_state
+from typing import Sequence, Union
 from copy import deepcopy
+import pickle
 import array
 import numpy
+import sys
 
 
-__all__ = ['_NumpyOverride', '_ArrayOverride']
+__all__ = [
+    '_NumpyOverride', '_ArrayOverride',
+    '_SlottedNumpyOverride', '_SlottedArrayOverride'
+]
 
 
 # ====================================================================================== #
@@ -29,15 +36,23 @@ class _NumpyOverride(numpy.ndarray):
 
     def __deepcopy__(self, memo: dict, *_, **__):
         copy = numpy.ndarray.copy(self)
-        dc = deepcopy(self.__dict__, memo)
-        copy.__dict__.update(dc)
+        dc = deepcopy(_get_state(self), memo)
+        _set_state(copy, dc)
         return copy
 
     def __setstate__(self, state, *_, **__):
-        self.__dict__.update(state)
+        _set_state(self, state)
 
     def __reduce__(self):
-        return self.__class__, (list(self),), self.__dict__
+        return self.__class__, (list(self),), _get_state(self)
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        if self.dtype.hasobject:
+            return self.__reduce__()
+        data = numpy.ascontiguousarray(self)
+        buffer = pickle.PickleBuffer(data) if protocol >= 5 else data.tobytes()
+        args = (self.__class__, buffer, self.dtype, self.shape)
+        return _restore_ndarray, args, _get_state(self)
 
 
 # ====================================================================================== #
@@ -48,15 +63,76 @@ class _ArrayOverride(array.array):
     """
     @staticmethod
     def __new__(cls, seq: Sequence) -> array.array:
-        return super().__new__(cls, cls.typecode, seq)
+        return array.array.__new__(cls, cls.typecode, seq)
 
     def __deepcopy__(self, memo: dict) -> object:
         cls = self.__class__
         copy = cls.__new__(cls, self)
         memo[id(self)] = copy
-        dc = deepcopy(self.__dict__, memo)
-        copy.__dict__.update(dc)
+        dc = deepcopy(_get_state(self), memo)
+        _set_state(copy, dc)
         return copy
 
+    def __setstate__(self, state: dict) -> None:
+        _set_state(self, state)
+
     def __reduce__(self) -> tuple:
-        return self.__class__, (list(self),), self.__dict__
+        return self.__class__, (list(self),), _get_state(self)
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        buffer = pickle.PickleBuffer(self) if protocol >= 5 else self.tobytes()
+        args = (self.__class__, buffer, sys.byteorder)
+        return _restore_array, args, _get_state(self)
+
+
+# ====================================================================================== #
+class _SlottedNumpyOverride(numpy.ndarray):
+    """
+    Slotted variant of the '_NumpyOverride' class, which
+    is the base class of the slotted numpy individuals.
+    """
+    __slots__ = ()
+    __new__ = _NumpyOverride.__new__
+    __deepcopy__ = _NumpyOverride.__deepcopy__
+    __setstate__ = _NumpyOverride.__setstate__
+    __reduce__ = _NumpyOverride.__reduce__
+    __reduce_ex__ = _NumpyOverride.__reduce_ex__
+
+
+# ====================================================================================== #
+class _SlottedArrayOverride(array.array):
+    """
+    Slotted variant of the '_ArrayOverride' class, which
+    is the base class of the slotted array individuals.
+    """
+    __slots__ = ()
+    __new__ = _ArrayOverride.__new__
+    __deepcopy__ = _ArrayOverride.__deepcopy__
+    __setstate__ = _ArrayOverride.__setstate__
+    __reduce__ = _ArrayOverride.__reduce__
+    __reduce_ex__ = _ArrayOverride.__reduce_ex__
+
+
+# -------------------------------------------------------------------------------------- #
+def _restore_ndarray(cls: type, buffer: Union[bytes, bytearray, memoryview],
+                     dtype: numpy.dtype, shape: tuple) -> numpy.ndarray:
+    data = numpy.frombuffer(buffer, dtype=dtype).reshape(shape)
+    if not data.flags.writeable:
+        data = data.copy()
+    return data.view(cls)
+
+
+# -------------------------------------------------------------------------------------- #
+def _restore_array(cls: type, buffer: Union[bytes, bytearray, memoryview],
+                   byteorder: str) -> array.array:
+    obj = cls.__new__(cls, ())
+    obj.frombytes(memoryview(buffer).cast('B'))
+    if byteorder != sys.byteorder:
+        obj.byteswap()
+    return obj
+
+
+register_cloner(_NumpyOverride, _copy_ndarray)
+register_cloner(_ArrayOverride, _copy_array)
+register_cloner(_SlottedNumpyOverride, _copy_ndarray)
+register_cloner(_SlottedArrayOverride, _copy_array)
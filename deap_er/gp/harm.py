@@ -8,6 +8,9 @@
 #   
 #   SPDX-License-Identifier: MIT
 #
+from deap_er.algorithms.state import _StateTracker, _gen_range, _header
+from deap_er.algorithms.termination import Termination
+from deap_er.algorithms.evaluation import *
 from deap_er.records.dtypes import *
 from deap_er.records import Logbook
 from deap_er.base import Toolbox
@@ -33,14 +36,16 @@ def harm(toolbox: Toolbox,
          min_cutoff: int = 20,
          hof: Hof = None,
          stats: Stats = None,
-         verbose: bool = False) -> AlgoResult:
+         verbose: bool = False, *,
+         terminate: Termination = None) -> AlgoResult:
     """
     Implements population bloat control by an evolution algorithm for a genetic
     program. The default parameter values are recommended for most use-cases.
 
     :param toolbox: A Toolbox which contains the evolution operators.
     :param population: A list of individuals to evolve.
-    :param generations: The number of generations to compute.
+    :param generations: The number of generations to compute. Can be None,
+        if a termination criterion is provided.
     :param cx_prob: The probability of mating two individuals.
     :param mut_prob: The probability of mutating an individual.
     :param alpha: The half-life of the exponential, which is linearly
@@ -66,6 +71,7 @@ def harm(toolbox: Toolbox,
     :param hof: A HallOfFame or a ParetoFront object, optional.
     :param stats: A Statistics or a MultiStatistics object, optional.
     :param verbose: Whether to print debug messages, optional.
+    :param terminate: A termination criterion, optional.
     :return: The final population and the logbook.
 
     :type hof: :ref:`Hof <datatypes>`
@@ -128,26 +134,26 @@ def harm(toolbox: Toolbox,
 
     # -------------------------------------------------------- #
     logbook = Logbook()
-    logbook.header = ['gen', 'nevals'] + (stats.fields if stats else [])
+    logbook.header = _header(stats, None, terminate)
+    tracker = _StateTracker(logbook, terminate)
 
-    invalid_ind = [ind for ind in population if not ind.fitness.is_valid()]
-    fitness = toolbox.map(toolbox.evaluate, invalid_ind)
-    for ind, fit in zip(invalid_ind, fitness):
-        ind.fitness.values = fit
+    nevals = evaluate_invalids(toolbox, population)
 
     if hof is not None:
         hof.update(population)
 
     record = stats.compile(population) if stats else {}
-    logbook.record(gen=0, nevals=len(invalid_ind), **record)
+    state = tracker.record(0, population, nevals, record)
 
     if verbose:
         print(logbook.stream)
+    if state.stop:
+        return population, logbook
 
     if nb_model == -1:
         nb_model = max(2000, len(population))
 
-    for gen in range(1, generations + 1):
+    for gen in _gen_range(1, generations, terminate):
         natural_pop, natural_pop_sizes = _harm_gen_pop(n=nb_model)
         natural_hist = [0] * (max(natural_pop_sizes) + 3)
 
@@ -178,19 +184,18 @@ def harm(toolbox: Toolbox,
             accept_func=_harm_accept_func
         )
 
-        invalid_ind = [ind for ind in offspring if not ind.fitness.is_valid()]
-        fitness = toolbox.map(toolbox.evaluate, invalid_ind)
-        for ind, fit in zip(invalid_ind, fitness):
-            ind.fitness.values = fit
+        nevals = evaluate_invalids(toolbox, offspring)
 
         if hof is not None:
             hof.update(offspring)
 
         population[:] = offspring
         record = stats.compile(population) if stats else {}
-        logbook.record(gen=gen, nevals=len(invalid_ind), **record)
+        state = tracker.record(gen, population, nevals, record)
 
         if verbose:
             print(logbook.stream)
+        if state.stop:
+            break
 
     return population, logbook
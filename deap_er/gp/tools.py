@@ -10,9 +10,9 @@
 #
 from .dtypes import *
 from .primitives import *
+from deap_er.base.cloning import clone
 from typing import Any, Callable, Union
 from functools import wraps
-from copy import deepcopy
 import random
 import sys
 
@@ -132,7 +132,7 @@ def static_limit(limiter: Callable, max_value: Union[int, float]) -> Callable:
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            keep_inds = [deepcopy(ind) for ind in args]
+            keep_inds = [clone(ind) for ind in args]
             new_inds = list(func(*args, **kwargs))
             for i, ind in enumerate(new_inds):
                 if keep_inds and limiter(ind) > max_value:
@@ -12,3 +12,4 @@ from .selection import *
 from .crossover import *
 from .mutation import *
 from .migration import *
+from .batch import *
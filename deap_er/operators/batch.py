@@ -0,0 +1,174 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.base.dtypes import *
+import numpy
+
+
+__all__ = [
+    'cx_one_point_batch', 'cx_two_point_batch',
+    'cx_uniform_batch', 'cx_blend_batch',
+    'mut_gaussian_batch', 'mut_flip_bit_batch',
+    'mut_uniform_int_batch'
+]
+
+
+# ====================================================================================== #
+def _swap(genomes1: numpy.ndarray, genomes2: numpy.ndarray,
+          mask: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    temp = genomes1[mask]
+    genomes1[mask] = genomes2[mask]
+    genomes2[mask] = temp
+    return genomes1, genomes2
+
+
+# -------------------------------------------------------------------------------------- #
+def cx_one_point_batch(genomes1: numpy.ndarray,
+                       genomes2: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Executes a one-point crossover on each pair of rows of the two
+    genome matrices, which are modified in-place. The vectorized
+    equivalent of the :func:`cx_one_point` operator.
+
+    :param genomes1: The 2-D array of the first parents.
+    :param genomes2: The 2-D array of the second parents.
+    :return: Two matrices of mated genomes.
+    """
+    rows, cols = genomes1.shape
+    cxp = numpy.random.randint(1, cols, size=(rows, 1))
+    mask = numpy.arange(cols) >= cxp
+    return _swap(genomes1, genomes2, mask)
+
+
+# -------------------------------------------------------------------------------------- #
+def cx_two_point_batch(genomes1: numpy.ndarray,
+                       genomes2: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Executes a two-point crossover on each pair of rows of the two
+    genome matrices, which are modified in-place. The vectorized
+    equivalent of the :func:`cx_two_point` operator.
+
+    :param genomes1: The 2-D array of the first parents.
+    :param genomes2: The 2-D array of the second parents.
+    :return: Two matrices of mated genomes.
+    """
+    rows, cols = genomes1.shape
+    cxp1 = numpy.random.randint(1, cols + 1, size=(rows, 1))
+    cxp2 = numpy.random.randint(1, cols, size=(rows, 1))
+    cxp2 = numpy.where(cxp2 >= cxp1, cxp2 + 1, cxp2)
+    low, high = numpy.minimum(cxp1, cxp2), numpy.maximum(cxp1, cxp2)
+    idx = numpy.arange(cols)
+    mask = (idx >= low) & (idx < high)
+    return _swap(genomes1, genomes2, mask)
+
+
+# -------------------------------------------------------------------------------------- #
+def cx_uniform_batch(genomes1: numpy.ndarray, genomes2: numpy.ndarray,
+                     cx_prob: float) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Executes a uniform crossover on each pair of rows of the two
+    genome matrices, which are modified in-place. The vectorized
+    equivalent of the :func:`cx_uniform` operator.
+
+    :param genomes1: The 2-D array of the first parents.
+    :param genomes2: The 2-D array of the second parents.
+    :param cx_prob: The probability of swapping each attribute.
+    :return: Two matrices of mated genomes.
+    """
+    mask = numpy.random.random(genomes1.shape) < cx_prob
+    return _swap(genomes1, genomes2, mask)
+
+
+# -------------------------------------------------------------------------------------- #
+def cx_blend_batch(genomes1: numpy.ndarray, genomes2: numpy.ndarray,
+                   alpha: float) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Executes a blend crossover on each pair of rows of the two
+    genome matrices, which are modified in-place. The vectorized
+    equivalent of the :func:`cx_blend` operator.
+
+    :param genomes1: The 2-D array of the first parents.
+    :param genomes2: The 2-D array of the second parents.
+    :param alpha: Extent of the interval in which the
+        new values can be drawn for each attribute
+        on both sides of the parents' attributes.
+    :return: Two matrices of mated genomes.
+    """
+    gamma = (1. + 2. * alpha) * numpy.random.random(genomes1.shape) - alpha
+    x1, x2 = genomes1.copy(), genomes2
+    genomes1[:] = (1. - gamma) * x1 + gamma * x2
+    genomes2[:] = gamma * x1 + (1. - gamma) * x2
+    return genomes1, genomes2
+
+
+# -------------------------------------------------------------------------------------- #
+def mut_gaussian_batch(genomes: numpy.ndarray, mu: NumOrSeq,
+                       sigma: NumOrSeq, mut_prob: float) -> numpy.ndarray:
+    """
+    Applies a gaussian mutation of mean **mu** and standard deviation
+    **sigma** on each row of the genome matrix, which is modified
+    in-place. The vectorized equivalent of the :func:`mut_gaussian`
+    operator, which returns the matrix instead of a tuple.
+
+    :param genomes: The 2-D array of genomes to be mutated.
+    :param mu: The mean value of the gaussian mutation.
+    :param sigma: The standard deviation of the gaussian mutation.
+    :param mut_prob: The probability of mutating each attribute.
+    :returns: The mutated genome matrix.
+
+    :type mu: :ref:`NumOrSeq <datatypes>`
+    :type sigma: :ref:`NumOrSeq <datatypes>`
+    """
+    mask = numpy.random.random(genomes.shape) < mut_prob
+    noise = numpy.random.normal(mu, sigma, size=genomes.shape)
+    genomes[mask] += noise[mask]
+    return genomes
+
+
+# -------------------------------------------------------------------------------------- #
+def mut_flip_bit_batch(genomes: numpy.ndarray, mut_prob: float) -> numpy.ndarray:
+    """
+    Flips the values of random attributes of each row of the genome
+    matrix, which is modified in-place. The vectorized equivalent of
+    the :func:`mut_flip_bit` operator, which returns the matrix
+    instead of a tuple.
+
+    :param genomes: The 2-D array of genomes to be mutated.
+    :param mut_prob: The probability of mutating each attribute.
+    :returns: The mutated genome matrix.
+    """
+    mask = numpy.random.random(genomes.shape) < mut_prob
+    genomes[mask] = numpy.logical_not(genomes[mask])
+    return genomes
+
+
+# -------------------------------------------------------------------------------------- #
+def mut_uniform_int_batch(genomes: numpy.ndarray, low: NumOrSeq,
+                          up: NumOrSeq, mut_prob: float) -> numpy.ndarray:
+    """
+    Replaces random attributes of each row of the genome matrix with
+    uniformly drawn integers in the range of [**low**, **up**]. The matrix
+    is modified in-place. The vectorized equivalent of the :func:`mut_uniform_int`
+    operator, which returns the matrix instead of a tuple.
+
+    :param genomes: The 2-D array of genomes to be mutated.
+    :param low: The lower bound of the search space.
+    :param up: The upper bound of the search space.
+    :param mut_prob: The probability of mutating each attribute.
+    :returns: The mutated genome matrix.
+
+    :type low: :ref:`NumOrSeq <datatypes>`
+    :type up: :ref:`NumOrSeq <datatypes>`
+    """
+    mask = numpy.random.random(genomes.shape) < mut_prob
+    low = numpy.broadcast_to(numpy.asarray(low), genomes.shape)
+    up = numpy.broadcast_to(numpy.asarray(up), genomes.shape)
+    genomes[mask] = numpy.random.randint(low[mask], up[mask] + 1)
+    return genomes
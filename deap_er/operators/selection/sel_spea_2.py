@@ -8,6 +8,7 @@
 #   
 #   SPDX-License-Identifier: MIT
 #
+from deap_er.utilities.sorting import dominance_matrix
 import random
 import math
 
@@ -30,22 +31,9 @@ def sel_spea_2(individuals: list, sel_count: int) -> list:
     big_l = len(individuals[0].fitness.values)
     big_n = len(individuals)
     big_k = math.sqrt(big_n)
-    strength_fits = [0] * big_n
-    fits = [0] * big_n
-    dominating_individuals = [list() for _ in range(big_n)]
-
-    for i, ind_i in enumerate(individuals):
-        for j, ind_j in enumerate(individuals[i+1:], i+1):
-            if ind_i.fitness.dominates(ind_j.fitness):
-                strength_fits[i] += 1
-                dominating_individuals[j].append(i)
-            elif ind_j.fitness.dominates(ind_i.fitness):
-                strength_fits[j] += 1
-                dominating_individuals[i].append(j)
-
-    for i in range(big_n):
-        for j in dominating_individuals[i]:
-            fits[i] += strength_fits[j]
+    dominance = dominance_matrix(individuals)
+    strength_fits = dominance.sum(axis=1)
+    fits = strength_fits.dot(dominance).tolist()
 
     chosen = [i for i in range(big_n) if fits[i] < 1]
     if len(chosen) < sel_count:
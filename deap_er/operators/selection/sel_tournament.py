@@ -8,6 +8,8 @@
 #   
 #   SPDX-License-Identifier: MIT
 #
+from deap_er.base.population_matrix import PopulationMatrix
+from deap_er.utilities.sorting.dominance import weighted_values, pairwise_dominance
 from .sel_various import sel_random
 from operator import attrgetter
 from functools import partial
@@ -30,6 +32,8 @@ def sel_tournament(individuals: list, rounds: int,
     :param fit_attr: The attribute of individuals to use as the selection criterion.
     :return: A list of selected individuals.
     """
+    if isinstance(individuals, PopulationMatrix) and fit_attr == 'fitness':
+        return individuals.take(individuals.tournament(rounds, contestants))
     chosen = []
     for _ in range(rounds):
         aspirants = sel_random(individuals, contestants)
@@ -94,7 +98,8 @@ def sel_tournament_dcd(individuals: list, sel_count: int) -> list:
     length has to be a multiple of four only if the **sel_count** is equal
     to the length of **individuals**. This selection requires the individuals
     to have the *crowding_dist* attribute, which can be set by the
-    *assign_crowding_dist* function.
+    *assign_crowding_dist* function. The dominance between the
+    contestants of all the tournaments is computed at once.
 
     :param individuals: A list of individuals to select from.
     :param sel_count: The number of individuals to select.
@@ -112,27 +117,34 @@ def sel_tournament_dcd(individuals: list, sel_count: int) -> list:
             "by four if sel_count == len(individuals)"
         )
 
-    def tourney(ind1, ind2):
-        if ind1.fitness.dominates(ind2.fitness):
-            return ind1
-        elif ind2.fitness.dominates(ind1.fitness):
-            return ind2
-        if ind1.fitness.crowding_dist < ind2.fitness.crowding_dist:
-            return ind2
-        elif ind1.fitness.crowding_dist > ind2.fitness.crowding_dist:
-            return ind1
-        if random.random() <= 0.5:
-            return ind1
-        return ind2
-
     individuals_1 = random.sample(individuals, len(individuals))
     individuals_2 = random.sample(individuals, len(individuals))
 
-    chosen = []
+    pairs = []
     for i in range(0, sel_count, 4):
-        chosen.append(tourney(individuals_1[i],   individuals_1[i+1]))
-        chosen.append(tourney(individuals_1[i+2], individuals_1[i+3]))
-        chosen.append(tourney(individuals_2[i],   individuals_2[i+1]))
-        chosen.append(tourney(individuals_2[i+2], individuals_2[i+3]))
+        pairs.append((individuals_1[i],   individuals_1[i+1]))
+        pairs.append((individuals_1[i+2], individuals_1[i+3]))
+        pairs.append((individuals_2[i],   individuals_2[i+1]))
+        pairs.append((individuals_2[i+2], individuals_2[i+3]))
+
+    first = weighted_values([ind1 for ind1, _ in pairs])
+    second = weighted_values([ind2 for _, ind2 in pairs])
+    first_wins = pairwise_dominance(first, second).tolist()
+    second_wins = pairwise_dominance(second, first).tolist()
+
+    chosen = []
+    for (ind1, ind2), win1, win2 in zip(pairs, first_wins, second_wins):
+        if win1:
+            chosen.append(ind1)
+        elif win2:
+            chosen.append(ind2)
+        elif ind1.fitness.crowding_dist < ind2.fitness.crowding_dist:
+            chosen.append(ind2)
+        elif ind1.fitness.crowding_dist > ind2.fitness.crowding_dist:
+            chosen.append(ind1)
+        elif random.random() <= 0.5:
+            chosen.append(ind1)
+        else:
+            chosen.append(ind2)
 
     return chosen
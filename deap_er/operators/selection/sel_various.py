@@ -8,8 +8,10 @@
 #   
 #   SPDX-License-Identifier: MIT
 #
+from deap_er.base.population_matrix import PopulationMatrix
 from operator import attrgetter
 import random
+import numpy
 
 
 __all__ = [
@@ -27,6 +29,8 @@ def sel_random(individuals: list, sel_count: int) -> list:
     :param sel_count: The number of individuals to select.
     :return: A list of selected individuals.
     """
+    if isinstance(individuals, PopulationMatrix):
+        return individuals.take(numpy.random.randint(0, len(individuals), sel_count))
     return [random.choice(individuals) for _ in range(sel_count)]
 
 
@@ -41,6 +45,8 @@ def sel_best(individuals: list, sel_count: int,
     :param fit_attr: The attribute of individuals to use as the selection criterion.
     :return: A list of selected individuals.
     """
+    if isinstance(individuals, PopulationMatrix) and fit_attr == 'fitness':
+        return individuals.take(individuals.rank()[:sel_count])
     key = attrgetter(fit_attr)
     return sorted(individuals, key=key, reverse=True)[:sel_count]
 
@@ -56,6 +62,8 @@ def sel_worst(individuals: list, sel_count: int,
     :param fit_attr: The attribute of individuals to use as the selection criterion.
     :return: A list of selected individuals.
     """
+    if isinstance(individuals, PopulationMatrix) and fit_attr == 'fitness':
+        return individuals.take(individuals.rank()[::-1][:sel_count])
     key = attrgetter(fit_attr)
     return sorted(individuals, key=key)[:sel_count]
 
@@ -9,10 +9,13 @@
 #   SPDX-License-Identifier: MIT
 #
 from deap_er.base.dtypes import *
+from deap_er.base.cloning import clone
+from deap_er.utilities.sorting.dominance import weighted_values, dominance_matrix
+from collections import defaultdict
 from typing import Callable, Optional
 from bisect import bisect_right
-from copy import deepcopy
 from operator import eq
+import numpy
 
 
 __all__ = ['HallOfFame', 'ParetoFront']
@@ -41,7 +44,7 @@ class _BaseClass:
         :return: Nothing.
         """
         if hasattr(individual, 'fitness'):
-            individual = deepcopy(individual)
+            individual = clone(individual)
             i = bisect_right(self.keys, individual.fitness)
             self.items.insert(len(self) - i, individual)
             self.keys.insert(i, individual.fitness)
@@ -147,28 +150,30 @@ class ParetoFront(_BaseClass):
         Updates the Pareto front hall of fame with the **population** by adding
         the individuals from the population that are not dominated by the hall
         of fame. If any individual in the hall of fame is dominated, it is removed.
+        The dominance relations are computed at once with the
+        :func:`dominance_matrix` function.
 
         :param population: A list of individual with a fitness
             attribute to update the hall of fame with.
         :return: Nothing.
         """
-        for ind in population:
-            is_dominated = False
-            dominates_one = False
-            has_twin = False
-            to_remove = list()
-            for i, hof_member in enumerate(self):
-                if not dominates_one and hof_member.fitness.dominates(ind.fitness):
-                    is_dominated = True
-                    break
-                elif ind.fitness.dominates(hof_member.fitness):
-                    dominates_one = True
-                    to_remove.append(i)
-                elif ind.fitness == hof_member.fitness and self.similar(ind, hof_member):
-                    has_twin = True
-                    break
-
-            for i in reversed(to_remove):
+        population = list(population)
+        if not population:
+            return
+
+        candidates = weighted_values(population)
+        dominance = dominance_matrix(population + self.items, candidates)
+        survivors = numpy.flatnonzero(~dominance.any(axis=0))
+        if len(self):
+            removed = dominance_matrix(candidates[survivors], self.items).any(axis=0)
+            for i in reversed(numpy.flatnonzero(removed)):
                 self.remove(i)
-            if not is_dominated and not has_twin:
+
+        twins = defaultdict(list)
+        for hof_member in self:
+            twins[hof_member.fitness].append(hof_member)
+        for i in survivors:
+            ind = population[i]
+            if not any(self.similar(ind, twin) for twin in twins[ind.fitness]):
                 self.insert(ind)
+                twins[ind.fitness].append(ind)
@@ -9,8 +9,8 @@
 #   SPDX-License-Identifier: MIT
 #
 from deap_er.base.dtypes import *
+from deap_er.base.cloning import clone
 from typing import Callable
-from copy import deepcopy
 
 
 __all__ = ['History']
@@ -59,7 +59,7 @@ class History:
         for ind in individuals:
             self.genealogy_index += 1
             ind.history_index = self.genealogy_index
-            self.genealogy_history[self.genealogy_index] = deepcopy(ind)
+            self.genealogy_history[self.genealogy_index] = clone(ind)
             self.genealogy_tree[self.genealogy_index] = parent_indices
 
     # -------------------------------------------------------- #
@@ -10,6 +10,7 @@
 #
 from typing import Callable, Optional, Iterable
 from functools import partial
+import numpy
 
 
 __all__ = ['Statistics', 'MultiStatistics']
@@ -27,13 +28,16 @@ class Statistics:
     a tuple or a list, as long as the registered statistical function
     supports it. For example, statistics can be computed directly on
     multi-objective fitness when using numpy statistical function.
+    If no key is provided and the data is an ndarray, e.g. the fitness
+    values of a PopulationMatrix, the array is passed to the statistical
+    functions as is, without splitting it into a tuple of rows.
 
     :param key: A function that takes an object and returns a
         value on which the statistics will be computed.
     """
     # -------------------------------------------------------- #
     def __init__(self, key: Optional[Callable] = None):
-        self.key = key if key else lambda obj: obj
+        self.key = key if key else _identity
         self.functions = dict()
         self.fields = list()
 
@@ -64,7 +68,10 @@ class Statistics:
         :return: A dictionary containing the statistics.
         """
         entry = dict()
-        values = tuple(self.key(elem) for elem in data)
+        if self.key is _identity and isinstance(data, numpy.ndarray):
+            values = data
+        else:
+            values = tuple(self.key(elem) for elem in data)
         for key, func in self.functions.items():
             entry[key] = func(values)
         return entry
@@ -112,3 +119,8 @@ class MultiStatistics(dict):
         for name, stats in self.items():
             record[name] = stats.compile(data)
         return record
+
+
+# -------------------------------------------------------------------------------------- #
+def _identity(obj: object) -> object:
+    return obj
@@ -12,5 +12,6 @@ from .hypervolume import *
 from .sorting import *
 from .bm_decors import *
 from .constraints import *
+from .fitness_cache import *
 from .initializers import *
 from .metrics import *
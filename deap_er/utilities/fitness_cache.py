@@ -0,0 +1,146 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.gp.primitives import PrimitiveTree
+from deap_er.base.dtypes import *
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from functools import wraps
+import array
+import numpy
+
+
+__all__ = ['FitnessCache', 'genome_key']
+
+
+# ====================================================================================== #
+def genome_key(individual: Individual) -> Hashable:
+    """
+    Returns a hashable key of the genome of the **individual**. Numpy
+    and array individuals are keyed by their raw bytes, a PrimitiveTree
+    is keyed by its string form and other sequences by their items.
+
+    :param individual: The individual to compute the key for.
+    :return: A hashable key, which is equal for equal genomes.
+
+    :type individual: :ref:`Individual <datatypes>`
+    """
+    if isinstance(individual, numpy.ndarray):
+        return individual.dtype.str, individual.shape, individual.tobytes()
+    if isinstance(individual, array.array):
+        return individual.typecode, individual.tobytes()
+    if isinstance(individual, PrimitiveTree):
+        return str(individual)
+    return tuple(individual)
+
+
+# ====================================================================================== #
+class FitnessCache:
+    """
+    A decorator for evaluation functions, which memoizes the fitness values of
+    the evaluated genomes. When the decorated function is called with a genome
+    that has already been evaluated, the cached fitness values are returned
+    without calling the evaluation function. The cached fitness values depend
+    only on the genome, so any extra arguments of the evaluation function
+    are ignored. The least recently used entries are evicted when the
+    cache is full. The cache can also be added into a MultiStatistics
+    object to record the cache counters into the logbook.
+
+    The decorator must be applied to the *'evaluate'* operator when the
+    *'map'* operator is the builtin function. When a parallel *'map'* is
+    used, the :func:`map_decorator` must be applied to the *'map'*
+    operator instead, so that the cache lives in the main process.
+
+    :param maxsize: The maximum number of genomes to cache, optional.
+        The default value is 100 000.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.fields = ['hits', 'misses', 'size']
+
+    # -------------------------------------------------------- #
+    def __call__(self, func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(individual, *args, **kwargs):
+            key = genome_key(individual)
+            if key in self.cache:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                return self.cache[key]
+            self.misses += 1
+            fit = func(individual, *args, **kwargs)
+            self._store(key, fit)
+            return fit
+        return wrapper
+
+    # -------------------------------------------------------- #
+    def map_decorator(self, map_func: Callable) -> Callable:
+        """
+        A decorator for the *'map'* operator, which evaluates only the
+        uncached genomes with the decorated map function. Each distinct
+        uncached genome is evaluated once per call. The results are cached
+        per mapped function, so the decorated *'map'* operator can also
+        be called with functions other than the *'evaluate'* operator.
+
+        :param map_func: The map function to decorate.
+        :return: The decorated map function.
+        """
+        @wraps(map_func)
+        def wrapper(func, individuals: Iterable):
+            individuals = list(individuals)
+            keys = [(func, genome_key(ind)) for ind in individuals]
+            fitness, pending = dict(), dict()
+            for key, ind in zip(keys, individuals):
+                if key in self.cache:
+                    self.hits += 1
+                    self.cache.move_to_end(key)
+                    fitness[key] = self.cache[key]
+                elif key in pending:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                    pending[key] = ind
+            results = map_func(func, list(pending.values()))
+            for key, fit in zip(list(pending.keys()), results):
+                fitness[key] = fit
+                self._store(key, fit)
+            return [fitness[key] for key in keys]
+        return wrapper
+
+    # -------------------------------------------------------- #
+    def compile(self, _: Iterable = None) -> dict:
+        """
+        Returns the current cache counters. This method enables the cache
+        object to be used as a member of a MultiStatistics object.
+
+        :return: A dictionary of the 'hits', 'misses' and 'size' counters.
+        """
+        return dict(hits=self.hits, misses=self.misses, size=len(self.cache))
+
+    # -------------------------------------------------------- #
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache and resets the counters.
+
+        :return: Nothing.
+        """
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    # -------------------------------------------------------- #
+    def _store(self, key: Hashable, fit: object) -> None:
+        self.cache[key] = fit
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
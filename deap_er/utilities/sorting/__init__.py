@@ -11,3 +11,4 @@
 from .sort_non_dominated import *
 from .sort_log_non_dominated import *
 from .sorting_network import *
+from .dominance import *
@@ -0,0 +1,127 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from typing import Optional, Union
+import numpy
+
+
+__all__ = [
+    'weighted_values', 'dominance_matrix', 'dominated_counts',
+    'dominator_lists', 'pairwise_dominance'
+]
+
+
+_BLOCK_ELEMENTS = 2 ** 22
+
+
+# ====================================================================================== #
+def weighted_values(individuals: Union[list, numpy.ndarray]) -> numpy.ndarray:
+    """
+    Collects the weighted fitness values of the **individuals** into an
+    *(N, M)* array. The rows of invalid fitnesses are filled with NaNs,
+    so they neither dominate nor are dominated by any other row, like
+    in the :meth:`Fitness.dominates` method. A PopulationMatrix
+    or an array is used as-is.
+
+    :param individuals: A list of individuals or fitnesses, a
+        PopulationMatrix or an array of weighted fitness values.
+    :return: An array of the weighted fitness values.
+    """
+    if hasattr(individuals, 'wvalues'):
+        return individuals.wvalues
+    if isinstance(individuals, numpy.ndarray):
+        return individuals
+    fits = [getattr(ind, 'fitness', ind) for ind in individuals]
+    if not fits:
+        return numpy.empty((0, 0))
+    objectives = len(fits[0].weights)
+    wvalues = [fit.wvalues for fit in fits]
+    if all(len(wv) == objectives for wv in wvalues):
+        return numpy.array(wvalues, dtype=float).reshape(len(fits), objectives)
+    array = numpy.full((len(fits), objectives), numpy.nan)
+    for i, wv in enumerate(wvalues):
+        if len(wv) == objectives:
+            array[i] = wv
+    return array
+
+
+# -------------------------------------------------------------------------------------- #
+def dominance_matrix(individuals: Union[list, numpy.ndarray],
+                     others: Union[list, numpy.ndarray] = None,
+                     chunk_size: Optional[int] = None) -> numpy.ndarray:
+    """
+    Computes the dominance relations between all the pairs of **individuals**
+    at once. The element *[i, j]* of the returned matrix is True when the i-th
+    individual dominates the j-th individual in the same sense as the
+    :meth:`Fitness.dominates` method. The matrix is computed in blocks
+    of rows to bound the memory of the intermediate arrays.
+
+    :param individuals: A list of individuals, a PopulationMatrix
+        or an *(N, M)* array of weighted fitness values.
+    :param others: The individuals of the columns, optional. By default,
+        the **individuals** are compared against themselves.
+    :param chunk_size: The number of rows to compute at once, optional.
+        By default, it is chosen from the size of the inputs.
+    :return: An *(N, K)* boolean dominance matrix.
+    """
+    rows = weighted_values(individuals)
+    cols = rows if others is None else weighted_values(others)
+    if chunk_size is None:
+        chunk_size = _BLOCK_ELEMENTS // max(len(cols), 1)
+    chunk_size = max(chunk_size, 1)
+
+    matrix = numpy.empty((len(rows), len(cols)), dtype=bool)
+    for start in range(0, len(rows), chunk_size):
+        block = rows[start:start + chunk_size, None, :]
+        matrix[start:start + chunk_size] = pairwise_dominance(block, cols[None, :, :])
+    return matrix
+
+
+# -------------------------------------------------------------------------------------- #
+def dominated_counts(matrix: numpy.ndarray) -> numpy.ndarray:
+    """
+    Counts the number of individuals which dominate each individual.
+
+    :param matrix: A dominance matrix from the :func:`dominance_matrix` function.
+    :return: An array of the dominator counts.
+    """
+    return matrix.sum(axis=0)
+
+
+# -------------------------------------------------------------------------------------- #
+def dominator_lists(matrix: numpy.ndarray) -> list[numpy.ndarray]:
+    """
+    Collects the indices of the individuals which dominate each individual.
+
+    :param matrix: A dominance matrix from the :func:`dominance_matrix` function.
+    :return: A list of index arrays, one for each column of the **matrix**.
+    """
+    return [numpy.flatnonzero(column) for column in matrix.T]
+
+
+# -------------------------------------------------------------------------------------- #
+def pairwise_dominance(wvalues1: numpy.ndarray, wvalues2: numpy.ndarray) -> numpy.ndarray:
+    """
+    Tests whether the rows of **wvalues1** dominate the corresponding rows
+    of **wvalues2**. The arrays are broadcast against each other over all
+    but their last axis, which contains the weighted fitness values.
+
+    :param wvalues1: An array of weighted fitness values.
+    :param wvalues2: An array of weighted fitness values.
+    :return: A boolean array of the broadcast shape without the last axis.
+    """
+    # looping over the few objectives is faster than reducing over the last axis
+    shape = numpy.broadcast_shapes(wvalues1.shape, wvalues2.shape)[:-1]
+    not_worse = numpy.ones(shape, dtype=bool)
+    better = numpy.zeros(shape, dtype=bool)
+    for obj in range(wvalues1.shape[-1]):
+        not_worse &= wvalues1[..., obj] >= wvalues2[..., obj]
+        better |= wvalues1[..., obj] > wvalues2[..., obj]
+    return not_worse & better
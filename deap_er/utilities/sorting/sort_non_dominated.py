@@ -8,7 +8,9 @@
 #   
 #   SPDX-License-Identifier: MIT
 #
+from .dominance import dominance_matrix, dominated_counts
 from collections import defaultdict
+import numpy
 
 
 __all__ = ['sort_non_dominated']
@@ -20,7 +22,9 @@ def sort_non_dominated(individuals: list, sel_count: int,
     """
     Sorts the first 'sel_count' of 'individuals' into
     different non-domination levels using the
-    "Fast Non-dominated Sorting Approach".
+    "Fast Non-dominated Sorting Approach". The dominance relations
+    between the unique fitnesses are computed at once with the
+    :func:`dominance_matrix` function.
 
     :param individuals: A list of individuals to sort.
     :param sel_count: The number of individuals to select.
@@ -36,39 +40,24 @@ def sort_non_dominated(individuals: list, sel_count: int,
         map_fit_ind[ind.fitness].append(ind)
     fits = list(map_fit_ind.keys())
 
-    current_front = []
-    next_front = []
-    dominating_fits = defaultdict(int)
-    dominated_fits = defaultdict(list)
-
-    for i, fit_i in enumerate(fits):
-        for fit_j in fits[i+1:]:
-            if fit_i.dominates(fit_j):
-                dominating_fits[fit_j] += 1
-                dominated_fits[fit_i].append(fit_j)
-            elif fit_j.dominates(fit_i):
-                dominating_fits[fit_i] += 1
-                dominated_fits[fit_j].append(fit_i)
-        if dominating_fits[fit_i] == 0:
-            current_front.append(fit_i)
+    dominance = dominance_matrix(fits)
+    dominating_fits = dominated_counts(dominance)
+    current_front = numpy.flatnonzero(dominating_fits == 0)
 
     fronts = [[]]
-    for fit in current_front:
-        fronts[-1].extend(map_fit_ind[fit])
+    for i in current_front:
+        fronts[-1].extend(map_fit_ind[fits[i]])
     pareto_sorted = len(fronts[-1])
 
     if not ffo:
         big_n = min(len(individuals), sel_count)
         while pareto_sorted < big_n:
             fronts.append([])
-            for fit_p in current_front:
-                for fit_d in dominated_fits[fit_p]:
-                    dominating_fits[fit_d] -= 1
-                    if dominating_fits[fit_d] == 0:
-                        next_front.append(fit_d)
-                        pareto_sorted += len(map_fit_ind[fit_d])
-                        fronts[-1].extend(map_fit_ind[fit_d])
-            current_front = next_front
-            next_front = []
+            dominating_fits[current_front] = -1
+            dominating_fits -= dominance[current_front].sum(axis=0)
+            current_front = numpy.flatnonzero(dominating_fits == 0)
+            for i in current_front:
+                pareto_sorted += len(map_fit_ind[fits[i]])
+                fronts[-1].extend(map_fit_ind[fits[i]])
 
     return fronts
@@ -0,0 +1,133 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from multiprocessing.connection import Client
+from typing import Optional, Union
+import multiprocessing
+import traceback
+import argparse
+import time
+import dill
+
+
+__all__ = ['run_worker', 'parse_address', 'main']
+
+
+# ====================================================================================== #
+def run_worker(address: Union[tuple, str], authkey: bytes,
+               retry_interval: Optional[float] = 1.0,
+               max_retries: Optional[int] = None) -> None:
+    """
+    Connects to a :class:`~deap_er.base.DistributedMap` coordinator at the
+    **address** and processes the tasks it serves, until the coordinator
+    is closed. If the connection cannot be established or it is lost,
+    the worker tries to reconnect every **retry_interval** seconds.
+
+    :param address: A *(host, port)* tuple of a TCP
+        socket or a path of a Unix socket.
+    :param authkey: The secret key of the coordinator.
+    :param retry_interval: The number of seconds between the
+        connection attempts, optional. The default value is 1.0.
+    :param max_retries: The maximum number of consecutive failed connection
+        attempts, optional. By default, the worker retries indefinitely.
+    :return: Nothing.
+    """
+    failures = 0
+    while True:
+        try:
+            conn = Client(address, authkey=authkey)
+        except OSError:
+            failures += 1
+            if max_retries is not None and failures > max_retries:
+                return
+            time.sleep(retry_interval)
+            continue
+
+        failures = 0
+        payload, func = None, None
+        try:
+            while True:
+                task = conn.recv()
+                if task is None:
+                    return
+                try:
+                    if task[0] != payload:
+                        payload, func = None, dill.loads(task[0])
+                        payload = task[0]
+                    results = [func(item) for item in task[1]]
+                    conn.send(('ok', results))
+                except Exception:
+                    conn.send(('error', traceback.format_exc()))
+        except (EOFError, OSError):
+            time.sleep(retry_interval)
+        finally:
+            conn.close()
+
+
+# -------------------------------------------------------------------------------------- #
+def parse_address(address: str) -> Union[tuple, str]:
+    """
+    Parses a *'host:port'* string into a TCP socket address.
+    Any other string is treated as a path of a Unix socket.
+
+    :param address: The address string to parse.
+    :return: A *(host, port)* tuple or a path of a Unix socket.
+    """
+    host, sep, port = address.rpartition(':')
+    if sep and port.isdigit():
+        return host or 'localhost', int(port)
+    return address
+
+
+# -------------------------------------------------------------------------------------- #
+def main(argv: Optional[list] = None) -> None:
+    """
+    The command line entry point of the distributed workers,
+    which is executed with :code:`python -m deap_er.worker`.
+
+    :param argv: The command line arguments, optional.
+    :return: Nothing.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m deap_er.worker',
+        description='Starts worker processes for a DEAP-ER distributed map.'
+    )
+    parser.add_argument('address', help="'host:port' or a path of a Unix socket")
+    parser.add_argument('--authkey', required=True, help='the secret key of the coordinator')
+    parser.add_argument('--processes', type=int, default=1, help='the number of worker processes')
+    parser.add_argument('--retry-interval', type=float, default=1.0,
+                        help='the number of seconds between the connection attempts')
+    parser.add_argument('--max-retries', type=int, default=None,
+                        help='the maximum number of consecutive failed connection attempts')
+    args = parser.parse_args(argv)
+
+    worker_args = (
+        parse_address(args.address),
+        args.authkey.encode(),
+        args.retry_interval,
+        args.max_retries
+    )
+    if args.processes == 1:
+        run_worker(*worker_args)
+        return
+
+    workers = [
+        multiprocessing.Process(target=run_worker, args=worker_args)
+        for _ in range(args.processes)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+# -------------------------------------------------------------------------------------- #
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+from deap_er import creator
+from deap_er import base
+import pickle
+import array
+import numpy
+import time
+
+
+POP_SIZE = 10_000
+IND_SIZE = 1_000
+
+
+creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+creator.create("NumpyIndividual", numpy.ndarray, fitness=creator.FitnessMin)
+creator.create("ArrayIndividual", array.array, typecode='d', fitness=creator.FitnessMin)
+
+
+class LegacyNumpyIndividual(creator.NumpyIndividual):
+    def __reduce_ex__(self, protocol):  # serializes the genome as a list of floats
+        return self.__reduce__()
+
+
+class LegacyArrayIndividual(creator.ArrayIndividual):
+    def __reduce_ex__(self, protocol):  # serializes the genome as a list of floats
+        return self.__reduce__()
+
+
+def make_population(container):
+    population = []
+    for _ in range(POP_SIZE):
+        ind = container(numpy.random.rand(IND_SIZE))
+        ind.fitness.values = (ind[0],)
+        population.append(ind)
+    return population
+
+
+def measure(population, protocol, out_of_band=False):
+    buffers = [] if out_of_band else None
+    callback = buffers.append if out_of_band else None
+
+    start = time.perf_counter()
+    data = pickle.dumps(population, protocol, buffer_callback=callback)
+    dump_time = time.perf_counter() - start
+    size = len(data) + sum(buf.raw().nbytes for buf in buffers or [])
+
+    start = time.perf_counter()
+    pickle.loads(data, buffers=buffers)
+    load_time = time.perf_counter() - start
+    return size, dump_time, load_time
+
+
+def main():
+    print(f"Population of {POP_SIZE} individuals with {IND_SIZE} floats each.\n")
+    print(f"{'individual':<24}{'method':<24}{'size (MB)':>12}{'dumps (s)':>12}{'loads (s)':>12}")
+    cases = [
+        (LegacyNumpyIndividual, "list of floats", 4, False),
+        (creator.NumpyIndividual, "protocol 4, bytes", 4, False),
+        (creator.NumpyIndividual, "protocol 5, in-band", 5, False),
+        (creator.NumpyIndividual, "protocol 5, out-of-band", 5, True),
+        (LegacyArrayIndividual, "list of floats", 4, False),
+        (creator.ArrayIndividual, "protocol 4, bytes", 4, False),
+        (creator.ArrayIndividual, "protocol 5, in-band", 5, False),
+        (creator.ArrayIndividual, "protocol 5, out-of-band", 5, True),
+    ]
+    for container, method, protocol, out_of_band in cases:
+        population = make_population(container)
+        size, dump_time, load_time = measure(population, protocol, out_of_band)
+        name = container.__name__
+        print(f"{name:<24}{method:<24}{size / 2 ** 20:>12.1f}{dump_time:>12.3f}{load_time:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,16 @@
 from deap_er import tools
 from deap_er import creator
 from deap_er import base
+from deap_er import env
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+import pytest
 import random
+import threading
+import os
+import pickle
+import time
 import numpy
 
 
@@ -235,3 +244,648 @@ def test_nsga3():
         assert not (any(numpy.asarray(ind) < bound_low) or any(numpy.asarray(ind) > bound_up))
 
     teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+def test_batch_evaluation():
+    setup_func_single_obj()
+
+    def evaluate_batch(individuals):
+        genomes = numpy.asarray(individuals)
+        return numpy.sum(genomes ** 2, axis=1)
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_float", random.uniform, -1.0, 1.0)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_float, 5)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_blend, alpha=0.5)
+    toolbox.register("mutate", tools.mut_gaussian, mu=0.0, sigma=0.1, mut_prob=0.2)
+    toolbox.register("select", tools.sel_tournament, contestants=3)
+    toolbox.register("evaluate_batch", evaluate_batch)
+
+    pop = toolbox.population(size=50)
+    nevals = tools.evaluate_invalids(toolbox, pop)
+    assert nevals == len(pop)
+    assert all(ind.fitness.is_valid() for ind in pop)
+    assert tools.evaluate_invalids(toolbox, pop) == 0
+
+    pop, log = tools.ea_simple(toolbox, pop, generations=30, cx_prob=0.5, mut_prob=0.2)
+    best, = tools.sel_best(pop, sel_count=1)
+
+    assert all(ind.fitness.is_valid() for ind in pop)
+    assert best.fitness.values[0] == pytest.approx(sum(x ** 2 for x in best))
+    assert best.fitness.values < (0.1,)
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+def test_steady_state_async():
+    setup_func_single_obj()
+
+    async def evaluate(individual):
+        await asyncio.sleep(random.random() * 0.001)
+        return tools.bm_sphere(individual)
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_float", random.uniform, -1.0, 1.0)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_float, 5)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_blend, alpha=0.5)
+    toolbox.register("mutate", tools.mut_gaussian, mu=0.0, sigma=0.1, mut_prob=0.2)
+    toolbox.register("select", tools.sel_best)
+    toolbox.register("evaluate", evaluate)
+
+    pop = toolbox.population(size=20)
+    hof = tools.HallOfFame(maxsize=1)
+    coro = tools.ea_steady_state_async(
+        toolbox, pop, evaluations=1000, in_flight=8,
+        cx_prob=0.5, mut_prob=0.5, record_freq=100, hof=hof
+    )
+    pop, log = asyncio.run(coro)
+
+    assert len(pop) == 20
+    assert log.select('evals') == list(range(0, 1001, 100))
+    assert sum(log.select('nevals')) == 1020
+    assert hof[0].fitness.values < (0.01,)
+
+    toolbox.register("evaluate", tools.bm_sphere)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        coro = tools.ea_steady_state_async(
+            toolbox, pop, evaluations=50, in_flight=4,
+            cx_prob=0.5, mut_prob=0.5, executor=executor
+        )
+        pop, log = asyncio.run(coro)
+    assert log.select('evals') == [0, 20, 40, 50]
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+def test_iter_resume(tmp_path):
+    setup_func_single_obj()
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_float", random.uniform, -1.0, 1.0)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_float, 5)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_blend, alpha=0.5)
+    toolbox.register("mutate", tools.mut_gaussian, mu=0.0, sigma=0.1, mut_prob=0.2)
+    toolbox.register("select", tools.sel_tournament, contestants=3)
+    toolbox.register("evaluate", tools.bm_sphere)
+
+    cpt = env.Checkpoint(dir_path=tmp_path, autoload=False)
+    cpt.pop = toolbox.population(size=20)
+    tools.evaluate_invalids(toolbox, cpt.pop)
+    cpt.log = tools.Logbook()
+
+    iterator = tools.iter_ea_mu_plus_lambda(
+        toolbox, cpt.pop, generations=10, offsprings=20, survivors=20,
+        cx_prob=0.5, mut_prob=0.2, logbook=cpt.log
+    )
+    for state in iterator:
+        assert state.population is cpt.pop
+        assert state.evals == sum(cpt.log.select('nevals'))
+        if state.gen == 4:
+            break
+    assert cpt.save()
+
+    cpt = env.Checkpoint(file_name=cpt.file_path.name, dir_path=tmp_path)
+    assert cpt.is_loaded()
+    states = list(tools.iter_ea_mu_plus_lambda(
+        toolbox, cpt.pop, generations=3, offsprings=20, survivors=20,
+        cx_prob=0.5, mut_prob=0.2, logbook=cpt.log
+    ))
+    assert [state.gen for state in states] == [5, 6, 7]
+    assert cpt.log.select('gen') == list(range(1, 8))
+    assert states[-1].elapsed >= states[0].gen_time
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+def test_termination():
+    setup_func_single_obj()
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_float", random.uniform, -1.0, 1.0)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_float, 5)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_blend, alpha=0.5)
+    toolbox.register("mutate", tools.mut_gaussian, mu=0.0, sigma=0.1, mut_prob=0.2)
+    toolbox.register("select", tools.sel_tournament, contestants=3)
+    toolbox.register("evaluate", tools.bm_sphere)
+
+    pop = toolbox.population(size=20)
+    terminate = tools.MaxEvaluations(100) | tools.MaxTime(60.0)
+    _, log = tools.ea_mu_comma_lambda(
+        toolbox, pop, generations=None, offsprings=20, survivors=20,
+        cx_prob=0.5, mut_prob=0.2, terminate=terminate
+    )
+    nevals = log.select('nevals')
+    assert sum(nevals[:-1]) < 100 <= sum(nevals)
+    assert log[-1]['stop'] == 'max_evaluations'
+    assert all('stop' not in entry for entry in log[:-1])
+    assert log.header[-1] == 'stop'
+    assert str(log).splitlines()[-1].rstrip().endswith('max_evaluations')
+
+    hof = tools.HallOfFame(maxsize=1)
+    terminate = tools.TargetFitness((1.0,), hof) | tools.Stagnation(hof, 5)
+    _, log = tools.ea_simple(
+        toolbox, pop, generations=50, cx_prob=0.5,
+        mut_prob=0.2, hof=hof, terminate=terminate
+    )
+    assert log[-1]['stop'] in ('target_fitness', 'stagnation')
+    assert len(log) < 50
+
+    _, log = tools.ea_simple(
+        toolbox, pop, generations=50, cx_prob=0.5, mut_prob=0.0,
+        terminate=tools.DiversityCollapse(threshold=1.0)
+    )
+    assert log[-1]['stop'] == 'diversity_collapse'
+
+    with pytest.raises(ValueError):
+        tools.ea_simple(toolbox, pop, None, cx_prob=0.5, mut_prob=0.2)
+
+    _, log = tools.ea_simple(toolbox, pop, 2, 0.5, 0.2, None, None, True)
+    assert len(log) == 2
+    _, log = tools.ea_mu_plus_lambda(toolbox, pop, 2, 20, 20, 0.5, 0.2, None, None, True)
+    assert len(log) == 2
+    with pytest.raises(TypeError):
+        tools.ea_simple(toolbox, pop, 2, 0.5, 0.2, None, None, False, terminate)
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+def test_island_model():
+    setup_func_single_obj()
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_float", random.uniform, -1.0, 1.0)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_float, 5)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_blend, alpha=0.5)
+    toolbox.register("mutate", tools.mut_gaussian, mu=0.0, sigma=0.1, mut_prob=0.2)
+    toolbox.register("select", tools.sel_tournament, contestants=3)
+    toolbox.register("evaluate", tools.bm_sphere)
+
+    pops = [toolbox.population(size=20) for _ in range(3)]
+    for pop in pops:
+        tools.evaluate_invalids(toolbox, pop)
+
+    model = tools.IslandModel(
+        toolbox, tools.ea_simple, mig_freq=5, mig_count=2,
+        selection=tools.sel_best, cx_prob=0.5, mut_prob=0.2
+    )
+    hof = tools.HallOfFame(maxsize=3)
+    pops, logs = model.run(pops, generations=12, hof=hof)
+
+    assert len(pops) == len(logs) == 3
+    for pop, log in zip(pops, logs):
+        assert len(pop) == 20
+        assert all(ind.fitness.is_valid() for ind in pop)
+        assert log.select('gen') == list(range(1, 13))
+    assert len(hof) == 3
+    best = min(ind.fitness.values for pop in pops for ind in pop)
+    assert hof[0].fitness.values <= best
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+def _crashing_algorithm(toolbox, population, generations):
+    os._exit(3)
+
+
+# -------------------------------------------------------------------------------------- #
+def test_island_model_dead_worker():
+    setup_func_single_obj()
+
+    toolbox = base.Toolbox()
+    toolbox.register("individual", creator.__dict__[INDCLSNAME], [0.0] * 5)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+
+    model = tools.IslandModel(
+        toolbox, _crashing_algorithm, mig_freq=5,
+        mig_count=2, selection=tools.sel_best
+    )
+    pops = [toolbox.population(size=5) for _ in range(2)]
+    with pytest.raises(RuntimeError, match="exit code 3"):
+        model.run(pops, generations=10)
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+def test_variation_matrix():
+    toolbox = base.Toolbox()
+    toolbox.register("mate_batch", tools.cx_blend_batch, alpha=0.5)
+    toolbox.register("mutate_batch", tools.mut_gaussian_batch, mu=0.0, sigma=0.1, mut_prob=0.2)
+    toolbox.register("select", tools.sel_tournament, contestants=3)
+
+    genomes = numpy.random.uniform(-5.0, 5.0, (100, 10))
+    fitness = numpy.sum(genomes ** 2, axis=1)
+    initial = numpy.mean(fitness)
+
+    for _ in range(50):
+        offspring, origin = tools.var_and_matrix(toolbox, genomes, 0.5, 0.2)
+        assert offspring.shape == genomes.shape
+        assert offspring is not genomes
+        kept = origin >= 0
+        assert numpy.array_equal(offspring[kept], genomes[origin[kept]])
+
+        fit = numpy.where(kept, fitness[numpy.maximum(origin, 0)], 0.0)
+        fit[~kept] = numpy.sum(offspring[~kept] ** 2, axis=1)
+
+        children, origin = tools.var_or_matrix(toolbox, offspring, 100, 0.3, 0.3)
+        assert children.shape == offspring.shape
+        kept = origin >= 0
+        assert numpy.array_equal(children[kept], offspring[origin[kept]])
+
+        child_fit = numpy.sum(children ** 2, axis=1)
+        pool = numpy.concatenate([offspring, children])
+        pool_fit = numpy.concatenate([fit, child_fit])
+        best = numpy.argsort(pool_fit)[:100]
+        genomes, fitness = pool[best], pool_fit[best]
+
+    assert numpy.mean(fitness) < initial / 10
+
+    with pytest.raises(ValueError):
+        tools.var_and_matrix(toolbox, genomes, 1.5, 0.2)
+    with pytest.raises(ValueError):
+        tools.var_or_matrix(toolbox, genomes, 10, 0.7, 0.7)
+
+
+# -------------------------------------------------------------------------------------- #
+def test_var_and_lazy_clone():
+    setup_func_single_obj()
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_float", random.uniform, -1.0, 1.0)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_float, 5)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_blend, alpha=0.5)
+    toolbox.register("mutate", tools.mut_gaussian, mu=0.0, sigma=0.1, mut_prob=0.2)
+    toolbox.register("select", tools.sel_tournament, contestants=3)
+    toolbox.register("evaluate", tools.bm_sphere)
+
+    pop = toolbox.population(size=50)
+    tools.evaluate_invalids(toolbox, pop)
+    parents = [pop[0]] * 25 + pop[:25]
+    genomes = [list(ind) for ind in parents]
+
+    offspring = tools.var_and(toolbox, parents, 0.5, 0.2, lazy_clone=True)
+    assert [list(ind) for ind in parents] == genomes
+    for ind, parent in zip(offspring, parents):
+        if ind.fitness.is_valid():
+            assert ind is parent
+        else:
+            assert ind is not parent
+    assert any(ind.fitness.is_valid() for ind in offspring)
+
+    _, log = tools.ea_simple(toolbox, pop, 20, cx_prob=0.5, mut_prob=0.2, lazy_clone=True)
+    assert len(log) == 20
+    assert all(ind.fitness.is_valid() for ind in pop)
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+def test_phase_profiler():
+    setup_func_single_obj()
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_float", random.uniform, -1.0, 1.0)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_float, 5)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_blend, alpha=0.5)
+    toolbox.register("mutate", tools.mut_gaussian, mu=0.0, sigma=0.1, mut_prob=0.2)
+    toolbox.register("select", tools.sel_tournament, contestants=3)
+    toolbox.register("evaluate", tools.bm_sphere)
+
+    pop = toolbox.population(size=30)
+    tools.evaluate_invalids(toolbox, pop)
+
+    calls = []
+    profiler = tools.PhaseProfiler(callback=lambda gen, t: calls.append(gen))
+    stats = tools.Statistics(lambda ind: ind.fitness.values)
+    stats.register("min", numpy.min)
+    hof = tools.HallOfFame(maxsize=1)
+
+    _, log = tools.ea_simple(
+        toolbox, pop, 5, cx_prob=0.5, mut_prob=0.2,
+        hof=hof, stats=stats, profiler=profiler
+    )
+    assert calls == list(range(1, 6))
+    assert 'timing' in log.header
+    timing = log.chapters['timing']
+    assert timing.select('gen') == list(range(1, 6))
+    for entry in timing:
+        phases = ['select', 'vary', 'evaluate', 'hof', 'stats']
+        assert all(entry[name] >= 0.0 for name in phases)
+        assert entry['total'] == pytest.approx(sum(entry[name] for name in phases))
+        assert entry['evals_per_sec'] > 0.0
+    assert 'timing' not in log[0]
+    assert log.select('min')[-1] is not None
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+def test_island_model_reproducible():
+    setup_func_single_obj()
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_float", random.uniform, -1.0, 1.0)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_float, 5)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_blend, alpha=0.5)
+    toolbox.register("mutate", tools.mut_gaussian, mu=0.0, sigma=0.1, mut_prob=0.2)
+    toolbox.register("select", tools.sel_tournament, contestants=3)
+    toolbox.register("evaluate", tools.bm_sphere)
+
+    model = tools.IslandModel(
+        toolbox, tools.ea_simple, mig_freq=3, mig_count=2,
+        selection=tools.sel_best, cx_prob=0.5, mut_prob=0.2
+    )
+    results = []
+    for _ in range(2):
+        with base.RandomStream(1234):
+            pops = [toolbox.population(size=10) for _ in range(3)]
+        for pop in pops:
+            tools.evaluate_invalids(toolbox, pop)
+        pops, _ = model.run(pops, generations=6, rng=base.RandomStream(99))
+        results.append([[list(ind) for ind in pop] for pop in pops])
+    assert results[0] == results[1]
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+@pytest.mark.parametrize("model", ['knn', 'rbf'])
+def test_surrogate(model):
+    setup_func_single_obj()
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_float", random.uniform, -5.0, 5.0)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_float, 5)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_blend, alpha=0.5)
+    toolbox.register("mutate", tools.mut_gaussian, mu=0.0, sigma=0.5, mut_prob=0.3)
+    toolbox.register("select", tools.sel_best)
+    toolbox.register("evaluate", tools.bm_sphere)
+
+    surrogate = tools.Surrogate(model=model, fraction=0.25, min_archive=30)
+    pop = toolbox.population(size=30)
+    tools.evaluate_invalids(toolbox, pop)
+    surrogate.update(pop)
+
+    predicted = surrogate.predict(pop)
+    assert predicted.shape == (30, 1)
+
+    toolbox.register("screen", surrogate)
+    mstats = tools.MultiStatistics(surrogate=surrogate)
+    pop, log = tools.ea_mu_plus_lambda(
+        toolbox, pop, 30, offsprings=40, survivors=30,
+        cx_prob=0.6, mut_prob=0.3, stats=mstats
+    )
+    assert max(log.select('nevals')) <= 10
+    assert log.chapters['surrogate'][-1]['screened'] > 0
+    assert min(ind.fitness.values[0] for ind in pop) < 1.0
+
+    pop, _ = tools.ea_mu_comma_lambda(
+        toolbox, pop, 5, offsprings=40, survivors=30,
+        cx_prob=0.6, mut_prob=0.4
+    )
+    assert len(pop) == 30 and len(set(map(id, pop))) == 30
+
+    with pytest.raises(ValueError):
+        tools.Surrogate(model='svm')
+    with pytest.raises(ValueError):
+        tools.Surrogate(fraction=0.0)
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+def test_deduplication():
+    setup_func_single_obj()
+
+    calls = []
+
+    def evaluate(ind):
+        calls.append(1)
+        return sum(ind),
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_bool", random.randint, 0, 1)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_bool, 8)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_two_point)
+    toolbox.register("mutate", tools.mut_flip_bit, mut_prob=0.05)
+    toolbox.register("select", tools.sel_tournament, contestants=3)
+    toolbox.register("evaluate", evaluate)
+
+    ind_cls = creator.__dict__[INDCLSNAME]
+    pop = [ind_cls([0] * 8) for _ in range(5)] + [ind_cls([1] * 8)]
+    pop[0].fitness.values = (0,)
+    assert tools.evaluate_invalids(toolbox, pop, unique=True) == 1
+    assert len(calls) == 1
+    assert all(ind.fitness.values == (sum(ind),) for ind in pop)
+    assert tools.remove_duplicates(pop) == [pop[0], pop[5]]
+    assert tools.remove_duplicates(pop, [pop[5]]) == [pop[0]]
+
+    pop = toolbox.population(size=30)
+    tools.evaluate_invalids(toolbox, pop)
+    calls.clear()
+    _, log = tools.ea_simple(toolbox, pop, 20, cx_prob=0.5, mut_prob=0.2, dedup='evaluate')
+    assert len(calls) == sum(log.select('nevals'))
+
+    toolbox.register("select", tools.sel_best)
+    pop = tools.remove_duplicates(toolbox.population(size=30))
+    tools.evaluate_invalids(toolbox, pop)
+    tools.ea_mu_plus_lambda(
+        toolbox, pop, 20, offsprings=30, survivors=len(pop),
+        cx_prob=0.5, mut_prob=0.5, dedup='remove'
+    )
+    assert len(pop) == len(tools.remove_duplicates(pop))
+
+    toolbox.register("mutate", tools.mut_flip_bit, mut_prob=0.2)
+    for algorithm in (tools.ea_mu_plus_lambda, tools.ea_mu_comma_lambda):
+        pop = [ind_cls([0] * 8) for _ in range(20)]
+        tools.evaluate_invalids(toolbox, pop)
+        algorithm(
+            toolbox, pop, 3, offsprings=24, survivors=20,
+            cx_prob=0.2, mut_prob=0.8, dedup='remove'
+        )
+        assert len(pop) == 20
+        assert len(tools.remove_duplicates(pop)) == 20
+
+    with pytest.raises(ValueError):
+        tools.ea_simple(toolbox, pop, 1, cx_prob=0.5, mut_prob=0.2, dedup='remove')
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+@pytest.mark.parametrize("strategy", ['rand/1/bin', 'best/1/bin', 'current-to-pbest/1/bin'])
+def test_differential_evolution(strategy):
+    setup_func_single_obj()
+
+    def evaluate_batch(individuals):
+        return numpy.square(numpy.asarray(individuals)).sum(axis=1)
+
+    toolbox = base.Toolbox()
+    toolbox.register("evaluate_batch", evaluate_batch)
+
+    numpy.random.seed(5)
+    genomes = numpy.random.uniform(-3, 3, (60, 5))
+    pop = base.PopulationMatrix(genomes, (-1.0,))
+    hof = tools.HallOfFame(1, similar=numpy.array_equal)
+    _, log = tools.ea_differential_evolution(
+        toolbox, pop, 150, strategy=strategy, bounds=(-3, 3), hof=hof
+    )
+    assert hof[0].fitness.values < (1e-4,)
+    assert log.select('nevals')[:2] == [120, 60]
+    assert pop.genomes.min() >= -3 and pop.genomes.max() <= 3
+
+    numpy.random.seed(5)
+    pop = base.PopulationMatrix(genomes, (-1.0,))
+    log = tools.Logbook()
+    for state in tools.iter_ea_differential_evolution(toolbox, pop, 10, logbook=log):
+        if state.gen == 4:
+            break
+    data = pickle.dumps((pop, log, numpy.random.get_state()))
+    expected = list(tools.iter_ea_differential_evolution(toolbox, pop, 6, logbook=log))[-1]
+
+    pop, log, numpy_state = pickle.loads(data)
+    numpy.random.set_state(numpy_state)
+    resumed = list(tools.iter_ea_differential_evolution(toolbox, pop, 6, logbook=log))[-1]
+    assert resumed.gen == expected.gen == 10
+    assert numpy.array_equal(resumed.population.genomes, expected.population.genomes)
+
+    ind_cls = creator.__dict__[INDCLSNAME]
+    pop = [ind_cls(row) for row in genomes.tolist()]
+    toolbox = base.Toolbox()
+    toolbox.register("evaluate", tools.bm_sphere)
+    tools.ea_differential_evolution(toolbox, pop, 100, strategy=strategy)
+    assert all(isinstance(ind, ind_cls) for ind in pop)
+    assert min(ind.fitness.values for ind in pop) < (1e-2,)
+
+    teardown_func()
+
+
+# -------------------------------------------------------------------------------------- #
+@pytest.mark.parametrize("topology", ['global', 'ring'])
+def test_particle_swarm(topology):
+    toolbox = base.Toolbox()
+    toolbox.register("evaluate_batch", lambda parts: numpy.square(numpy.asarray(parts)).sum(axis=1))
+
+    numpy.random.seed(11)
+    for inertia in [None, 0.6]:
+        swarm = tools.ParticleSwarm(
+            30, 5, (-5, 5), (-1.0,), topology=topology, inertia=inertia, max_speed=1.0
+        )
+        hof = tools.HallOfFame(1, similar=numpy.array_equal)
+        _, log = tools.ea_particle_swarm(toolbox, swarm, 150, hof=hof)
+        assert hof[0].fitness.values < (1e-4,)
+        assert swarm.leader.fitness.values == hof[0].fitness.values
+        assert numpy.abs(swarm.velocities).max() <= 1.0
+        assert sum(log.select('nevals')) == 30 * 150
+
+    random.seed(11)
+    mpb = tools.MovingPeaks(dimensions=5, **tools.MPConfigs.ALT1)
+    toolbox = base.Toolbox()
+    toolbox.register("evaluate", mpb)
+    factory = partial(tools.ParticleSwarm, 5, 5, (0, 100), (1.0,), topology=topology)
+    multi = tools.MultiSwarm(factory, swarms=1)
+    stats = tools.MultiStatistics(swarm=multi)
+    _, log = tools.ea_particle_swarm(toolbox, multi, 400, stats=stats)
+    assert max(log.chapters['swarm'].select('swarms')) > 1
+    assert sum(log.select('nevals')) == mpb.nevals
+    assert mpb.offline_error < 15
+
+
+# -------------------------------------------------------------------------------------- #
+def test_pipeline():
+    setup_func_single_obj()
+
+    calls = []
+
+    def evaluate(ind):
+        calls.append(1)
+        if len(calls) % 10 == 0:
+            time.sleep(0.05)
+        return sum(ind),
+
+    toolbox = base.Toolbox()
+    toolbox.register("attr_bool", random.randint, 0, 1)
+    toolbox.register("individual", tools.init_repeat,
+                     creator.__dict__[INDCLSNAME], toolbox.attr_bool, 20)
+    toolbox.register("population", tools.init_repeat, list, toolbox.individual)
+    toolbox.register("mate", tools.cx_two_point)
+    toolbox.register("mutate", tools.mut_flip_bit, mut_prob=0.05)
+    toolbox.register("select", tools.sel_best)
+    toolbox.register("evaluate", evaluate)
+
+    for algorithm in [tools.ea_mu_comma_lambda, tools.ea_mu_plus_lambda]:
+        pop = toolbox.population(size=20)
+        tools.evaluate_invalids(toolbox, pop)
+        with ThreadPoolExecutor(4) as executor:
+            pipeline = tools.Pipeline(executor, quorum=0.5)
+            stats = tools.MultiStatistics(pipeline=pipeline)
+            _, log = algorithm(
+                toolbox, pop, 10, offsprings=40, survivors=20, cx_prob=0.5,
+                mut_prob=0.5, stats=stats, pipeline=pipeline
+            )
+        assert len(pop) == 20
+        assert all(ind.fitness.values == (sum(ind),) for ind in pop)
+        assert pipeline.late > 0 and not pipeline.pending
+        assert log.chapters['pipeline'].select('late')[-1] == pipeline.late
+        assert sum(log.select('nevals')) <= len(calls) - 20
+        calls.clear()
+
+    with pytest.raises(ValueError):
+        tools.ea_mu_comma_lambda(
+            toolbox, pop, 1, 40, 20, 0.5, 0.5, dedup='evaluate',
+            pipeline=tools.Pipeline(None)
+        )
+
+    release = threading.Event()
+
+    def blocking_evaluate(ind):
+        calls.append(1)
+        if len(calls) > 30:
+            release.wait()
+        return sum(ind),
+
+    toolbox.register("evaluate", blocking_evaluate)
+    for iterator in [tools.iter_ea_mu_comma_lambda, tools.iter_ea_mu_plus_lambda]:
+        calls.clear()
+        release.clear()
+        with ThreadPoolExecutor(4) as executor:
+            pipeline = tools.Pipeline(executor, quorum=0.5)
+            states = iterator(
+                toolbox, pop, 10, offsprings=40, survivors=20,
+                cx_prob=1.0, mut_prob=0.0, pipeline=pipeline
+            )
+            try:
+                next(states)
+                assert pipeline.pending
+                states.close()
+                assert not pipeline.pending
+            finally:
+                release.set()
+
+    teardown_func()
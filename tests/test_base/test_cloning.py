@@ -0,0 +1,52 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.base import Fitness, Toolbox, clone
+from deap_er import creator
+import numpy
+import array
+
+
+creator.create("FitnessClone", Fitness, weights=(1.0,))
+creator.create("ListClone", list, fitness=creator.FitnessClone, speed=list)
+creator.create("ArrayClone", array.array, typecode='d', fitness=creator.FitnessClone)
+creator.create("NumpyClone", numpy.ndarray, fitness=creator.FitnessClone)
+
+
+# ====================================================================================== #
+class TestCloning:
+
+    def test_specialized_clone(self):
+        assert Toolbox().clone.func is clone
+
+        for cls in (creator.ListClone, creator.ArrayClone, creator.NumpyClone):
+            assert hasattr(cls, '__copy_individual__')
+            ind = cls([1.0, 2.0, 3.0])
+            ind.fitness.values = (6.0,)
+            ind.extra = {'parents': [1, 2]}
+            copy = clone(ind)
+            assert type(copy) is cls
+            assert list(copy) == list(ind)
+            assert copy.fitness.values == (6.0,)
+            assert copy.fitness is not ind.fitness
+            assert copy.extra == ind.extra and copy.extra is not ind.extra
+            copy[0] = 10.0
+            del copy.fitness.values
+            assert ind[0] == 1.0 and ind.fitness.is_valid()
+
+    # -------------------------------------------------------------------------------------- #
+    def test_fallback_clone(self):
+        ind = creator.ListClone([[1.0], [2.0]])
+        ind.speed.append(1.0)
+        copy = clone(ind)
+        copy[0].append(3.0)
+        copy.speed.append(2.0)
+        assert ind == [[1.0], [2.0]] and ind.speed == [1.0]
+        assert clone({'a': [1]}) == {'a': [1]}
@@ -0,0 +1,105 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.worker import run_worker, parse_address
+from deap_er import base
+from functools import partial
+import multiprocessing
+import threading
+import pytest
+import os
+
+
+AUTHKEY = b'deap_er_test'
+
+
+# ====================================================================================== #
+def square(x):
+    return x * x
+
+
+def fail(x):
+    raise ValueError(f'bad item {x}')
+
+
+def crash_once(marker, x):
+    if x == 7 and not os.path.exists(marker):
+        open(marker, 'w').close()
+        os._exit(1)
+    return x * x
+
+
+def unloadable():
+    raise ImportError('the module is not available on the worker host')
+
+
+class Unloadable:
+    def __call__(self, x):
+        return x
+
+    def __reduce__(self):
+        return unloadable, ()
+
+
+def start_workers(address, count):
+    workers = [
+        multiprocessing.Process(target=run_worker, args=(address, AUTHKEY, 0.1, 50))
+        for _ in range(count)
+    ]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+# ====================================================================================== #
+class TestDistributedMap:
+
+    def test_map(self):
+        with base.DistributedMap(('localhost', 0), AUTHKEY, batch_size=3) as dmap:
+            workers = start_workers(dmap.address, 2)
+            assert dmap(square, range(20)) == [x * x for x in range(20)]
+            assert dmap(lambda x: x + 1, [1, 2]) == [2, 3]
+            assert dmap(square, []) == []
+            with pytest.raises(RuntimeError):
+                dmap(fail, range(5))
+        for worker in workers:
+            worker.join(timeout=10)
+            assert worker.exitcode == 0
+
+    def test_unloadable_payload(self):
+        with base.DistributedMap(('localhost', 0), AUTHKEY, batch_size=3) as dmap:
+            workers = start_workers(dmap.address, 1)
+            with pytest.raises(RuntimeError, match='ImportError'):
+                dmap(Unloadable(), range(5))
+            assert dmap(square, range(5)) == [x * x for x in range(5)]
+        for worker in workers:
+            worker.join(timeout=10)
+            assert worker.exitcode == 0
+
+    def test_reassign_and_late_join(self, tmp_path):
+        marker = str(tmp_path / 'crashed')
+        with base.DistributedMap(('localhost', 0), AUTHKEY, batch_size=2) as dmap:
+            results = []
+            caller = threading.Thread(
+                target=lambda: results.extend(dmap(partial(crash_once, marker), range(20)))
+            )
+            caller.start()
+            workers = start_workers(dmap.address, 1)
+            workers += start_workers(dmap.address, 1)
+            caller.join(timeout=30)
+            assert results == [x * x for x in range(20)]
+            assert os.path.exists(marker)
+        for worker in workers:
+            worker.join(timeout=10)
+
+    def test_parse_address(self):
+        assert parse_address('127.0.0.1:5000') == ('127.0.0.1', 5000)
+        assert parse_address(':5000') == ('localhost', 5000)
+        assert parse_address('/tmp/deap.sock') == '/tmp/deap.sock'
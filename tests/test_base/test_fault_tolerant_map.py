@@ -0,0 +1,60 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er import base
+from functools import partial
+import pytest
+import time
+import os
+
+
+# ====================================================================================== #
+def evaluate(marker, x):
+    if x == 3:
+        time.sleep(60)
+    elif x == 5:
+        raise ValueError('bad item')
+    elif x == 7:
+        os._exit(1)
+    elif x == 9 and not os.path.exists(marker):
+        open(marker, 'w').close()
+        raise ValueError('flaky item')
+    return x * x,
+
+
+def worker_pid(_):
+    return os.getpid()
+
+
+# ====================================================================================== #
+class TestFaultTolerantMap:
+
+    def test_failures(self, tmp_path):
+        func = partial(evaluate, str(tmp_path / 'flaky'))
+        with base.FaultTolerantMap(processes=3, timeout=1.0,
+                                   retries=1, penalty=(1e9,)) as ftm:
+            results = ftm(func, range(12))
+            expected = [(1e9,) if x in (3, 5, 7) else (x * x,) for x in range(12)]
+            assert results == expected
+            assert ftm.compile() == dict(timeouts=2, errors=5, retries=4, penalties=3)
+            assert ftm(func, []) == []
+
+    def test_no_penalty(self, tmp_path):
+        func = partial(evaluate, str(tmp_path / 'flaky'))
+        with base.FaultTolerantMap(processes=2) as ftm:
+            with pytest.raises(RuntimeError):
+                ftm(func, [1, 2, 5, 4])
+            assert ftm(func, [1, 2]) == [(1,), (4,)]
+
+    def test_recycling(self):
+        with base.FaultTolerantMap(processes=1, max_tasks=2) as ftm:
+            pids = ftm(worker_pid, range(6))
+        assert len(set(pids)) == 3
+        assert pids[0] == pids[1] != pids[2]
@@ -8,8 +8,13 @@
 #   
 #   SPDX-License-Identifier: MIT
 #
-from deap_er.base.fitness import Fitness
+from deap_er.base.fitness import Fitness, SlottedFitness
+from deap_er import creator
+from deap_er import tools
 from copy import deepcopy
+import random
+import numpy
+import pickle
 import pytest
 
 
@@ -84,3 +89,49 @@ class TestFitness:
         assert hash(ft1) != hash(ft2)
         assert ft1.__str__() == '(2.0, 2.0, 2.0)'
         assert ft1 == deepcopy(ft1)
+
+
+# ====================================================================================== #
+class TestSlottedFitness:
+
+    def test_cached_values(self):
+        creator.create("FitnessSlotted", SlottedFitness, weights=(1.0, -1.0))
+        creator.create("FitnessRef", Fitness, weights=(1.0, -1.0))
+        ft, ref = creator.FitnessSlotted((1.0, 2.0)), creator.FitnessRef((1.0, 2.0))
+        assert not hasattr(ft, '__dict__')
+        assert ft.values == ref.values and ft.wvalues == ref.wvalues
+        assert ft.is_valid() and str(ft) == str(ref)
+
+        other = creator.FitnessSlotted((0.0, 3.0))
+        assert ft.dominates(other) and ft > other and ft != other
+        other.wvalues = ft.wvalues
+        assert other.values == (1.0, 2.0) and other == ft
+
+        del ft.values
+        assert not ft.is_valid() and ft.values == tuple()
+        for clone in (deepcopy(other), pickle.loads(pickle.dumps(other))):
+            assert clone.values == other.values and clone.wvalues == other.wvalues
+
+    # -------------------------------------------------------------------------------------- #
+    def test_values_match_fitness(self):
+        creator.create("FitnessSlottedW", SlottedFitness, weights=(2.0, -0.5))
+        creator.create("FitnessRefW", Fitness, weights=(2.0, -0.5))
+        for values in [(1, 2), numpy.array([0.1, 3.0]), numpy.array([1, 2])]:
+            ft, ref = creator.FitnessSlottedW(), creator.FitnessRefW()
+            ft.values, ref.values = values, values
+            assert ft.values == ref.values and ft.wvalues == ref.wvalues
+            assert [type(v) for v in ft.values] == [type(v) for v in ref.values]
+            assert [type(v) for v in ft.wvalues] == [type(v) for v in ref.wvalues]
+
+    # -------------------------------------------------------------------------------------- #
+    def test_multi_objective_selection(self):
+        creator.create("FitnessSlottedMO", SlottedFitness, weights=(1.0, -1.0))
+        creator.create("IndividualSlottedMO", list, fitness=creator.FitnessSlottedMO)
+        population = [creator.IndividualSlottedMO([random.random()]) for _ in range(40)]
+        for ind in population:
+            ind.fitness.values = (random.random(), random.random())
+
+        chosen = tools.sel_nsga_2(population, 20)
+        assert len(chosen) == 20
+        assert all(hasattr(ind.fitness, 'crowding_dist') for ind in chosen)
+        assert len(tools.sel_tournament_dcd(chosen, 20)) == 20
@@ -0,0 +1,100 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.base import Toolbox, Fitness, PopulationMatrix
+from deap_er import creator
+from deap_er import tools
+import pickle
+import numpy
+import copy
+
+
+# ====================================================================================== #
+def evaluate_batch(individuals):
+    genomes = numpy.asarray(individuals)
+    return numpy.stack([genomes.sum(axis=1), genomes.max(axis=1)], axis=1)
+
+
+# ====================================================================================== #
+class TestPopulationMatrix:
+
+    def test_row_views(self):
+        matrix = PopulationMatrix(numpy.random.rand(20, 5), (-1.0, 1.0))
+        toolbox = Toolbox()
+        toolbox.register('evaluate_batch', evaluate_batch)
+        assert tools.evaluate_invalids(toolbox, matrix) == 20
+        assert matrix.valid.all()
+
+        row = matrix[3]
+        assert row.fitness.values == tuple(evaluate_batch(matrix.genomes[3:4])[0])
+        clone = copy.deepcopy(row)
+        row[0] = 10.0
+        assert matrix.genomes[3, 0] == 10.0
+        assert clone[0] != 10.0
+        del row.fitness.values
+        assert not matrix.valid[3]
+        assert clone.fitness.is_valid()
+
+        restored = pickle.loads(pickle.dumps(clone))
+        assert numpy.array_equal(restored, clone)
+        assert restored.fitness.wvalues == clone.fitness.wvalues
+
+        tools.cx_two_point(matrix[0], matrix[1])
+        tools.mut_gaussian(matrix[2], 0.0, 1.0, 1.0)
+        matrix.invalidate([0, 1, 2])
+        toolbox = Toolbox()
+        toolbox.register('evaluate', lambda ind: tuple(evaluate_batch([ind])[0]))
+        assert tools.evaluate_invalids(toolbox, matrix) == 4
+        assert numpy.allclose(matrix.values, evaluate_batch(matrix.genomes))
+
+    def test_fast_paths(self):
+        creator.create("FitnessPM", Fitness, weights=(1.0, -1.0))
+        creator.create("IndividualPM", list, fitness=creator.FitnessPM)
+        individuals = [creator.IndividualPM(numpy.random.rand(4).tolist()) for _ in range(30)]
+        for ind in individuals:
+            ind.fitness.values = (round(sum(ind), 1), max(ind))
+        matrix = PopulationMatrix.from_individuals(individuals)
+
+        best = tools.sel_best(matrix, 5)
+        expected = tools.sel_best(individuals, 5)
+        assert [r.fitness.wvalues for r in best] == [i.fitness.wvalues for i in expected]
+        worst = tools.sel_worst(matrix, 5)
+        expected = tools.sel_worst(individuals, 5)
+        assert [r.fitness.wvalues for r in worst] == [i.fitness.wvalues for i in expected]
+
+        chosen = tools.sel_tournament(matrix, 50, 3)
+        assert isinstance(chosen, PopulationMatrix) and len(chosen) == 50
+        assert numpy.mean(chosen.values[:, 0]) >= numpy.mean(matrix.values[:, 0])
+
+        stats = tools.Statistics()
+        stats.register('max', numpy.max, axis=0)
+        assert numpy.array_equal(stats.compile(matrix.values)['max'], matrix.values.max(axis=0))
+
+        matrix.sort()
+        assert numpy.array_equal(matrix.rank(), numpy.arange(len(matrix)))
+        converted = matrix.to_individuals(creator.IndividualPM)
+        assert [i.fitness.wvalues for i in converted] == [r.fitness.wvalues for r in matrix]
+
+    def test_sort_keeps_views(self):
+        matrix = PopulationMatrix([[1, 1], [3, 3], [2, 2]], (1.0,), values=[[1], [3], [2]])
+        genomes = matrix.genomes
+        first = matrix[0]
+        matrix.sort()
+        assert matrix.genomes is genomes
+        assert first.tolist() == [3, 3] and first.fitness.values == (3.0,)
+        first[:] = 5
+        assert matrix.genomes[0].tolist() == [5, 5]
+
+    def test_derive(self):
+        matrix = PopulationMatrix(numpy.zeros((4, 2)), (1.0,), values=[[1], [2], [3], [4]])
+        offspring = matrix.derive(numpy.ones((3, 2)), [2, -1, 0])
+        assert numpy.array_equal(offspring.valid, [True, False, True])
+        assert offspring[0].fitness.values == (3.0,)
+        assert len(matrix + offspring) == 7
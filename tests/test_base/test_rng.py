@@ -0,0 +1,62 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.base import RandomStream
+import multiprocessing
+import random
+import pickle
+import numpy
+
+
+# ====================================================================================== #
+def draw(_=None):
+    return random.random(), float(numpy.random.random())
+
+
+# ====================================================================================== #
+class TestRandomStream:
+
+    def test_streams(self):
+        random_state = random.getstate()
+        numpy_state = numpy.random.get_state()[1].copy()
+
+        values = []
+        for stream in RandomStream(42).spawn(3):
+            with stream:
+                values.append(draw())
+        assert len(set(values)) == 3
+        assert random.getstate() == random_state
+        assert numpy.array_equal(numpy.random.get_state()[1], numpy_state)
+
+        again = []
+        for stream in RandomStream(42).spawn(3):
+            with stream:
+                again.append(draw())
+        assert again == values
+
+    def test_resume(self):
+        stream = RandomStream(7)
+        with stream:
+            draw()
+            data = pickle.dumps(stream)
+            expected = [draw() for _ in range(3)]
+        with pickle.loads(data):
+            assert [draw() for _ in range(3)] == expected
+        with RandomStream(7) as fresh:
+            assert [draw() for _ in range(4)][1:] == expected
+        assert fresh.generator.random() == RandomStream(7).generator.random()
+
+    def test_map_decorator(self):
+        serial = RandomStream(3).map_decorator(map)
+        with multiprocessing.Pool(2) as pool:
+            parallel = RandomStream(3).map_decorator(pool.map)
+            assert parallel(draw, range(10)) == serial(draw, range(10))
+            assert parallel(draw, range(10)) == serial(draw, range(10))
+        assert len(set(serial(draw, range(10)))) == 10
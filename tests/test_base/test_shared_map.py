@@ -0,0 +1,44 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.base.shared_map import SharedMemoryMap
+from deap_er.base.fitness import Fitness
+from deap_er import tools
+import random
+
+
+# ====================================================================================== #
+class TestSharedMemoryMap:
+
+    def test_map_results(self):
+        class _Fitness(Fitness):
+            weights = (-1.0,)
+
+        class _Individual(list):
+            def __init__(self, seq):
+                super().__init__(seq)
+                self.fitness = _Fitness()
+
+        pop = [_Individual(random.random() for _ in range(10)) for _ in range(25)]
+        with SharedMemoryMap(processes=2) as smm:
+            fitness = smm(tools.bm_sphere, pop)
+            assert smm(tools.bm_sphere, []) == []
+
+        assert len(fitness) == len(pop)
+        for ind, fit in zip(pop, fitness):
+            assert isinstance(fit, tuple)
+            assert abs(fit[0] - sum(x * x for x in ind)) < 1e-12
+
+    # -------------------------------------------------------------------------------------- #
+    def test_map_without_fitness(self):
+        data = [[float(i)] * 3 for i in range(7)]
+        with SharedMemoryMap(processes=2, chunksize=2) as smm:
+            results = smm(sum, data)
+        assert results == [(3.0 * i,) for i in range(7)]
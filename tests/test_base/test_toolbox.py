@@ -9,8 +9,10 @@
 #   SPDX-License-Identifier: MIT
 #
 from deap_er.base.toolbox import Toolbox
+from deap_er.base.cloning import clone
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from copy import deepcopy
+import pytest
 
 
 # ====================================================================================== #
@@ -19,7 +21,7 @@ class TestToolbox:
     def test_clone_func(self):
         tb = Toolbox()
         assert isinstance(tb.clone, partial)
-        assert tb.clone.func == deepcopy
+        assert tb.clone.func == clone
 
     # -------------------------------------------------------------------------------------- #
     def test_map_func(self):
@@ -53,3 +55,30 @@ class TestToolbox:
         tb.register('__test__', str, 1)
         tb.decorate('__test__', test_deco)
         assert tb.__test__() == '111'
+
+    # -------------------------------------------------------------------------------------- #
+    def test_profile(self):
+        tb = Toolbox(profile=True)
+        tb.register('__test__', str, 1)
+        for _ in range(3):
+            tb.__test__()
+        tb.decorate('__test__', lambda func: func)
+        tb.__test__()
+        tb.clone([1, 2])
+
+        report = tb.profile_report(reset=True)
+        assert report['__test__']['calls'] == 4
+        assert report['clone']['calls'] == 1
+        assert report['map']['calls'] == 0
+        assert report['__test__']['time'] > 0
+        assert tb.profile_report()['__test__']['calls'] == 0
+
+        tb.register('absolute', abs)
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(tb.absolute, range(1000)))
+        assert tb.profile_report()['absolute']['calls'] == 1000
+
+        tb.unregister('__test__')
+        assert '__test__' not in tb.profile_report()
+        with pytest.raises(RuntimeError):
+            Toolbox().profile_report()
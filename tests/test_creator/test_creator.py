@@ -10,7 +10,11 @@
 #
 from deap_er.creator import overrides
 from deap_er.creator import creator
+from deap_er.records import History
+from deap_er.base import clone
+from copy import deepcopy
 import pytest
+import pickle
 import numpy
 import array
 
@@ -172,3 +176,54 @@ class TestCreatorBuiltinsArray:
         assert a == ta
         assert b == tb
         creator.__dict__.pop(CNAME)
+
+
+# ====================================================================================== #
+class TestCreatorSlots:
+
+    @pytest.mark.parametrize("base, kwargs", [
+        (list, dict()),
+        (array.array, dict(typecode='d')),
+        (numpy.ndarray, dict())
+    ])
+    def test_slotted_individual(self, base, kwargs):
+        creator.create(CNAME, base, slots=True, speed=list, **kwargs)
+        obj = creator.__dict__[CNAME]([1.0, 2.0, 3.0])
+        obj.speed.append(1.0)
+        assert not hasattr(obj, '__dict__')
+        with pytest.raises(AttributeError):
+            obj.other = 1
+
+        for copy in [pickle.loads(pickle.dumps(obj)), deepcopy(obj)]:
+            assert type(copy) is type(obj)
+            assert list(copy) == [1.0, 2.0, 3.0]
+            assert copy.speed == [1.0] and copy.speed is not obj.speed
+        creator.__dict__.pop(CNAME)
+
+    # -------------------------------------------------------- #
+    @pytest.mark.parametrize("base, kwargs", [
+        (list, dict()),
+        (array.array, dict(typecode='d')),
+        (numpy.ndarray, dict())
+    ])
+    def test_slotted_history(self, base, kwargs):
+        creator.create(CNAME, base, slots=True, **kwargs)
+        obj = creator.__dict__[CNAME]([1.0, 2.0, 3.0])
+        for copy in [pickle.loads(pickle.dumps(obj)), clone(obj)]:
+            assert not hasattr(copy, 'history_index')
+
+        history = History()
+        history.update([obj])
+        child = clone(obj)
+        history.update([child])
+        assert child.history_index == 2
+        assert pickle.loads(pickle.dumps(child)).history_index == 2
+        assert history.get_genealogy(child) == {2: (1,), 1: ()}
+        creator.__dict__.pop(CNAME)
+
+    # -------------------------------------------------------- #
+    def test_slots_not_supported(self):
+        with pytest.warns(RuntimeWarning):
+            creator.create(CNAME, int, slots=True)
+        assert hasattr(creator.__dict__[CNAME](), '__dict__')
+        creator.__dict__.pop(CNAME)
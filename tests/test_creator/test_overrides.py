@@ -51,6 +51,19 @@ class TestNumpyOverrideClass:
         assert isinstance(args, tuple)
         assert isinstance(state, dict)
 
+    # -------------------------------------------------------- #
+    def test_numpy_override_out_of_band(self):
+        obj = ovr._NumpyOverride([x / 3 for x in range(0, 1000)])
+        obj.tag = 'tag'
+        buffers = []
+        jar = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1 and len(jar) < obj.nbytes
+        for bufs in [buffers, [bytes(buf.raw()) for buf in buffers]]:
+            copy = pickle.loads(jar, buffers=bufs)
+            assert numpy.array_equal(obj, copy)
+            assert copy.flags.writeable
+            assert obj.__dict__ == copy.__dict__
+
 
 # ====================================================================================== #
 class TestArrayOverrideClass:
@@ -88,3 +101,17 @@ class TestArrayOverrideClass:
         assert cls == ovr._ArrayOverride
         assert isinstance(args, tuple)
         assert isinstance(state, dict)
+
+    # -------------------------------------------------------- #
+    def test_array_override_out_of_band(self):
+        obj = ovr._ArrayOverride([x for x in range(0, 10)])
+        obj.tag = 'tag'
+        buffers = []
+        jar = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+        for protocol in range(2, 6):
+            copy = pickle.loads(pickle.dumps(obj, protocol=protocol))
+            assert obj == copy
+            assert obj.__dict__ == copy.__dict__
+        copy = pickle.loads(jar, buffers=buffers)
+        assert obj == copy
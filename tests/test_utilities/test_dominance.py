@@ -0,0 +1,76 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.utilities.sorting import dominance as dom
+from deap_er.base import Fitness
+from deap_er import creator
+from deap_er import tools
+import random
+import numpy
+
+
+# ====================================================================================== #
+class TestDominance:
+
+    def test_dominance_matrix(self):
+        creator.create("FitnessDom", Fitness, weights=(-1.0, 1.0, 1.0))
+        fits = [creator.FitnessDom([random.randint(0, 3) for _ in range(3)]) for _ in range(50)]
+        expected = [[a.dominates(b) for b in fits] for a in fits]
+        for chunk_size in (None, 1, 7):
+            matrix = dom.dominance_matrix(fits, chunk_size=chunk_size)
+            assert matrix.tolist() == expected
+
+        counts = dom.dominated_counts(matrix)
+        dominators = dom.dominator_lists(matrix)
+        for j, fit in enumerate(fits):
+            assert counts[j] == sum(row[j] for row in expected)
+            assert dominators[j].tolist() == [i for i in range(50) if expected[i][j]]
+
+    # -------------------------------------------------------------------------------------- #
+    def test_invalid_fitness(self):
+        creator.create("FitnessDomInv", Fitness, weights=(1.0, 1.0))
+        creator.create("IndividualDomInv", list, fitness=creator.FitnessDomInv)
+        population = [creator.IndividualDomInv([i]) for i in range(6)]
+        for ind in population[:4]:
+            ind.fitness.values = (random.randint(0, 3), random.randint(0, 3))
+
+        fits = [ind.fitness for ind in population]
+        expected = [[a.dominates(b) for b in fits] for a in fits]
+        assert dom.dominance_matrix(population).tolist() == expected
+        assert numpy.isnan(dom.weighted_values(population)[4:]).all()
+        assert dom.weighted_values(population[4:]).shape == (2, 2)
+
+        fronts = tools.sort_non_dominated(population, len(population))
+        assert sum(len(front) for front in fronts) == len(population)
+        assert population[4] in fronts[0] and population[5] in fronts[0]
+        front = tools.ParetoFront()
+        front.update(population[4:])
+        front.update(population)
+        valid = population[:4]
+        best = [a for a in valid if not any(b.fitness.dominates(a.fitness) for b in valid)]
+        assert sorted(ind for ind in front if ind.fitness.is_valid()) == sorted(best)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_pareto_front(self):
+        creator.create("FitnessDomPF", Fitness, weights=(1.0, 1.0))
+        creator.create("IndividualDomPF", list, fitness=creator.FitnessDomPF)
+        front = tools.ParetoFront()
+        for _ in range(3):
+            population = [creator.IndividualDomPF([random.randint(0, 2)]) for _ in range(40)]
+            for ind in population:
+                ind.fitness.values = (random.randint(0, 5), random.randint(0, 5))
+            front.update(population)
+
+        assert not dom.dominance_matrix(front.items).any()
+        keys = [(ind.fitness.wvalues, tuple(ind)) for ind in front]
+        assert len(keys) == len(set(keys))
+        assert [ind.fitness for ind in front] == sorted(front.keys, reverse=True)
+        fronts = tools.sort_non_dominated(population + front.items, len(population), ffo=True)
+        assert set(ind.fitness.wvalues for ind in fronts[0]) <= set(fit.wvalues for fit in front.keys)
@@ -0,0 +1,88 @@
+#
+#   MIT License
+#   
+#   Copyright (c) 2022, Mattias Aabmets
+#   
+#   The contents of this file are subject to the terms and conditions defined in the License.
+#   You may not use, modify, or distribute this file except in compliance with the License.
+#   
+#   SPDX-License-Identifier: MIT
+#
+from deap_er.utilities.fitness_cache import FitnessCache, genome_key
+from deap_er.records import Logbook, MultiStatistics, Statistics
+from deap_er.base import Toolbox
+import array
+import numpy
+
+
+# ====================================================================================== #
+def evaluate(individual) -> tuple:
+    return sum(individual),
+
+
+# ====================================================================================== #
+class TestFitnessCache:
+
+    def test_genome_key(self):
+        assert genome_key([1, 2, 3]) == genome_key([1, 2, 3])
+        assert genome_key([1, 2, 3]) != genome_key([3, 2, 1])
+        arr = array.array('d', [1.0, 2.0])
+        assert genome_key(arr) == genome_key(array.array('d', [1.0, 2.0]))
+        assert genome_key(arr) != genome_key(array.array('f', [1.0, 2.0]))
+        ndarr = numpy.array([1.0, 2.0])
+        assert genome_key(ndarr) == genome_key(ndarr.copy())
+        assert genome_key(ndarr) != genome_key(ndarr.reshape(2, 1))
+
+    # -------------------------------------------------------------------------------------- #
+    def test_evaluate_decorator(self):
+        cache = FitnessCache(maxsize=2)
+        tb = Toolbox()
+        tb.register('evaluate', evaluate)
+        tb.decorate('evaluate', cache)
+
+        assert tb.evaluate([1, 2]) == (3,)
+        assert tb.evaluate([1, 2]) == (3,)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        tb.evaluate([2, 2])
+        tb.evaluate([3, 2])
+        assert len(cache.cache) == 2
+        assert genome_key([1, 2]) not in cache.cache
+
+        cache.clear()
+        assert cache.compile() == dict(hits=0, misses=0, size=0)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_map_decorator(self):
+        calls = []
+
+        def _map(func, individuals):
+            calls.append(len(individuals))
+            return list(map(func, individuals))
+
+        cache = FitnessCache()
+        tb = Toolbox()
+        tb.register('map', _map)
+        tb.decorate('map', cache.map_decorator)
+
+        pop = [[1, 2], [2, 2], [1, 2]]
+        assert tb.map(evaluate, pop) == [(3,), (4,), (3,)]
+        assert tb.map(evaluate, pop + [[5, 5]]) == [(3,), (4,), (3,), (10,)]
+        assert calls == [2, 1]
+        assert (cache.hits, cache.misses) == (4, 3)
+
+        assert tb.map(len, pop) == [2, 2, 2]
+        assert tb.map(evaluate, pop) == [(3,), (4,), (3,)]
+        assert calls == [2, 1, 2, 0]
+
+    # -------------------------------------------------------------------------------------- #
+    def test_logbook_chapter(self):
+        cache = FitnessCache()
+        stats = Statistics(key=len)
+        stats.register('max', max)
+        mstats = MultiStatistics(size=stats, cache=cache)
+
+        logbook = Logbook()
+        logbook.record(gen=0, **mstats.compile([[1], [1, 2]]))
+        assert logbook.chapters['cache'].select('misses') == [0]
+        assert logbook.chapters['size'].select('max') == [2]